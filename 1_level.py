@@ -1,20 +1,31 @@
 import arcade
 import random
+from animation_timeline import AnimationTimeline
+from board_shapes import build_board_shapes, build_highlight
 from database import db
+from idle_throttle import IdleThrottle
+from level_config import LEVELS, START_MOVES
+from match_engine import BitBoard
+from profiler import profiled
+from tile_animator import TileAnimator
+from tile_pool import TilePool
+from textures import TILE_TYPES, arrow_textures, load_textures, tile_textures
+from ui_batch import UIBatch
 
 # Параметры экрана
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
 SCREEN_TITLE = "Puzzle Slider - Level 1"
 
-GRID_ROWS = 3
-GRID_COLS = 3
-TILE_SIZE = 130
+LEVEL = LEVELS[1]
+GRID_ROWS = LEVEL["rows"]
+GRID_COLS = LEVEL["cols"]
+TILE_SIZE = LEVEL["tile_size"]
 GRID_X = (SCREEN_WIDTH - GRID_COLS * TILE_SIZE) // 2
 GRID_Y = (SCREEN_HEIGHT - GRID_ROWS * TILE_SIZE) // 2
-START_MOVES = 10
-
-TILE_TYPES = ["red", "blue", "green", "yellow", "purple"]
+# Минимальная длина ряда и очки за ряд каждой длины
+MIN_MATCH_LENGTH = LEVEL["min_match_length"]
+MATCH_POINTS = LEVEL["match_points"]
 
 
 class Tile(arcade.Sprite):
@@ -22,9 +33,7 @@ class Tile(arcade.Sprite):
         self.tile_type = tile_type
         self.row = row
         self.col = col
-        image_name = TILE_TYPES[tile_type]
-        image_path = f"resources/sprites/tiles/{image_name}.png"
-        super().__init__(image_path)
+        super().__init__(texture=tile_textures[tile_type])
         self.scale = TILE_SIZE // 55
 
         # Анимационные параметры
@@ -42,12 +51,22 @@ class Tile(arcade.Sprite):
         self.target_x = self.center_x
         self.target_y = self.center_y
 
+    def reset(self, tile_type, row, col):
+        # Повторное использование плитки из пула: новый цвет, клетка и сброс анимаций
+        self.tile_type = tile_type
+        self.row = row
+        self.col = col
+        self.texture = tile_textures[tile_type]
+        self.animating_move = False
+        self.animating_fade = False
+        self.alpha = 255
+        self.update_position()
+
 
 class Arrow(arcade.Sprite):
     def __init__(self, direction, x, y):
         self.direction = direction
-        image_path = f"resources/sprites/arrows/{direction}.png"
-        super().__init__(image_path)
+        super().__init__(texture=arrow_textures[direction])
         self.scale = 0.6
         self.center_x = x
         self.center_y = y
@@ -61,6 +80,7 @@ class GameView(arcade.View):
         self.player_name = "Player"
 
         self.grid = [[None for _ in range(GRID_COLS)] for _ in range(GRID_ROWS)]
+        self.board = BitBoard(GRID_ROWS, GRID_COLS, len(TILE_TYPES))
         self.selected_tile = None
         self.moves_left = START_MOVES
         self.moves_used = 0
@@ -70,12 +90,22 @@ class GameView(arcade.View):
         self.showing_high_scores = False
         self.result_saved = False
 
-        # Флаги для анимаций
-        self._waiting_to_fill = False
-        self._check_after_fill = False
+        # Собранный экран завершения и его текущая страница
+        self.overlay_ui = None
+        self.overlay_page = None
+
+        # Анимации плиток и очередь этапов каскада
+        self.animator = TileAnimator(move_speed=400, fade_speed=300)
+        self.timeline = AnimationTimeline(self.animator, self.release_faded)
+        self.idle_throttle = IdleThrottle()
 
+        load_textures()
         self.tile_list = arcade.SpriteList()
+        self.tile_pool = TilePool(Tile, self.tile_list)
         self.arrow_list = arcade.SpriteList()
+        self.board_shapes = None
+        self.selection_highlight = None
+        self.board_shapes_size = None
 
         self.score_text = None
         self.moves_text = None
@@ -91,7 +121,7 @@ class GameView(arcade.View):
         self.setup()
 
     def setup(self):
-        self.tile_list.clear()
+        self.tile_pool.release_all()
         self.arrow_list.clear()
         self.selected_tile = None
         self.moves_left = START_MOVES
@@ -101,8 +131,20 @@ class GameView(arcade.View):
         self.showing_stats = False
         self.showing_high_scores = False
         self.result_saved = False
-        self._waiting_to_fill = False
-        self._check_after_fill = False
+        if self.overlay_ui is not None:
+            self.overlay_ui.delete()
+        self.overlay_ui = None
+        self.overlay_page = None
+
+        self.timeline.clear()
+        self.animator.clear()
+        self.board = BitBoard(GRID_ROWS, GRID_COLS, len(TILE_TYPES))
+
+        # Геометрия поля пересобирается, только если поменялся его размер
+        if self.board_shapes_size != (GRID_ROWS, GRID_COLS):
+            self.board_shapes = build_board_shapes(GRID_X, GRID_Y, GRID_ROWS, GRID_COLS, TILE_SIZE)
+            self.selection_highlight = build_highlight(TILE_SIZE)
+            self.board_shapes_size = (GRID_ROWS, GRID_COLS)
 
         self.score_text = arcade.Text(
             f"Очки: {self.score}",
@@ -126,58 +168,41 @@ class GameView(arcade.View):
         for row in range(GRID_ROWS):
             for col in range(GRID_COLS):
                 tile_type = random.randint(0, len(TILE_TYPES) - 1)
-                tile = Tile(tile_type, row, col)
+                tile = self.tile_pool.acquire(tile_type, row, col)
                 self.grid[row][col] = tile
-                self.tile_list.append(tile)
+                self.board.set(row, col, tile_type)
 
         self.check_matches()
 
         if self.background_music and not self.music_player:
             self.music_player = arcade.play_sound(self.background_music, loop=True, volume=1.3)
 
+    @profiled("level.on_update")
     def on_update(self, delta_time: float):
-        move_speed = 400
-        fade_speed = 300
-
-        # Обновляем все плитки
-        for tile in list(self.tile_list):
-            if tile.animating_move:
-                dx = tile.target_x - tile.center_x
-                dy = tile.target_y - tile.center_y
-                dist = (dx*dx + dy*dy) ** 0.5
-
-                if dist < 1.0:
-                    tile.center_x = tile.target_x
-                    tile.center_y = tile.target_y
-                    tile.animating_move = False
-                else:
-                    step = move_speed * delta_time
-                    if step > dist:
-                        step = dist
-                    tile.center_x += dx / dist * step
-                    tile.center_y += dy / dist * step
-
-            if tile.animating_fade:
-                tile.alpha -= int(fade_speed * delta_time)
-                if tile.alpha <= 0:
-                    tile.alpha = 0
-                    tile.animating_fade = False
-                    if tile in self.tile_list:
-                        self.tile_list.remove(tile)
-                    # Удаляем из сетки
-                    for r in range(GRID_ROWS):
-                        for c in range(GRID_COLS):
-                            if self.grid[r][c] is tile:
-                                self.grid[r][c] = None
-                                break
-
-        fading_tiles = [t for t in self.tile_list if t.animating_fade]
-        if self._waiting_to_fill and not fading_tiles:
-            self._waiting_to_fill = False
-            self.fill_empty_spaces()
-            if self._check_after_fill:
-                self._check_after_fill = False
-                self.check_matches()
+        # Анимации и этапы каскада идут фиксированными шагами, а не по длине кадра
+        self.timeline.update(delta_time)
+
+        # Поле стоит и ничего не ждёт — окно переходит на редкие кадры
+        self.idle_throttle.update(self.timeline.busy)
+
+    def release_faded(self, tiles):
+        # Растворившиеся плитки возвращаются в пул. Плитка, которая ещё
+        # падала, сначала уходит из аниматора: иначе её слот с moving=True
+        # остался бы за ней, и после переиспользования move() не сбросил бы позицию.
+        for tile in tiles:
+            self.animator.remove(tile)
+            self.tile_pool.release(tile)
+            if self.selected_tile is tile:
+                self.selected_tile = None
+                self.arrow_list.clear()
+            # Плитка знает свою клетку, поэтому сетку обходить не нужно
+            if self.grid[tile.row][tile.col] is tile:
+                self.grid[tile.row][tile.col] = None
+                self.board.clear(tile.row, tile.col)
+
+    def on_hide_view(self):
+        # Следующий экран начинает с полной частоты кадров
+        self.idle_throttle.wake()
 
     def save_game_result(self):
         if self.result_saved:
@@ -187,17 +212,25 @@ class GameView(arcade.View):
         total_moves = START_MOVES
         moves_used = total_moves - self.moves_left
 
+        # Запись идёт в фоновом потоке, кадр не ждёт диска
         try:
-            game_id = db.save_game_result(
+            db.save_game_result_async(
                 player_name=self.player_name,
                 score=self.score,
                 moves_used=moves_used,
                 total_moves=total_moves,
                 level=self.level,
-                victory=victory
+                victory=victory,
+                callback=self._report_saved
             )
             self.result_saved = True
-            print(f"Результат сохранен (ID: {game_id})")
+        except Exception as e:
+            print(f"Ошибка при сохранении: {e}")
+
+    def _report_saved(self, future):
+        # Вызывается из потока записи, когда результат попал в базу
+        try:
+            print(f"Результат сохранен (ID: {future.result()})")
         except Exception as e:
             print(f"Ошибка при сохранении: {e}")
 
@@ -240,19 +273,20 @@ class GameView(arcade.View):
             arcade.stop_sound(self.music_player)
             self.music_player = None
 
+    @profiled("level.on_draw")
     def on_draw(self):
-        self.clear(arcade.color.GRAY)
+        # В простое неизменное поле перерисовывается реже
+        self.idle_throttle.draw(self.draw_scene, arcade.color.GRAY)
 
-        left = GRID_X - 5
-        right = GRID_X + GRID_COLS * TILE_SIZE + 5
-        bottom = GRID_Y - 5
-        top = GRID_Y + GRID_ROWS * TILE_SIZE + 5
-        arcade.draw_line(left, bottom, right, bottom, arcade.color.WHITE_SMOKE, 3)
-        arcade.draw_line(left, top, right, top, arcade.color.WHITE_SMOKE, 3)
-        arcade.draw_line(left, bottom, left, top, arcade.color.WHITE_SMOKE, 3)
-        arcade.draw_line(right, bottom, right, top, arcade.color.WHITE_SMOKE, 3)
+    def draw_scene(self):
+        # Рамка поля и подложки клеток — один готовый список фигур
+        self.board_shapes.draw()
 
         self.tile_list.draw()
+        if self.selected_tile is not None:
+            self.selection_highlight.center_x = self.selected_tile.center_x
+            self.selection_highlight.center_y = self.selected_tile.center_y
+            self.selection_highlight.draw()
         self.arrow_list.draw()
         self.draw_ui()
 
@@ -272,28 +306,45 @@ class GameView(arcade.View):
         self.level_text.draw()
 
     def draw_game_over_screen(self):
-        arcade.draw_lrbt_rectangle_filled(
-            0, SCREEN_WIDTH, 0, SCREEN_HEIGHT,
-            (0, 0, 0, 180)
-        )
-
+        # Отрисовка экрана завершения игры. Страница (загрузка, рекорды
+        # или статистика) собирается один раз при переключении на неё,
+        # дальше каждый кадр только рисуется готовый набор.
         if not self.showing_stats and not self.showing_high_scores:
+            # Сохраняем результат
             if not self.result_saved:
                 self.save_game_result()
-
-            loading_text = arcade.Text(
+            page = "loading"
+        elif self.showing_high_scores:
+            page = "high_scores"
+        else:
+            page = "stats"
+
+        if self.overlay_page != page:
+            self.build_game_over_screen(page)
+        self.overlay_ui.draw()
+
+    def build_game_over_screen(self, page):
+        # Затемнение поля и выбранная страница экрана завершения
+        if self.overlay_ui is not None:
+            self.overlay_ui.delete()
+        ui = UIBatch()
+        ui.add_rect(0, SCREEN_WIDTH, 0, SCREEN_HEIGHT, (0, 0, 0, 180))
+
+        if page == "loading":
+            # Временное сообщение
+            ui.add_text(
                 "Загрузка результатов...",
                 SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2,
                 arcade.color.WHITE, 28,
                 anchor_x="center", font_name="Arial"
             )
-            loading_text.draw()
-
-        elif self.showing_high_scores:
-            self.show_high_scores_screen()
+        elif page == "high_scores":
+            self.build_high_scores_screen(ui)
+        else:
+            self.build_statistics_screen(ui)
 
-        elif self.showing_stats:
-            self.show_statistics_screen()
+        self.overlay_ui = ui
+        self.overlay_page = page
 
     def _show_arrows(self):
         self.arrow_list.clear()
@@ -308,7 +359,16 @@ class GameView(arcade.View):
         for direction, (dx, dy) in offsets.items():
             self.arrow_list.append(Arrow(direction, cx + dx, cy + dy))
 
+    def tile_at(self, x, y):
+        # Плитка в клетке сетки под точкой (x, y) или None
+        col = int((x - GRID_X) // TILE_SIZE)
+        row = GRID_ROWS - 1 - int((y - GRID_Y) // TILE_SIZE)
+        if 0 <= row < GRID_ROWS and 0 <= col < GRID_COLS:
+            return self.grid[row][col]
+        return None
+
     def on_mouse_press(self, x, y, button, modifiers):
+        self.idle_throttle.wake()
         if self.game_over:
             return
 
@@ -319,11 +379,12 @@ class GameView(arcade.View):
                 self.arrow_list.clear()
                 return
 
-        for tile in self.tile_list:
-            if tile.collides_with_point((x, y)):
-                self.selected_tile = tile
-                self._show_arrows()
-                return
+        # Клетку под курсором находим по координатам, без обхода всех плиток
+        tile = self.tile_at(x, y)
+        if tile:
+            self.selected_tile = tile
+            self._show_arrows()
+            return
 
         if self.selected_tile:
             self.selected_tile = None
@@ -349,19 +410,20 @@ class GameView(arcade.View):
         other_tile = self.grid[new_row][new_col]
         self.grid[old_row][old_col] = other_tile
         self.grid[new_row][new_col] = self.selected_tile
+        self.board.swap(old_row, old_col, new_row, new_col)
 
         arcade.play_sound(self.sound_tile_move)
 
         if other_tile:
             other_tile.row, other_tile.col = old_row, old_col
-            other_tile.target_x = GRID_X + old_col * TILE_SIZE + TILE_SIZE // 2
-            other_tile.target_y = GRID_Y + (GRID_ROWS - 1 - old_row) * TILE_SIZE + TILE_SIZE // 2
-            other_tile.animating_move = True
+            self.animator.move(other_tile,
+                               GRID_X + old_col * TILE_SIZE + TILE_SIZE // 2,
+                               GRID_Y + (GRID_ROWS - 1 - old_row) * TILE_SIZE + TILE_SIZE // 2)
 
         self.selected_tile.row, self.selected_tile.col = new_row, new_col
-        self.selected_tile.target_x = GRID_X + new_col * TILE_SIZE + TILE_SIZE // 2
-        self.selected_tile.target_y = GRID_Y + (GRID_ROWS - 1 - new_row) * TILE_SIZE + TILE_SIZE // 2
-        self.selected_tile.animating_move = True
+        self.animator.move(self.selected_tile,
+                           GRID_X + new_col * TILE_SIZE + TILE_SIZE // 2,
+                           GRID_Y + (GRID_ROWS - 1 - new_row) * TILE_SIZE + TILE_SIZE // 2)
 
         self.check_matches()
 
@@ -369,39 +431,16 @@ class GameView(arcade.View):
             self.game_over = True
             self.show_game_over()
 
+    @profiled("level.check_matches")
     def check_matches(self):
-        matches = set()
-        points_to_add = 0
+        # Проверяем только строки и столбцы, затронутые ходом или падением плиток
+        matches, points_to_add, found = self.board.find_matches(MIN_MATCH_LENGTH, MATCH_POINTS, incremental=True)
 
-        # Проверяем тройки по горизонтали (30 очков)
-        for row in range(GRID_ROWS):
-            for col in range(GRID_COLS - 2):
-                tiles = [self.grid[row][col + i] for i in range(3)]
-                if all(tile is not None for tile in tiles):
-                    first_type = tiles[0].tile_type
-                    if all(tile.tile_type == first_type for tile in tiles):
-                        triple_positions = [(row, col + i) for i in range(3)]
-                        # Проверяем, что эти плитки не входят в четверки или пятерки
-                        if not any(pos in matches for pos in triple_positions):
-                            for pos in triple_positions:
-                                matches.add(pos)
-                            points_to_add += 30
-                            print(f"Найдена тройка в строке {row}, столбец {col}-{col + 2}")
-
-        # Проверяем тройки по вертикали (30 очков)
-        for col in range(GRID_COLS):
-            for row in range(GRID_ROWS - 2):
-                tiles = [self.grid[row + i][col] for i in range(3)]
-
-                if all(tile is not None for tile in tiles):
-                    first_type = tiles[0].tile_type
-                    if all(tile.tile_type == first_type for tile in tiles):
-                        triple_positions = [(row + i, col) for i in range(3)]
-                        if not any(pos in matches for pos in triple_positions):
-                            for pos in triple_positions:
-                                matches.add(pos)
-                            points_to_add += 30
-                            print(f"Найдена тройка в столбце {col}, строка {row}-{row + 2}")
+        for length, horizontal, row, col in found:
+            if horizontal:
+                print(f"Найден ряд из {length} в строке {row}, столбец {col}-{col + length - 1}")
+            else:
+                print(f"Найден ряд из {length} в столбце {col}, строка {row}-{row + length - 1}")
 
         if matches:
             self.score += points_to_add
@@ -416,14 +455,16 @@ class GameView(arcade.View):
         for row, col in positions:
             tile = self.grid[row][col]
             if tile and not tile.animating_fade:
-                tile.animating_fade = True
+                self.animator.fade(tile)
                 has_fading = True
 
         if has_fading:
             arcade.play_sound(self.sound_tile_match)
-            self._waiting_to_fill = True
-            self._check_after_fill = True
+            # Когда плитки растворятся — падение, когда упадут — новая проверка
+            self.timeline.then(("fall", self.fill_empty_spaces),
+                               ("recheck", self.check_matches))
 
+    @profiled("level.fill_empty_spaces")
     def fill_empty_spaces(self):
         for col in range(GRID_COLS):
             # Собираем непустые плитки снизу вверх
@@ -437,28 +478,30 @@ class GameView(arcade.View):
                 row = GRID_ROWS - 1 - i
                 tile.row = row
                 tile.col = col
-                tile.target_x = GRID_X + col * TILE_SIZE + TILE_SIZE // 2
-                tile.target_y = GRID_Y + (GRID_ROWS - 1 - row) * TILE_SIZE + TILE_SIZE // 2
-                tile.animating_move = True
+                self.animator.move(tile,
+                                   GRID_X + col * TILE_SIZE + TILE_SIZE // 2,
+                                   GRID_Y + (GRID_ROWS - 1 - row) * TILE_SIZE + TILE_SIZE // 2)
                 self.grid[row][col] = tile
+                self.board.set(row, col, tile.tile_type)
 
             # Создаём новые плитки сверху
             for i in range(len(column_tiles), GRID_ROWS):
                 row = GRID_ROWS - 1 - i
                 new_type = random.randint(0, len(TILE_TYPES) - 1)
-                new_tile = Tile(new_type, row, col)
+                new_tile = self.tile_pool.acquire(new_type, row, col)
                 # Позиция старта — сверху экрана
                 new_tile.center_x = GRID_X + col * TILE_SIZE + TILE_SIZE // 2
                 new_tile.center_y = SCREEN_HEIGHT + TILE_SIZE
-                new_tile.target_x = new_tile.center_x
-                new_tile.target_y = GRID_Y + (GRID_ROWS - 1 - row) * TILE_SIZE + TILE_SIZE // 2
-                new_tile.animating_move = True
+                self.animator.move(new_tile,
+                                   new_tile.center_x,
+                                   GRID_Y + (GRID_ROWS - 1 - row) * TILE_SIZE + TILE_SIZE // 2)
                 self.grid[row][col] = new_tile
-                self.tile_list.append(new_tile)
+                self.board.set(row, col, new_type)
 
                 arcade.play_sound(self.sound_tile_fall, volume=0.5)
 
     def on_key_press(self, key, modifiers):
+        self.idle_throttle.wake()
         if key == arcade.key.ESCAPE:
             if not self.game_over:
                 self.return_to_menu()
@@ -476,9 +519,193 @@ class GameView(arcade.View):
                 self.showing_stats = not self.showing_stats
                 self.showing_high_scores = False if self.showing_stats else self.showing_high_scores
 
+    def build_high_scores_screen(self, ui):
+        # Сборка таблицы лучших результатов
+        ui.add_rect(0, SCREEN_WIDTH, 0, SCREEN_HEIGHT, (0, 0, 0, 220))
+
+        ui.add_text(
+            "ЛУЧШИЕ РЕЗУЛЬТАТЫ",
+            SCREEN_WIDTH // 2, SCREEN_HEIGHT - 80,
+            arcade.color.GOLD, 36,
+            anchor_x="center", font_name="Arial"
+        )
+        ui.add_text(
+            f"Уровень {self.level}",
+            SCREEN_WIDTH // 2, SCREEN_HEIGHT - 120,
+            arcade.color.LIGHT_GRAY, 24,
+            anchor_x="center", font_name="Arial"
+        )
+
+        try:
+            top_scores = db.get_top_scores(level=self.level, limit=8)
+
+            if top_scores:
+                y = SCREEN_HEIGHT - 180
+
+                # Заголовки таблицы
+                headers = ["Место", "Игрок", "Очки", "Ходы"]
+                header_x = [100, 250, 450, 550]
+
+                for i, header in enumerate(headers):
+                    ui.add_text(
+                        header,
+                        header_x[i], y,
+                        arcade.color.CYAN, 20,
+                        anchor_x="left", font_name="Arial"
+                    )
+
+                y -= 40
+
+                # Данные
+                for rank, (player_name, score, moves_used, total_moves,
+                           game_date, level) in enumerate(top_scores, 1):
+
+                    row_data = [
+                        f"{rank}.",
+                        player_name[:12],
+                        str(score),
+                        f"{moves_used}/{total_moves}"
+                    ]
+
+                    for i, data in enumerate(row_data):
+                        color = arcade.color.WHITE
+                        if rank == 1:
+                            color = arcade.color.GOLD
+                        elif rank == 2:
+                            color = arcade.color.SILVER
+                        elif rank == 3:
+                            color = arcade.color.BRONZE
+
+                        ui.add_text(
+                            data,
+                            header_x[i], y,
+                            color, 18,
+                            anchor_x="left", font_name="Arial"
+                        )
+
+                    y -= 35
+
+                    # Дата игры
+                    if isinstance(game_date, str):
+                        date_str = game_date[:16]
+                    else:
+                        date_str = game_date.strftime("%Y-%m-%d %H:%M")
+
+                    ui.add_text(
+                        date_str,
+                        250, y,
+                        arcade.color.GRAY, 14,
+                        anchor_x="left", font_name="Arial"
+                    )
+
+                    y -= 25
+
+                    if y < 100:
+                        break
+            else:
+                ui.add_text(
+                    "Пока нет результатов для этого уровня",
+                    SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2,
+                    arcade.color.LIGHT_GRAY, 24,
+                    anchor_x="center", font_name="Arial"
+                )
+
+        except Exception as e:
+            ui.add_text(
+                f"Ошибка загрузки результатов: {str(e)[:50]}...",
+                SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2,
+                arcade.color.RED, 20,
+                anchor_x="center", font_name="Arial"
+            )
+
+        # Кнопка возврата
+        ui.add_text(
+            "Нажмите TAB для возврата",
+            SCREEN_WIDTH // 2, 50,
+            arcade.color.LIGHT_GRAY, 22,
+            anchor_x="center", font_name="Arial"
+        )
+
+    def build_statistics_screen(self, ui):
+        # Сборка экрана статистики
+        ui.add_rect(0, SCREEN_WIDTH, 0, SCREEN_HEIGHT, (0, 0, 0, 220))
+
+        ui.add_text(
+            "СТАТИСТИКА",
+            SCREEN_WIDTH // 2, SCREEN_HEIGHT - 80,
+            arcade.color.CYAN, 36,
+            anchor_x="center", font_name="Arial"
+        )
+
+        try:
+            # Статистика уровня
+            level_stats = db.get_level_stats(self.level)
+            if level_stats:
+                total_games, wins, avg_score, max_score, min_score, avg_efficiency = level_stats
+                win_rate = (wins / total_games * 100) if total_games > 0 else 0
+
+                y = SCREEN_HEIGHT - 140
+                stats_items = [
+                    (f"Статистика уровня {self.level}:", arcade.color.YELLOW),
+                    (f"Всего игр: {int(total_games)}", arcade.color.WHITE),
+                    (f"Побед: {int(wins)} ({win_rate:.1f}%)", arcade.color.GREEN),
+                    (f"Средний счет: {avg_score:.1f}" if avg_score else "Средний счет: 0", arcade.color.LIGHT_BLUE),
+                    (f"Лучший счет: {int(max_score) if max_score else 0}", arcade.color.GOLD),
+                ]
+
+                for text, color in stats_items:
+                    ui.add_text(
+                        text,
+                        SCREEN_WIDTH // 2, y,
+                        color, 24,
+                        anchor_x="center", font_name="Arial"
+                    )
+                    y -= 40
+
+            # Личная статистика
+            player_stats = db.get_player_stats(self.player_name)
+            if player_stats:
+                player_name, total_games, total_wins, total_score, best_score, last_played = player_stats
+                personal_win_rate = (total_wins / total_games * 100) if total_games > 0 else 0
+
+                y -= 40
+                personal_items = [
+                    (f"Ваша статистика ({self.player_name}):", arcade.color.YELLOW),
+                    (f"Игр сыграно: {total_games}", arcade.color.WHITE),
+                    (f"Побед: {total_wins} ({personal_win_rate:.1f}%)", arcade.color.GREEN),
+                    (f"Всего очков: {total_score}", arcade.color.LIGHT_BLUE),
+                    (f"Лучший счет: {best_score}", arcade.color.GOLD),
+                ]
+
+                for text, color in personal_items:
+                    ui.add_text(
+                        text,
+                        SCREEN_WIDTH // 2, y,
+                        color, 22,
+                        anchor_x="center", font_name="Arial"
+                    )
+                    y -= 35
+
+        except Exception as e:
+            ui.add_text(
+                f"Ошибка загрузки статистики: {e}",
+                SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2,
+                arcade.color.RED, 20,
+                anchor_x="center", font_name="Arial"
+            )
+
+        # Кнопка возврата
+        ui.add_text(
+            "Нажмите S для возврата",
+            SCREEN_WIDTH // 2, 50,
+            arcade.color.LIGHT_GRAY, 22,
+            anchor_x="center", font_name="Arial"
+        )
+
 
 def main():
     window = arcade.Window(SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE)
+    load_textures(window)
     game_view = GameView()
     game_view.window = window
     game_view.player_name = "Player"
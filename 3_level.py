@@ -1,19 +1,30 @@
 import arcade
 import random
+from animation_timeline import AnimationTimeline
+from board_shapes import build_board_shapes, build_highlight
 from database import db
+from idle_throttle import IdleThrottle
+from level_config import LEVELS, START_MOVES
+from match_engine import BitBoard, generate_layout
+from profiler import profiled
+from tile_animator import TileAnimator
+from tile_pool import TilePool
+from textures import TILE_TYPES, arrow_textures, load_textures, tile_textures
+from ui_batch import UIBatch
 
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
 SCREEN_TITLE = "Puzzle Slider - Level 3"
 
-GRID_ROWS = 5
-GRID_COLS = 5
-TILE_SIZE = 80
+LEVEL = LEVELS[3]
+GRID_ROWS = LEVEL["rows"]
+GRID_COLS = LEVEL["cols"]
+TILE_SIZE = LEVEL["tile_size"]
 GRID_X = (SCREEN_WIDTH - GRID_COLS * TILE_SIZE) // 2
 GRID_Y = (SCREEN_HEIGHT - GRID_ROWS * TILE_SIZE) // 2
-START_MOVES = 10
-
-TILE_TYPES = ["red", "blue", "green", "yellow", "purple"]
+# Минимальная длина ряда и очки за ряд каждой длины
+MIN_MATCH_LENGTH = LEVEL["min_match_length"]
+MATCH_POINTS = LEVEL["match_points"]
 
 
 class Tile(arcade.Sprite):
@@ -21,9 +32,7 @@ class Tile(arcade.Sprite):
         self.tile_type = tile_type
         self.row = row
         self.col = col
-        image_name = TILE_TYPES[tile_type]
-        image_path = f"resources/sprites/tiles/{image_name}.png"
-        super().__init__(image_path)
+        super().__init__(texture=tile_textures[tile_type])
         self.scale = TILE_SIZE / 100
 
         # Анимационные параметры
@@ -41,12 +50,22 @@ class Tile(arcade.Sprite):
         self.target_x = self.center_x
         self.target_y = self.center_y
 
+    def reset(self, tile_type, row, col):
+        # Повторное использование плитки из пула: новый цвет, клетка и сброс анимаций
+        self.tile_type = tile_type
+        self.row = row
+        self.col = col
+        self.texture = tile_textures[tile_type]
+        self.animating_move = False
+        self.animating_fade = False
+        self.alpha = 255
+        self.update_position()
+
 
 class Arrow(arcade.Sprite):
     def __init__(self, direction, x, y):
         self.direction = direction
-        image_path = f"resources/sprites/arrows/{direction}.png"
-        super().__init__(image_path)
+        super().__init__(texture=arrow_textures[direction])
         self.scale = 0.5
         self.center_x = x
         self.center_y = y
@@ -60,6 +79,7 @@ class GameView(arcade.View):
         self.player_name = "Player"
 
         self.grid = [[None for _ in range(GRID_COLS)] for _ in range(GRID_ROWS)]
+        self.board = BitBoard(GRID_ROWS, GRID_COLS, len(TILE_TYPES))
         self.selected_tile = None
         self.moves_left = START_MOVES
         self.moves_used = 0
@@ -69,12 +89,22 @@ class GameView(arcade.View):
         self.showing_high_scores = False
         self.result_saved = False
 
-        # Флаги для анимаций
-        self._waiting_to_fill = False
-        self._check_after_fill = False
+        # Собранный экран завершения и его текущая страница
+        self.overlay_ui = None
+        self.overlay_page = None
+
+        # Анимации плиток и очередь этапов каскада
+        self.animator = TileAnimator(move_speed=400, fade_speed=300)
+        self.timeline = AnimationTimeline(self.animator, self.release_faded)
+        self.idle_throttle = IdleThrottle()
 
+        load_textures()
         self.tile_list = arcade.SpriteList()
+        self.tile_pool = TilePool(Tile, self.tile_list)
         self.arrow_list = arcade.SpriteList()
+        self.board_shapes = None
+        self.selection_highlight = None
+        self.board_shapes_size = None
 
         self.score_text = None
         self.moves_text = None
@@ -90,7 +120,7 @@ class GameView(arcade.View):
         self.setup()
 
     def setup(self):
-        self.tile_list.clear()
+        self.tile_pool.release_all()
         self.arrow_list.clear()
         self.selected_tile = None
         self.moves_left = START_MOVES
@@ -100,9 +130,20 @@ class GameView(arcade.View):
         self.showing_stats = False
         self.showing_high_scores = False
         self.result_saved = False
+        if self.overlay_ui is not None:
+            self.overlay_ui.delete()
+        self.overlay_ui = None
+        self.overlay_page = None
 
-        self._waiting_to_fill = False
-        self._check_after_fill = False
+        self.timeline.clear()
+        self.animator.clear()
+        self.board = BitBoard(GRID_ROWS, GRID_COLS, len(TILE_TYPES))
+
+        # Геометрия поля пересобирается, только если поменялся его размер
+        if self.board_shapes_size != (GRID_ROWS, GRID_COLS):
+            self.board_shapes = build_board_shapes(GRID_X, GRID_Y, GRID_ROWS, GRID_COLS, TILE_SIZE)
+            self.selection_highlight = build_highlight(TILE_SIZE)
+            self.board_shapes_size = (GRID_ROWS, GRID_COLS)
 
         self.score_text = arcade.Text(
             f"Очки: {self.score}",
@@ -130,49 +171,32 @@ class GameView(arcade.View):
 
 
 
+    @profiled("level.on_update")
     def on_update(self, delta_time: float):
-        move_speed = 400
-        fade_speed = 300
-
-        # Обновляем все плитки
-        for tile in list(self.tile_list):
-            if tile.animating_move:
-                dx = tile.target_x - tile.center_x
-                dy = tile.target_y - tile.center_y
-                dist = (dx*dx + dy*dy) ** 0.5
-
-                if dist < 1.0:
-                    tile.center_x = tile.target_x
-                    tile.center_y = tile.target_y
-                    tile.animating_move = False
-                else:
-                    step = move_speed * delta_time
-                    if step > dist:
-                        step = dist
-                    tile.center_x += dx / dist * step
-                    tile.center_y += dy / dist * step
-
-            if tile.animating_fade:
-                tile.alpha -= int(fade_speed * delta_time)
-                if tile.alpha <= 0:
-                    tile.alpha = 0
-                    tile.animating_fade = False
-                    if tile in self.tile_list:
-                        self.tile_list.remove(tile)
-                    # Удаляем из сетки
-                    for r in range(GRID_ROWS):
-                        for c in range(GRID_COLS):
-                            if self.grid[r][c] is tile:
-                                self.grid[r][c] = None
-                                break
-
-        fading_tiles = [t for t in self.tile_list if t.animating_fade]
-        if self._waiting_to_fill and not fading_tiles:
-            self._waiting_to_fill = False
-            self.fill_empty_spaces()
-            if self._check_after_fill:
-                self._check_after_fill = False
-                self.check_matches()
+        # Анимации и этапы каскада идут фиксированными шагами, а не по длине кадра
+        self.timeline.update(delta_time)
+
+        # Поле стоит и ничего не ждёт — окно переходит на редкие кадры
+        self.idle_throttle.update(self.timeline.busy)
+
+    def release_faded(self, tiles):
+        # Растворившиеся плитки возвращаются в пул. Плитка, которая ещё
+        # падала, сначала уходит из аниматора: иначе её слот с moving=True
+        # остался бы за ней, и после переиспользования move() не сбросил бы позицию.
+        for tile in tiles:
+            self.animator.remove(tile)
+            self.tile_pool.release(tile)
+            if self.selected_tile is tile:
+                self.selected_tile = None
+                self.arrow_list.clear()
+            # Плитка знает свою клетку, поэтому сетку обходить не нужно
+            if self.grid[tile.row][tile.col] is tile:
+                self.grid[tile.row][tile.col] = None
+                self.board.clear(tile.row, tile.col)
+
+    def on_hide_view(self):
+        # Следующий экран начинает с полной частоты кадров
+        self.idle_throttle.wake()
 
     def save_game_result(self):
         # Сохранение результат игры
@@ -183,17 +207,25 @@ class GameView(arcade.View):
         total_moves = START_MOVES
         moves_used = total_moves - self.moves_left
 
+        # Запись идёт в фоновом потоке, кадр не ждёт диска
         try:
-            game_id = db.save_game_result(
+            db.save_game_result_async(
                 player_name=self.player_name,
                 score=self.score,
                 moves_used=moves_used,
                 total_moves=total_moves,
                 level=self.level,
-                victory=victory
+                victory=victory,
+                callback=self._report_saved
             )
             self.result_saved = True
-            print(f"Результат сохранен (ID: {game_id})")
+        except Exception as e:
+            print(f"Ошибка при сохранении: {e}")
+
+    def _report_saved(self, future):
+        # Вызывается из потока записи, когда результат попал в базу
+        try:
+            print(f"Результат сохранен (ID: {future.result()})")
         except Exception as e:
             print(f"Ошибка при сохранении: {e}")
 
@@ -237,189 +269,29 @@ class GameView(arcade.View):
             self.music_player = None
 
     def generate_initial_grid(self):
-        max_attempts = 150
-
-        for attempt in range(max_attempts):
-            for row in range(GRID_ROWS):
-                for col in range(GRID_COLS):
-                    tile_type = random.randint(0, len(TILE_TYPES) - 1)
-                    tile = Tile(tile_type, row, col)
-                    self.grid[row][col] = tile
-                    self.tile_list.append(tile)
-
-            if not self.has_matches_in_grid():
-                return
-
-            self.tile_list.clear()
-            self.grid = [[None for _ in range(GRID_COLS)] for _ in range(GRID_ROWS)]
-
-        print(f"Предупреждение: не удалось сгенерировать поле без совпадений за {max_attempts} попыток")
-        self.remove_initial_matches()
-
-    def remove_initial_matches(self):
-        while self.has_matches_in_grid():
-            matches = self.find_all_matches()
-            if matches:
-                for match in matches:
-                    if match:
-                        row, col = match[0]
-                        new_type = random.randint(0, len(TILE_TYPES) - 1)
-                        while new_type == self.grid[row][col].tile_type:
-                            new_type = random.randint(0, len(TILE_TYPES) - 1)
-
-                        self.tile_list.remove(self.grid[row][col])
-                        new_tile = Tile(new_type, row, col)
-                        self.grid[row][col] = new_tile
-                        self.tile_list.append(new_tile)
-
-
-    def has_matches_in_grid(self):
-        # Пятерки по горизонтали
-        for row in range(GRID_ROWS):
-            for col in range(GRID_COLS - 4):
-                if all(self.grid[row][col + i] for i in range(5)):
-                    tile_type = self.grid[row][col].tile_type
-                    if all(self.grid[row][col + i].tile_type == tile_type for i in range(5)):
-                        return True
-
-        # Пятерки по вертикали
-        for col in range(GRID_COLS):
-            for row in range(GRID_ROWS - 4):
-                if all(self.grid[row + i][col] for i in range(5)):
-                    tile_type = self.grid[row][col].tile_type
-                    if all(self.grid[row + i][col].tile_type == tile_type for i in range(5)):
-                        return True
-
-        # Четверки по горизонтали
-        for row in range(GRID_ROWS):
-            for col in range(GRID_COLS - 3):
-                if all(self.grid[row][col + i] for i in range(4)):
-                    tile_type = self.grid[row][col].tile_type
-                    if all(self.grid[row][col + i].tile_type == tile_type for i in range(4)):
-                        return True
-
-        # Четверки по вертикали
-        for col in range(GRID_COLS):
-            for row in range(GRID_ROWS - 3):
-                if all(self.grid[row + i][col] for i in range(4)):
-                    tile_type = self.grid[row][col].tile_type
-                    if all(self.grid[row + i][col].tile_type == tile_type for i in range(4)):
-                        return True
+        # Цвета подбираются сразу без готовых рядов, спрайты создаются один раз
+        layout = generate_layout(GRID_ROWS, GRID_COLS, len(TILE_TYPES), MIN_MATCH_LENGTH)
 
-        # Тройки по горизонтали
         for row in range(GRID_ROWS):
-            for col in range(GRID_COLS - 2):
-                if all(self.grid[row][col + i] for i in range(3)):
-                    tile_type = self.grid[row][col].tile_type
-                    if all(self.grid[row][col + i].tile_type == tile_type for i in range(3)):
-                        return True
-
-        # Тройки по вертикали
-        for col in range(GRID_COLS):
-            for row in range(GRID_ROWS - 2):
-                if all(self.grid[row + i][col] for i in range(3)):
-                    tile_type = self.grid[row][col].tile_type
-                    if all(self.grid[row + i][col].tile_type == tile_type for i in range(3)):
-                        return True
+            for col in range(GRID_COLS):
+                tile_type = layout[row][col]
+                tile = self.tile_pool.acquire(tile_type, row, col)
+                self.grid[row][col] = tile
+                self.board.set(row, col, tile_type)
 
-        return False
+    def has_matches_in_grid(self):
+        return self.board.has_matches(MIN_MATCH_LENGTH)
 
+    @profiled("level.check_matches")
     def check_matches(self):
-        matches = set()
-        points_to_add = 0
+        # Проверяем только строки и столбцы, затронутые ходом или падением плиток
+        matches, points_to_add, found = self.board.find_matches(MIN_MATCH_LENGTH, MATCH_POINTS, incremental=True)
 
-        # Проверяем пятерки по горизонтали (50 очков)
-        for row in range(GRID_ROWS):
-            for col in range(GRID_COLS - 4):
-                # Получаем все 5 плиток в ряду
-                tiles = [self.grid[row][col + i] for i in range(5)]
-
-                # Проверяем, что все плитки существуют и одного цвета
-                if all(tile is not None for tile in tiles):
-                    first_type = tiles[0].tile_type
-                    if all(tile.tile_type == first_type for tile in tiles):
-                        # Добавляем все 5 позиций в совпадения
-                        for i in range(5):
-                            pos = (row, col + i)
-                            matches.add(pos)
-                        points_to_add += 50
-                        print(f"Найдена пятерка в строке {row}, столбец {col}-{col + 4}")
-
-        # Проверяем пятерки по вертикали (50 очков)
-        for col in range(GRID_COLS):
-            for row in range(GRID_ROWS - 4):
-                tiles = [self.grid[row + i][col] for i in range(5)]
-
-                if all(tile is not None for tile in tiles):
-                    first_type = tiles[0].tile_type
-                    if all(tile.tile_type == first_type for tile in tiles):
-                        for i in range(5):
-                            pos = (row + i, col)
-                            matches.add(pos)
-                        points_to_add += 50
-                        print(f"Найдена пятерка в столбце {col}, строка {row}-{row + 4}")
-
-        # Проверяем четверки по горизонтали (40 очков)
-        for row in range(GRID_ROWS):
-            for col in range(GRID_COLS - 3):
-                tiles = [self.grid[row][col + i] for i in range(4)]
-
-                if all(tile is not None for tile in tiles):
-                    first_type = tiles[0].tile_type
-                    if all(tile.tile_type == first_type for tile in tiles):
-                        # Проверяем, что эти плитки еще не входят в пятерки
-                        quad_positions = [(row, col + i) for i in range(4)]
-                        if not any(pos in matches for pos in quad_positions):
-                            for pos in quad_positions:
-                                matches.add(pos)
-                            points_to_add += 40
-                            print(f"Найдена четверка в строке {row}, столбец {col}-{col + 3}")
-
-        # Проверяем четверки по вертикали (40 очков)
-        for col in range(GRID_COLS):
-            for row in range(GRID_ROWS - 3):
-                tiles = [self.grid[row + i][col] for i in range(4)]
-
-                if all(tile is not None for tile in tiles):
-                    first_type = tiles[0].tile_type
-                    if all(tile.tile_type == first_type for tile in tiles):
-                        quad_positions = [(row + i, col) for i in range(4)]
-                        if not any(pos in matches for pos in quad_positions):
-                            for pos in quad_positions:
-                                matches.add(pos)
-                            points_to_add += 40
-                            print(f"Найдена четверка в столбце {col}, строка {row}-{row + 3}")
-
-        # Проверяем тройки по горизонтали (30 очков)
-        for row in range(GRID_ROWS):
-            for col in range(GRID_COLS - 2):
-                tiles = [self.grid[row][col + i] for i in range(3)]
-
-                if all(tile is not None for tile in tiles):
-                    first_type = tiles[0].tile_type
-                    if all(tile.tile_type == first_type for tile in tiles):
-                        triple_positions = [(row, col + i) for i in range(3)]
-                        # Проверяем, что эти плитки не входят в четверки или пятерки
-                        if not any(pos in matches for pos in triple_positions):
-                            for pos in triple_positions:
-                                matches.add(pos)
-                            points_to_add += 30
-                            print(f"Найдена тройка в строке {row}, столбец {col}-{col + 2}")
-
-        # Проверяем тройки по вертикали (30 очков)
-        for col in range(GRID_COLS):
-            for row in range(GRID_ROWS - 2):
-                tiles = [self.grid[row + i][col] for i in range(3)]
-
-                if all(tile is not None for tile in tiles):
-                    first_type = tiles[0].tile_type
-                    if all(tile.tile_type == first_type for tile in tiles):
-                        triple_positions = [(row + i, col) for i in range(3)]
-                        if not any(pos in matches for pos in triple_positions):
-                            for pos in triple_positions:
-                                matches.add(pos)
-                            points_to_add += 30
-                            print(f"Найдена тройка в столбце {col}, строка {row}-{row + 2}")
+        for length, horizontal, row, col in found:
+            if horizontal:
+                print(f"Найден ряд из {length} в строке {row}, столбец {col}-{col + length - 1}")
+            else:
+                print(f"Найден ряд из {length} в столбце {col}, строка {row}-{row + length - 1}")
 
         if matches:
             self.score += points_to_add
@@ -434,14 +306,16 @@ class GameView(arcade.View):
         for row, col in positions:
             tile = self.grid[row][col]
             if tile and not tile.animating_fade:
-                tile.animating_fade = True
+                self.animator.fade(tile)
                 has_fading = True
 
         if has_fading:
             arcade.play_sound(self.sound_tile_match)
-            self._waiting_to_fill = True
-            self._check_after_fill = True
+            # Когда плитки растворятся — падение, когда упадут — новая проверка
+            self.timeline.then(("fall", self.fill_empty_spaces),
+                               ("recheck", self.check_matches))
 
+    @profiled("level.fill_empty_spaces")
     def fill_empty_spaces(self):
         for col in range(GRID_COLS):
             # Собираем непустые плитки снизу вверх
@@ -455,41 +329,42 @@ class GameView(arcade.View):
                 row = GRID_ROWS - 1 - i
                 tile.row = row
                 tile.col = col
-                tile.target_x = GRID_X + col * TILE_SIZE + TILE_SIZE // 2
-                tile.target_y = GRID_Y + (GRID_ROWS - 1 - row) * TILE_SIZE + TILE_SIZE // 2
-                tile.animating_move = True
+                self.animator.move(tile,
+                                   GRID_X + col * TILE_SIZE + TILE_SIZE // 2,
+                                   GRID_Y + (GRID_ROWS - 1 - row) * TILE_SIZE + TILE_SIZE // 2)
                 self.grid[row][col] = tile
+                self.board.set(row, col, tile.tile_type)
 
             # Создаём новые плитки сверху
             for i in range(len(column_tiles), GRID_ROWS):
                 row = GRID_ROWS - 1 - i
                 new_type = random.randint(0, len(TILE_TYPES) - 1)
-                new_tile = Tile(new_type, row, col)
+                new_tile = self.tile_pool.acquire(new_type, row, col)
                 # Позиция старта — сверху экрана
                 new_tile.center_x = GRID_X + col * TILE_SIZE + TILE_SIZE // 2
                 new_tile.center_y = SCREEN_HEIGHT + TILE_SIZE
-                new_tile.target_x = new_tile.center_x
-                new_tile.target_y = GRID_Y + (GRID_ROWS - 1 - row) * TILE_SIZE + TILE_SIZE // 2
-                new_tile.animating_move = True
+                self.animator.move(new_tile,
+                                   new_tile.center_x,
+                                   GRID_Y + (GRID_ROWS - 1 - row) * TILE_SIZE + TILE_SIZE // 2)
                 self.grid[row][col] = new_tile
-                self.tile_list.append(new_tile)
+                self.board.set(row, col, new_type)
 
                 arcade.play_sound(self.sound_tile_fall, volume=0.5)
 
+    @profiled("level.on_draw")
     def on_draw(self):
-        self.clear(arcade.color.GRAY)
-
-        # Рисуем границу сетки
-        left = GRID_X - 5
-        right = GRID_X + GRID_COLS * TILE_SIZE + 5
-        bottom = GRID_Y - 5
-        top = GRID_Y + GRID_ROWS * TILE_SIZE + 5
-        arcade.draw_line(left, bottom, right, bottom, arcade.color.WHITE_SMOKE, 3)
-        arcade.draw_line(left, top, right, top, arcade.color.WHITE_SMOKE, 3)
-        arcade.draw_line(left, bottom, left, top, arcade.color.WHITE_SMOKE, 3)
-        arcade.draw_line(right, bottom, right, top, arcade.color.WHITE_SMOKE, 3)
+        # В простое неизменное поле перерисовывается реже
+        self.idle_throttle.draw(self.draw_scene, arcade.color.GRAY)
+
+    def draw_scene(self):
+        # Рамка поля и подложки клеток — один готовый список фигур
+        self.board_shapes.draw()
 
         self.tile_list.draw()
+        if self.selected_tile is not None:
+            self.selection_highlight.center_x = self.selected_tile.center_x
+            self.selection_highlight.center_y = self.selected_tile.center_y
+            self.selection_highlight.draw()
         self.arrow_list.draw()
         self.draw_ui()
 
@@ -513,52 +388,62 @@ class GameView(arcade.View):
         self.level_text.draw()
 
     def draw_game_over_screen(self):
-        # Отрисовка экрана завершения игры
-        arcade.draw_lrbt_rectangle_filled(
-            0, SCREEN_WIDTH, 0, SCREEN_HEIGHT,
-            (0, 0, 0, 180)
-        )
-
+        # Отрисовка экрана завершения игры. Страница (загрузка, рекорды
+        # или статистика) собирается один раз при переключении на неё,
+        # дальше каждый кадр только рисуется готовый набор.
         if not self.showing_stats and not self.showing_high_scores:
+            # Сохраняем результат
             if not self.result_saved:
                 self.save_game_result()
-
-            # Показываем сообщение о загрузке
-            loading_text = arcade.Text(
+            page = "loading"
+        elif self.showing_high_scores:
+            page = "high_scores"
+        else:
+            page = "stats"
+
+        if self.overlay_page != page:
+            self.build_game_over_screen(page)
+        self.overlay_ui.draw()
+
+    def build_game_over_screen(self, page):
+        # Затемнение поля и выбранная страница экрана завершения
+        if self.overlay_ui is not None:
+            self.overlay_ui.delete()
+        ui = UIBatch()
+        ui.add_rect(0, SCREEN_WIDTH, 0, SCREEN_HEIGHT, (0, 0, 0, 180))
+
+        if page == "loading":
+            # Временное сообщение
+            ui.add_text(
                 "Загрузка результатов...",
                 SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2,
                 arcade.color.WHITE, 28,
                 anchor_x="center", font_name="Arial"
             )
-            loading_text.draw()
-
-        elif self.showing_high_scores:
-            self.show_high_scores_screen()
+        elif page == "high_scores":
+            self.build_high_scores_screen(ui)
+        else:
+            self.build_statistics_screen(ui)
 
-        elif self.showing_stats:
-            self.show_statistics_screen()
+        self.overlay_ui = ui
+        self.overlay_page = page
 
-    def show_high_scores_screen(self):
-        # Отображение таблицы лучших результатов
-        arcade.draw_lrbt_rectangle_filled(
-            0, SCREEN_WIDTH, 0, SCREEN_HEIGHT,
-            (0, 0, 0, 220)
-        )
+    def build_high_scores_screen(self, ui):
+        # Сборка таблицы лучших результатов
+        ui.add_rect(0, SCREEN_WIDTH, 0, SCREEN_HEIGHT, (0, 0, 0, 220))
 
-        title = arcade.Text(
+        ui.add_text(
             "ЛУЧШИЕ РЕЗУЛЬТАТЫ",
             SCREEN_WIDTH // 2, SCREEN_HEIGHT - 100,
             arcade.color.GOLD, 36,
             anchor_x="center", font_name="Arial"
         )
-        subtitle = arcade.Text(
+        ui.add_text(
             f"Уровень {self.level}",
             SCREEN_WIDTH // 2, SCREEN_HEIGHT - 140,
             arcade.color.LIGHT_GRAY, 24,
             anchor_x="center", font_name="Arial"
         )
-        title.draw()
-        subtitle.draw()
 
         try:
             top_scores = db.get_top_scores(level=self.level, limit=5)
@@ -566,55 +451,47 @@ class GameView(arcade.View):
             if top_scores:
                 y = SCREEN_HEIGHT - 200
                 for rank, (player_name, score, moves_used, total_moves, game_date, level) in enumerate(top_scores, 1):
-                    score_text = arcade.Text(
+                    ui.add_text(
                         f"{rank}. {player_name[:10]}: {score} очков ({moves_used}/{total_moves} ходов)",
                         SCREEN_WIDTH // 2, y,
                         arcade.color.WHITE, 20,
                         anchor_x="center", font_name="Arial"
                     )
-                    score_text.draw()
                     y -= 40
             else:
-                no_scores = arcade.Text(
+                ui.add_text(
                     "Пока нет результатов для этого уровня",
                     SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2,
                     arcade.color.LIGHT_GRAY, 24,
                     anchor_x="center", font_name="Arial"
                 )
-                no_scores.draw()
 
         except Exception as e:
-            error_text = arcade.Text(
+            ui.add_text(
                 f"Ошибка загрузки: {str(e)[:30]}...",
                 SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2,
                 arcade.color.RED, 20,
                 anchor_x="center", font_name="Arial"
             )
-            error_text.draw()
 
         # Кнопка возврата
-        back_text = arcade.Text(
+        ui.add_text(
             "Нажмите TAB для возврата",
             SCREEN_WIDTH // 2, 50,
             arcade.color.LIGHT_GRAY, 22,
             anchor_x="center", font_name="Arial"
         )
-        back_text.draw()
 
-    def show_statistics_screen(self):
-        # Отображение статистики
-        arcade.draw_lrbt_rectangle_filled(
-            0, SCREEN_WIDTH, 0, SCREEN_HEIGHT,
-            (0, 0, 0, 220)
-        )
+    def build_statistics_screen(self, ui):
+        # Сборка экрана статистики
+        ui.add_rect(0, SCREEN_WIDTH, 0, SCREEN_HEIGHT, (0, 0, 0, 220))
 
-        title = arcade.Text(
+        ui.add_text(
             "СТАТИСТИКА",
             SCREEN_WIDTH // 2, SCREEN_HEIGHT - 100,
             arcade.color.CYAN, 36,
             anchor_x="center", font_name="Arial"
         )
-        title.draw()
 
         try:
             # Статистика уровня
@@ -632,40 +509,36 @@ class GameView(arcade.View):
                 ]
 
                 for text in stats_items:
-                    stat_text = arcade.Text(
+                    ui.add_text(
                         text,
                         SCREEN_WIDTH // 2, y,
                         arcade.color.WHITE, 22,
                         anchor_x="center", font_name="Arial"
                     )
-                    stat_text.draw()
                     y -= 40
             else:
-                no_stats = arcade.Text(
+                ui.add_text(
                     "Нет статистики для этого уровня",
                     SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2,
                     arcade.color.LIGHT_GRAY, 24,
                     anchor_x="center", font_name="Arial"
                 )
-                no_stats.draw()
 
         except Exception as e:
-            error_text = arcade.Text(
+            ui.add_text(
                 f"Ошибка загрузки: {str(e)[:30]}...",
                 SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2,
                 arcade.color.RED, 20,
                 anchor_x="center", font_name="Arial"
             )
-            error_text.draw()
 
         # Кнопка возврата
-        back_text = arcade.Text(
+        ui.add_text(
             "Нажмите S для возврата",
             SCREEN_WIDTH // 2, 50,
             arcade.color.LIGHT_GRAY, 22,
             anchor_x="center", font_name="Arial"
         )
-        back_text.draw()
 
     def _show_arrows(self):
         self.arrow_list.clear()
@@ -680,7 +553,16 @@ class GameView(arcade.View):
         for direction, (dx, dy) in offsets.items():
             self.arrow_list.append(Arrow(direction, cx + dx, cy + dy))
 
+    def tile_at(self, x, y):
+        # Плитка в клетке сетки под точкой (x, y) или None
+        col = int((x - GRID_X) // TILE_SIZE)
+        row = GRID_ROWS - 1 - int((y - GRID_Y) // TILE_SIZE)
+        if 0 <= row < GRID_ROWS and 0 <= col < GRID_COLS:
+            return self.grid[row][col]
+        return None
+
     def on_mouse_press(self, x, y, button, modifiers):
+        self.idle_throttle.wake()
         if self.game_over:
             return
 
@@ -692,12 +574,12 @@ class GameView(arcade.View):
                 self.arrow_list.clear()
                 return
 
-        # Проверяем, если кликнули по плитке
-        for tile in self.tile_list:
-            if tile.collides_with_point((x, y)):
-                self.selected_tile = tile
-                self._show_arrows()
-                return
+        # Клетку под курсором находим по координатам, без обхода всех плиток
+        tile = self.tile_at(x, y)
+        if tile:
+            self.selected_tile = tile
+            self._show_arrows()
+            return
 
         # Если кликнули в пустое место, отменяем выбор
         if self.selected_tile:
@@ -726,19 +608,20 @@ class GameView(arcade.View):
         other_tile = self.grid[new_row][new_col]
         self.grid[old_row][old_col] = other_tile
         self.grid[new_row][new_col] = self.selected_tile
+        self.board.swap(old_row, old_col, new_row, new_col)
 
         arcade.play_sound(self.sound_tile_move)
 
         if other_tile:
             other_tile.row, other_tile.col = old_row, old_col
-            other_tile.target_x = GRID_X + old_col * TILE_SIZE + TILE_SIZE // 2
-            other_tile.target_y = GRID_Y + (GRID_ROWS - 1 - old_row) * TILE_SIZE + TILE_SIZE // 2
-            other_tile.animating_move = True
+            self.animator.move(other_tile,
+                               GRID_X + old_col * TILE_SIZE + TILE_SIZE // 2,
+                               GRID_Y + (GRID_ROWS - 1 - old_row) * TILE_SIZE + TILE_SIZE // 2)
 
         self.selected_tile.row, self.selected_tile.col = new_row, new_col
-        self.selected_tile.target_x = GRID_X + new_col * TILE_SIZE + TILE_SIZE // 2
-        self.selected_tile.target_y = GRID_Y + (GRID_ROWS - 1 - new_row) * TILE_SIZE + TILE_SIZE // 2
-        self.selected_tile.animating_move = True
+        self.animator.move(self.selected_tile,
+                           GRID_X + new_col * TILE_SIZE + TILE_SIZE // 2,
+                           GRID_Y + (GRID_ROWS - 1 - new_row) * TILE_SIZE + TILE_SIZE // 2)
 
         # Проверяем совпадения после перемещения
         self.check_matches()
@@ -748,6 +631,7 @@ class GameView(arcade.View):
             self.show_game_over()
 
     def on_key_press(self, key, modifiers):
+        self.idle_throttle.wake()
         # ESC для возврата в меню
         if key == arcade.key.ESCAPE:
             if not self.game_over:
@@ -771,6 +655,7 @@ class GameView(arcade.View):
 def main():
     # Отдельный запуск уровня (для тестирования)
     window = arcade.Window(SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE)
+    load_textures(window)
     game_view = GameView()
     game_view.window = window
     game_view.player_name = "Player"
@@ -0,0 +1,63 @@
+# Анимации и каскад совпадений в фиксированном шаге времени.
+#
+# Время кадра копится в аккумуляторе и расходуется шагами FIXED_STEP, поэтому
+# плитки движутся одинаково при 30 и при 144 кадрах в секунду, а длинный кадр
+# просто выполняет несколько шагов подряд. Шаги меняют только массивы
+# аниматора, спрайты обновляются один раз после них.
+#
+# Этапы каскада стоят в очереди: сдвиг и растворение запускаются сразу,
+# а падение и повторная проверка — каждый в свой шаг, когда закончились
+# все анимации предыдущего этапа.
+# Порядок этапов поэтому одинаков на медленных и быстрых машинах.
+from collections import deque
+from typing import Callable, Deque, List, Tuple
+
+FIXED_STEP = 1 / 120
+# Больше шагов за один кадр не делается: после долгой паузы (перетаскивание
+# окна, отладчик) анимация продолжается с места, а не догоняет всё разом
+MAX_STEPS = 30
+
+
+class AnimationTimeline:
+    def __init__(self, animator, on_faded: Callable[[List], None],
+                 step: float = FIXED_STEP, max_steps: int = MAX_STEPS):
+        self.animator = animator
+        self.on_faded = on_faded
+        self.step = step
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        self.phases: Deque[Tuple[str, Callable[[], None]]] = deque()
+
+    @property
+    def busy(self) -> bool:
+        return bool(self.animator) or bool(self.phases)
+
+    def then(self, *phases: Tuple[str, Callable[[], None]]) -> None:
+        # Этапы начнутся по очереди, когда закончатся текущие анимации и этапы
+        # перед ними. Если очередь уже заканчивается теми же этапами, второй раз
+        # они не ставятся: повторный ход во время каскада не запускает лишнее падение.
+        if list(self.phases)[-len(phases):] == list(phases):
+            return
+        self.phases.extend(phases)
+
+    def clear(self) -> None:
+        self.phases.clear()
+        self.accumulator = 0.0
+
+    def update(self, delta_time: float) -> None:
+        self.accumulator = min(self.accumulator + delta_time, self.step * self.max_steps)
+        while self.accumulator >= self.step:
+            self.accumulator -= self.step
+            self.on_faded(self.animator.update(self.step))
+
+            # Этап, не запустивший анимаций, сразу передаёт очередь следующему
+            while self.phases and not self.animator:
+                _, action = self.phases.popleft()
+                action()
+
+        # Спрайты получают результат всех шагов кадра одной записью
+        self.animator.sync()
+
+        # Пока ничего не движется и не ждёт, остаток времени копить незачем
+        if not self.busy:
+            self.accumulator = 0.0
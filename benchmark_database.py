@@ -0,0 +1,171 @@
+# Замеры базы результатов без окна игры.
+#
+# Запуск: python benchmark_database.py --rows 100000 --players 1000
+import argparse
+import os
+import random
+import sqlite3
+import tempfile
+import time
+from datetime import datetime
+from typing import List, Tuple
+
+from database import CONNECTION_PRAGMAS, PLAYER_STATS_UPSERT, GameDatabase
+
+# Прежнее обновление статистики игрока: четыре подзапроса к player_stats
+# и REPLACE, который удаляет и заново вставляет строку
+LEGACY_PLAYER_STATS_REPLACE = '''
+    INSERT OR REPLACE INTO player_stats
+    (player_name, total_games, total_wins, total_score, best_score, last_played)
+    VALUES (
+        ?,
+        COALESCE((SELECT total_games + 1 FROM player_stats WHERE player_name = ?), 1),
+        COALESCE((SELECT total_wins + ? FROM player_stats WHERE player_name = ?), ?),
+        COALESCE((SELECT total_score + ? FROM player_stats WHERE player_name = ?), ?),
+        MAX(?, COALESCE((SELECT best_score FROM player_stats WHERE player_name = ?), 0)),
+        ?
+    )
+'''
+
+PLAYER_STATS_TABLE = '''
+    CREATE TABLE player_stats (
+        player_name TEXT PRIMARY KEY,
+        total_games INTEGER DEFAULT 0,
+        total_wins INTEGER DEFAULT 0,
+        total_score INTEGER DEFAULT 0,
+        best_score INTEGER DEFAULT 0,
+        last_played TIMESTAMP
+    )
+'''
+
+Game = Tuple[str, int, bool]
+
+
+def generate_games(rows: int, players: int, seed: int) -> List[Game]:
+    # (имя, очки, победа) — как у сохранённых игр
+    rng = random.Random(seed)
+    return [(f"player{rng.randrange(players)}", rng.randint(0, 300), rng.random() < 0.5)
+            for _ in range(rows)]
+
+
+def open_database(path: str) -> sqlite3.Connection:
+    conn = sqlite3.connect(path)
+    for pragma in CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+    conn.execute(PLAYER_STATS_TABLE)
+    return conn
+
+
+def legacy_params(name: str, score: int, victory: bool, now: str) -> Tuple:
+    win = 1 if victory else 0
+    return (name, name, win, name, win, score, name, score, score, name, now)
+
+
+def upsert_params(name: str, score: int, victory: bool, now: str) -> Tuple:
+    return (name, 1, 1 if victory else 0, score, score, now)
+
+
+def run_player_stats(path: str, games: List[Game], statement: str, make_params) -> Tuple[float, List]:
+    # Одна запись статистики на игру, как в _insert_result;
+    # коммит каждые 1000 игр, чтобы журнал не разрастался
+    conn = open_database(path)
+    now = datetime.now().isoformat()
+    start = time.perf_counter()
+    for i, (name, score, victory) in enumerate(games, 1):
+        conn.execute(statement, make_params(name, score, victory, now))
+        if i % 1000 == 0:
+            conn.commit()
+    conn.commit()
+    elapsed = time.perf_counter() - start
+
+    rows = conn.execute('''
+        SELECT player_name, total_games, total_wins, total_score, best_score
+        FROM player_stats ORDER BY player_name
+    ''').fetchall()
+    conn.close()
+    return elapsed, rows
+
+
+def benchmark_player_stats(rows: int, players: int, seed: int) -> None:
+    games = generate_games(rows, players, seed)
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, statement, make_params in (
+                ("INSERT OR REPLACE", LEGACY_PLAYER_STATS_REPLACE, legacy_params),
+                ("ON CONFLICT DO UPDATE", PLAYER_STATS_UPSERT, upsert_params)):
+            elapsed, table = run_player_stats(os.path.join(tmp, f"{len(results)}.db"),
+                                              games, statement, make_params)
+            results[name] = table
+            print(f"{name:>22}: {rows} записей за {elapsed:.2f} с — {rows / elapsed:.0f} записей/с")
+
+    tables = list(results.values())
+    print("Итоговые таблицы совпадают" if tables[0] == tables[1] else "ОШИБКА: таблицы различаются")
+
+
+def benchmark_bulk(rows: int, players: int, seed: int) -> None:
+    # Сохранение по одной игре против массовой загрузки
+    games = [(name, score, 5, 10, 1 + i % 3, victory)
+             for i, (name, score, victory) in enumerate(generate_games(rows, players, seed))]
+    with tempfile.TemporaryDirectory() as tmp:
+        database = GameDatabase(os.path.join(tmp, "single.db"))
+        start = time.perf_counter()
+        for game in games:
+            database.save_game_result(*game)
+        elapsed = time.perf_counter() - start
+        database.close()
+        print(f"{'save_game_result':>22}: {rows} записей за {elapsed:.2f} с — {rows / elapsed:.0f} записей/с")
+
+        database = GameDatabase(os.path.join(tmp, "bulk.db"))
+        start = time.perf_counter()
+        database.save_game_results_bulk(games)
+        elapsed = time.perf_counter() - start
+        print(f"{'save_game_results_bulk':>22}: {rows} записей за {elapsed:.2f} с — {rows / elapsed:.0f} записей/с")
+
+        # Таблица рекордов на заполненной базе должна читаться только из индексов
+        for problem in database.check_query_plans():
+            print(f"ОШИБКА: {problem}")
+        start = time.perf_counter()
+        for level in (None, 1, 2, 3):
+            database.get_top_scores(level=level, limit=10)
+            database.invalidate_cache()
+        elapsed = time.perf_counter() - start
+        print(f"{'get_top_scores':>22}: 4 запроса за {elapsed * 1000:.2f} мс")
+
+        # Страница из глубины таблицы: по ключу против OFFSET
+        conn = sqlite3.connect(os.path.join(tmp, "bulk.db"))
+        depth = rows // 4
+        score, moves_used, game_id = conn.execute('''
+            SELECT score, moves_used, id FROM game_results WHERE victory = 1
+            ORDER BY score DESC, moves_used ASC, id ASC LIMIT 1 OFFSET ?
+        ''', (depth,)).fetchone()
+        start = time.perf_counter()
+        conn.execute('''
+            SELECT player_name, score, moves_used, total_moves, game_date, level
+            FROM game_results WHERE victory = 1
+            ORDER BY score DESC, moves_used ASC, id ASC LIMIT 10 OFFSET ?
+        ''', (depth + 1,)).fetchall()
+        offset_elapsed = time.perf_counter() - start
+        conn.close()
+        start = time.perf_counter()
+        database.get_top_scores_page(limit=10, after=(score, moves_used, game_id))
+        keyset_elapsed = time.perf_counter() - start
+        database.close()
+        print(f"{'страница после ' + str(depth):>22}: OFFSET {offset_elapsed * 1000:.2f} мс, "
+              f"по ключу {keyset_elapsed * 1000:.2f} мс")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Замеры базы результатов")
+    parser.add_argument("--rows", type=int, default=100000, help="число сохраняемых игр")
+    parser.add_argument("--players", type=int, default=1000, help="число разных игроков")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"Статистика игроков: {args.rows} игр, {args.players} игроков")
+    benchmark_player_stats(args.rows, args.players, args.seed)
+    print(f"Сохранение результатов: {args.rows} игр")
+    benchmark_bulk(args.rows, args.players, args.seed)
+
+
+if __name__ == "__main__":
+    main()
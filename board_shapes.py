@@ -0,0 +1,43 @@
+# Неподвижная геометрия игрового поля: рамка и подложки клеток собраны
+# в один ShapeElementList и рисуются одним вызовом. Рамка выбранной плитки —
+# отдельный маленький список, который не пересобирается, а только
+# сдвигается через center_x/center_y.
+import arcade
+
+FRAME_COLOR = arcade.color.WHITE_SMOKE
+FRAME_MARGIN = 5
+FRAME_WIDTH = 3
+CELL_COLOR = (0, 0, 0, 40)
+CELL_GAP = 4
+HIGHLIGHT_COLOR = arcade.color.YELLOW
+HIGHLIGHT_WIDTH = 4
+
+
+def build_board_shapes(grid_x: int, grid_y: int, rows: int, cols: int,
+                       tile_size: int) -> arcade.ShapeElementList:
+    # Подложки всех клеток и рамка вокруг поля
+    shapes = arcade.ShapeElementList()
+    for row in range(rows):
+        for col in range(cols):
+            shapes.append(arcade.create_rectangle_filled(
+                grid_x + col * tile_size + tile_size / 2,
+                grid_y + row * tile_size + tile_size / 2,
+                tile_size - CELL_GAP, tile_size - CELL_GAP,
+                CELL_COLOR))
+
+    width = cols * tile_size
+    height = rows * tile_size
+    shapes.append(arcade.create_rectangle_outline(
+        grid_x + width / 2, grid_y + height / 2,
+        width + 2 * FRAME_MARGIN, height + 2 * FRAME_MARGIN,
+        FRAME_COLOR, FRAME_WIDTH))
+    return shapes
+
+
+def build_highlight(tile_size: int) -> arcade.ShapeElementList:
+    # Рамка выбранной плитки с центром в (0, 0); на место ставится через center_x/center_y
+    shapes = arcade.ShapeElementList()
+    shapes.append(arcade.create_rectangle_outline(
+        0, 0, tile_size - CELL_GAP, tile_size - CELL_GAP,
+        HIGHLIGHT_COLOR, HIGHLIGHT_WIDTH))
+    return shapes
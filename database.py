@@ -1,6 +1,133 @@
+import atexit
+import functools
+import itertools
+import queue
 import sqlite3
+import threading
+from concurrent.futures import Future
+from contextlib import contextmanager
 from datetime import datetime
-from typing import List, Tuple, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Tuple, Optional
+
+from profiler import profiled
+
+# Настройки соединения: журнал WAL, fsync только на контрольных точках,
+# кэш страниц ~8 МБ и отображение файла в память до 256 МБ
+CONNECTION_PRAGMAS = [
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-8000",
+    "PRAGMA mmap_size=268435456",
+]
+# Сколько подготовленных запросов хранит каждое соединение
+STATEMENT_CACHE_SIZE = 256
+# Сколько результатов фоновый поток записывает одной транзакцией
+WRITE_BATCH_SIZE = 64
+# Сколько результатов массовая загрузка передаёт в одном executemany
+BULK_CHUNK_SIZE = 5000
+# Сколько строк game_results миграция обрабатывает в одной транзакции
+MIGRATION_CHUNK_SIZE = 10000
+
+# Постраничный вывод — по ключу последней показанной строки, а не OFFSET:
+# любая страница начинается с поиска по индексу, поэтому далёкие страницы
+# читаются так же быстро, как первая.
+# Ключ таблицы рекордов: (score, moves_used, id) последней строки страницы.
+TopScoresCursor = Tuple[int, int, int]
+# Ключ истории игр: (game_date, id) последней строки страницы.
+RecentGamesCursor = Tuple[datetime, int]
+
+
+def top_scores_query(by_level: bool, after: bool) -> str:
+    # Запрос таблицы рекордов. Для него есть частичный покрывающий индекс
+    # (только победы, все выбираемые столбцы в ключе), поэтому строки
+    # читаются из индекса по порядку, без сортировки и без обращения к таблице.
+    # Параметры: [level], [score, score, moves_used, moves_used, id], limit.
+    conditions = ["victory = 1"]
+    if by_level:
+        conditions.insert(0, "level = ?")
+    if after:
+        conditions.append("score <= ?")
+        conditions.append("(score < ? OR moves_used > ? OR (moves_used = ? AND id > ?))")
+    return f'''
+        SELECT player_name, score, moves_used, total_moves, game_date, level, id
+        FROM game_results 
+        WHERE {" AND ".join(conditions)}
+        ORDER BY score DESC, moves_used ASC, id ASC
+        LIMIT ?
+    '''
+
+
+def recent_games_query(by_player: bool, after: bool) -> str:
+    # Запрос истории игр, от новых к старым.
+    # Параметры: [player_name], [game_date, game_date, id], limit.
+    conditions = []
+    if by_player:
+        conditions.append("player_name = ?")
+    if after:
+        conditions.append("game_date <= ?")
+        conditions.append("(game_date < ? OR id < ?)")
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    return f'''
+        SELECT player_name, score, moves_used, total_moves, game_date, level, victory, id
+        FROM game_results 
+        {where}
+        ORDER BY game_date DESC, id DESC
+        LIMIT ?
+    '''
+
+
+# Запрос, его параметры для EXPLAIN QUERY PLAN, индекс, который он должен
+# использовать, и должен ли этот индекс покрывать запрос целиком
+QUERY_PLAN_CHECKS = [
+    (top_scores_query(False, False), (10,), "idx_top_scores", True),
+    (top_scores_query(False, True), (100, 100, 5, 5, 1, 10), "idx_top_scores", True),
+    (top_scores_query(True, False), (1, 10), "idx_top_scores_level", True),
+    (top_scores_query(True, True), (1, 100, 100, 5, 5, 1, 10), "idx_top_scores_level", True),
+    (recent_games_query(False, False), (10,), "idx_date", False),
+    (recent_games_query(False, True), ("2025-01-01", "2025-01-01", 1, 10), "idx_date", False),
+    (recent_games_query(True, False), ("Player", 10), "idx_player_date", False),
+    (recent_games_query(True, True), ("Player", "2025-01-01", "2025-01-01", 1, 10),
+     "idx_player_date", False),
+]
+
+# Добавление игр к статистике игрока за один проход по индексу:
+# новая строка или арифметика над существующей, без DELETE и подзапросов.
+# Параметры: имя, число игр, побед, сумма очков, лучший счёт, время.
+# last_played только растёт: загрузка старых игр не сдвигает его назад.
+PLAYER_STATS_UPSERT = '''
+    INSERT INTO player_stats 
+    (player_name, total_games, total_wins, total_score, best_score, last_played)
+    VALUES (?, ?, ?, ?, MAX(?, 0), ?)
+    ON CONFLICT(player_name) DO UPDATE SET
+        total_games = total_games + excluded.total_games,
+        total_wins = total_wins + excluded.total_wins,
+        total_score = total_score + excluded.total_score,
+        best_score = MAX(best_score, excluded.best_score),
+        last_played = MAX(COALESCE(last_played, excluded.last_played), excluded.last_played)
+'''
+# Добавление игр к сводной статистике уровня.
+# Параметры: уровень, число игр, побед, сумма очков, максимум, минимум,
+# сумма долей использованных ходов.
+LEVEL_STATS_UPSERT = '''
+    INSERT INTO level_stats 
+    (level, total_games, total_wins, total_score, max_score, min_score, efficiency_sum)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(level) DO UPDATE SET
+        total_games = total_games + excluded.total_games,
+        total_wins = total_wins + excluded.total_wins,
+        total_score = total_score + excluded.total_score,
+        max_score = MAX(max_score, excluded.max_score),
+        min_score = MIN(min_score, excluded.min_score),
+        efficiency_sum = efficiency_sum + excluded.efficiency_sum
+'''
+# Добавление игр к распределению результатов уровня.
+# Параметры: уровень, очки, использованные ходы, число игр.
+SCORE_HISTOGRAM_UPSERT = '''
+    INSERT INTO score_histogram (level, score, moves_used, games)
+    VALUES (?, ?, ?, ?)
+    ON CONFLICT(level, score, moves_used) DO UPDATE SET
+        games = games + excluded.games
+'''
 
 
 def adapt_datetime(dt: datetime) -> str:
@@ -13,60 +140,437 @@ def convert_datetime(text: bytes | str) -> datetime:
     return datetime.fromisoformat(text.decode() if isinstance(text, bytes) else text)
 
 
+def cached_query(method: Callable) -> Callable:
+    # Кэш результата запроса по имени метода и аргументам.
+    # Запись действительна, пока не изменился счётчик записей в базу,
+    # поэтому экраны статистики обращаются к SQLite только после новых игр.
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = (method.__name__, args, tuple(sorted(kwargs.items())))
+        with self._cache_lock:
+            generation = self._write_generation
+            entry = self._query_cache.get(key)
+        if entry is not None and entry[0] == generation:
+            return entry[1]
+
+        result = method(self, *args, **kwargs)
+        with self._cache_lock:
+            self._query_cache[key] = (generation, result)
+        return result
+
+    return wrapper
+
+
+@contextmanager
+def transaction(conn: sqlite3.Connection) -> Iterator[sqlite3.Cursor]:
+    # Явная транзакция: в ней откатываются и CREATE/DROP, и PRAGMA user_version.
+    # BEGIN IMMEDIATE сразу берёт блокировку записи, поэтому два процесса
+    # не начнут одну и ту же миграцию одновременно.
+    conn.commit()
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield conn.cursor()
+    except BaseException:
+        conn.rollback()
+        raise
+    conn.commit()
+
+
+class Migration(NamedTuple):
+    # Шаг схемы. apply выполняется в одной транзакции вместе с записью
+    # новой версии и возвращает, до какого id нужно дозаполнить данные
+    # (None или 0 — дозаполнять нечего). backfill(cursor, после_id, до_id, порция)
+    # обрабатывает одну порцию и возвращает id, на котором остановился;
+    # каждая порция — отдельная короткая транзакция, поэтому база не
+    # блокируется надолго, а прерванная миграция продолжается с того же места.
+    version: int
+    description: str
+    apply: Callable[[sqlite3.Cursor], Optional[int]]
+    backfill: Optional[Callable[[sqlite3.Cursor, int, int, int], int]] = None
+
+
+def _create_base_schema(cursor: sqlite3.Cursor) -> None:
+    # Исходная схема. IF NOT EXISTS — базы, созданные до появления версий,
+    # уже содержат эти таблицы.
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS game_results (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            player_name TEXT NOT NULL DEFAULT 'Player',
+            score INTEGER NOT NULL,
+            moves_used INTEGER NOT NULL,
+            total_moves INTEGER NOT NULL,
+            level INTEGER NOT NULL DEFAULT 1,
+            game_date TIMESTAMP NOT NULL,
+            victory BOOLEAN NOT NULL
+        )
+    ''')
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS player_stats (
+            player_name TEXT PRIMARY KEY,
+            total_games INTEGER DEFAULT 0,
+            total_wins INTEGER DEFAULT 0,
+            total_score INTEGER DEFAULT 0,
+            best_score INTEGER DEFAULT 0,
+            last_played TIMESTAMP
+        )
+    ''')
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_score_level ON game_results(score DESC, level)
+    ''')
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_date ON game_results(game_date DESC)
+    ''')
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_player ON game_results(player_name, score DESC)
+    ''')
+
+
+def _create_leaderboard_indexes(cursor: sqlite3.Cursor) -> None:
+    # Частичные покрывающие индексы под запросы таблицы рекордов
+    # (top_scores_query) по всем уровням и по одному. Прежний idx_score_level не содержал
+    # victory и moves_used, из-за чего SQLite сортировал во временном
+    # B-дереве; теперь он не нужен ни одному запросу и только замедляет запись.
+    # victory стоит в конце ключа: без него SQLite не считает индекс
+    # покрывающим, хотя в частичном индексе это значение всегда 1.
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_top_scores
+        ON game_results(score DESC, moves_used ASC, player_name, total_moves, game_date, level, victory)
+        WHERE victory = 1
+    ''')
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_top_scores_level
+        ON game_results(level, score DESC, moves_used ASC, player_name, total_moves, game_date, victory)
+        WHERE victory = 1
+    ''')
+    cursor.execute('DROP INDEX IF EXISTS idx_score_level')
+
+
+def _create_level_stats(cursor: sqlite3.Cursor) -> Optional[int]:
+    # Сводная статистика по уровням, обновляется при каждой записи игры.
+    # Игры, записанные после этой транзакции, сразу попадают в таблицу,
+    # поэтому дозаполнить нужно только id до текущего максимума.
+    cursor.execute('''
+        SELECT EXISTS(SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'level_stats')
+    ''')
+    existed = cursor.fetchone()[0]
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS level_stats (
+            level INTEGER PRIMARY KEY,
+            total_games INTEGER NOT NULL DEFAULT 0,
+            total_wins INTEGER NOT NULL DEFAULT 0,
+            total_score INTEGER NOT NULL DEFAULT 0,
+            max_score INTEGER,
+            min_score INTEGER,
+            efficiency_sum REAL NOT NULL DEFAULT 0
+        )
+    ''')
+    if existed:
+        return None
+    cursor.execute('SELECT MAX(id) FROM game_results')
+    return cursor.fetchone()[0]
+
+
+def _backfill_level_stats(cursor: sqlite3.Cursor, after_id: int, end_id: int, chunk_size: int) -> int:
+    # Добавление к сводной таблице игр с id в (after_id, after_id + chunk_size]
+    last_id = min(after_id + chunk_size, end_id)
+    cursor.execute('''
+        SELECT 
+            level,
+            COUNT(*),
+            SUM(CASE WHEN victory = 1 THEN 1 ELSE 0 END),
+            SUM(score),
+            MAX(score),
+            MIN(score),
+            COALESCE(SUM(moves_used * 1.0 / total_moves), 0)
+        FROM game_results
+        WHERE id > ? AND id <= ?
+        GROUP BY level
+    ''', (after_id, last_id))
+    cursor.executemany(LEVEL_STATS_UPSERT, cursor.fetchall())
+    return last_id
+
+
+def _create_keyset_indexes(cursor: sqlite3.Cursor) -> None:
+    # Индексы для постраничного вывода: id входит в ключ сразу после
+    # столбцов сортировки, чтобы порядок (..., id) тоже брался из индекса
+    cursor.execute('DROP INDEX IF EXISTS idx_top_scores')
+    cursor.execute('DROP INDEX IF EXISTS idx_top_scores_level')
+    cursor.execute('DROP INDEX IF EXISTS idx_date')
+    cursor.execute('''
+        CREATE INDEX idx_top_scores
+        ON game_results(score DESC, moves_used ASC, id, player_name, total_moves, game_date, level, victory)
+        WHERE victory = 1
+    ''')
+    cursor.execute('''
+        CREATE INDEX idx_top_scores_level
+        ON game_results(level, score DESC, moves_used ASC, id, player_name, total_moves, game_date, victory)
+        WHERE victory = 1
+    ''')
+    cursor.execute('''
+        CREATE INDEX idx_date ON game_results(game_date DESC, id DESC)
+    ''')
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_player_date ON game_results(player_name, game_date DESC, id DESC)
+    ''')
+
+
+def _create_score_histogram(cursor: sqlite3.Cursor) -> Optional[int]:
+    # Распределение результатов: сколько игр уровня закончилось с данными
+    # очками и ходами. Разных пар (очки, ходы) на уровне сотни, а не миллионы,
+    # поэтому место результата считается суммой по нескольким строкам.
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS score_histogram (
+            level INTEGER NOT NULL,
+            score INTEGER NOT NULL,
+            moves_used INTEGER NOT NULL,
+            games INTEGER NOT NULL,
+            PRIMARY KEY (level, score, moves_used)
+        ) WITHOUT ROWID
+    ''')
+    cursor.execute('SELECT MAX(id) FROM game_results')
+    return cursor.fetchone()[0]
+
+
+def _backfill_score_histogram(cursor: sqlite3.Cursor, after_id: int, end_id: int, chunk_size: int) -> int:
+    # Добавление к распределению игр с id в (after_id, after_id + chunk_size]
+    last_id = min(after_id + chunk_size, end_id)
+    cursor.execute('''
+        SELECT level, score, moves_used, COUNT(*)
+        FROM game_results
+        WHERE id > ? AND id <= ?
+        GROUP BY level, score, moves_used
+    ''', (after_id, last_id))
+    cursor.executemany(SCORE_HISTOGRAM_UPSERT, cursor.fetchall())
+    return last_id
+
+
+# Шаги схемы по порядку; версия базы хранится в PRAGMA user_version.
+# Новый шаг добавляется только в конец списка со следующим номером.
+MIGRATIONS = [
+    Migration(1, "таблицы результатов и статистики игроков", _create_base_schema),
+    Migration(2, "частичные покрывающие индексы таблицы рекордов", _create_leaderboard_indexes),
+    Migration(3, "сводная статистика уровней", _create_level_stats, _backfill_level_stats),
+    Migration(4, "индексы постраничного вывода рекордов и истории", _create_keyset_indexes),
+    Migration(5, "распределение результатов для места игрока",
+              _create_score_histogram, _backfill_score_histogram),
+]
+SCHEMA_VERSION = MIGRATIONS[-1].version
+
+
 class GameDatabase:
     # Класс для управления базой данных результатов игры
     
-    def __init__(self, db_path: str = "game_results.db"):
+    def __init__(self, db_path: str = "game_results.db", auto_migrate: bool = True):
         # Инициализация базы данных
         self.db_path = db_path
         sqlite3.register_adapter(datetime, adapt_datetime)
         sqlite3.register_converter("timestamp", convert_datetime)
-        self._init_database()
+
+        # Одно долгоживущее соединение на поток вместо нового на каждый запрос
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+
+        # Очередь отложенной записи и поток, который её разбирает
+        self._write_queue: "queue.Queue" = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+        self._writer_lock = threading.Lock()
+
+        # Кэш запросов чтения и счётчик записей, который его сбрасывает.
+        # Учитываются только записи через этот объект.
+        self._query_cache: Dict[tuple, Tuple[int, Any]] = {}
+        self._write_generation = 0
+        self._cache_lock = threading.Lock()
+
+        if auto_migrate:
+            self._init_database()
+
+    def _connect(self) -> sqlite3.Connection:
+        # Соединение текущего потока; создаётся при первом обращении.
+        # "with self._connect() as conn" — это транзакция, соединение не закрывается.
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path,
+                                   detect_types=sqlite3.PARSE_DECLTYPES,
+                                   cached_statements=STATEMENT_CACHE_SIZE,
+                                   check_same_thread=False)
+            for pragma in CONNECTION_PRAGMAS:
+                conn.execute(pragma)
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    def close(self) -> None:
+        # Дописываем очередь, останавливаем поток записи и закрываем соединения
+        # (вызывается при выходе из игры)
+        with self._writer_lock:
+            writer = self._writer
+            self._writer = None
+        if writer is not None:
+            self._write_queue.put(None)
+            writer.join()
+
+        with self._connections_lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+        self._local = threading.local()
     
     def _init_database(self) -> None:
-        #Инициализация базы данных и создание таблиц
-        with sqlite3.connect(self.db_path, detect_types=sqlite3.PARSE_DECLTYPES) as conn:
-            cursor = conn.cursor()
-            
-            # Таблица результатов игр
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS game_results (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    player_name TEXT NOT NULL DEFAULT 'Player',
-                    score INTEGER NOT NULL,
-                    moves_used INTEGER NOT NULL,
-                    total_moves INTEGER NOT NULL,
-                    level INTEGER NOT NULL DEFAULT 1,
-                    game_date TIMESTAMP NOT NULL,
-                    victory BOOLEAN NOT NULL
-                )
-            ''')
-            
-            # Таблица статистики игроков
+        #Инициализация базы данных: создание таблиц и обновление схемы
+        self.migrate()
+
+    def schema_version(self) -> int:
+        # Текущая версия схемы базы
+        return self._connect().execute('PRAGMA user_version').fetchone()[0]
+
+    @profiled("db.migrate")
+    def migrate(self,
+                target: Optional[int] = None,
+                chunk_size: int = MIGRATION_CHUNK_SIZE,
+                progress: Optional[Callable[[str], None]] = None) -> int:
+        # Применение шагов MIGRATIONS до версии target (по умолчанию последней).
+        # Незаконченное дозаполнение хранится в migration_progress и
+        # продолжается при следующем запуске. Возвращает итоговую версию.
+        if target is None:
+            target = SCHEMA_VERSION
+        if not 0 <= target <= SCHEMA_VERSION:
+            raise ValueError(f"Неизвестная версия схемы: {target}")
+        current = self.schema_version()
+        if target < current:
+            raise ValueError(f"Откат схемы не поддерживается: {current} -> {target}")
+
+        conn = self._connect()
+        with transaction(conn) as cursor:
             cursor.execute('''
-                CREATE TABLE IF NOT EXISTS player_stats (
-                    player_name TEXT PRIMARY KEY,
-                    total_games INTEGER DEFAULT 0,
-                    total_wins INTEGER DEFAULT 0,
-                    total_score INTEGER DEFAULT 0,
-                    best_score INTEGER DEFAULT 0,
-                    last_played TIMESTAMP
+                CREATE TABLE IF NOT EXISTS migration_progress (
+                    version INTEGER PRIMARY KEY,
+                    after_id INTEGER NOT NULL,
+                    end_id INTEGER NOT NULL
                 )
             ''')
-            
-            # Индексы для быстрого поиска
-            cursor.execute('''
-                CREATE INDEX IF NOT EXISTS idx_score_level ON game_results(score DESC, level)
-            ''')
-            cursor.execute('''
-                CREATE INDEX IF NOT EXISTS idx_date ON game_results(game_date DESC)
-            ''')
-            cursor.execute('''
-                CREATE INDEX IF NOT EXISTS idx_player ON game_results(player_name, score DESC)
-            ''')
-            
+
+        for migration in MIGRATIONS:
+            if not current < migration.version <= target:
+                continue
+
+            cursor = conn.execute('''
+                SELECT after_id, end_id FROM migration_progress WHERE version = ?
+            ''', (migration.version,))
+            state = cursor.fetchone()
+            if state is None:
+                if progress is not None:
+                    progress(f"Версия {migration.version}: {migration.description}")
+                with transaction(conn) as cursor:
+                    end_id = migration.apply(cursor)
+                    if migration.backfill is not None and end_id:
+                        cursor.execute('''
+                            INSERT INTO migration_progress (version, after_id, end_id)
+                            VALUES (?, 0, ?)
+                        ''', (migration.version, end_id))
+                        state = (0, end_id)
+                    else:
+                        cursor.execute(f'PRAGMA user_version = {migration.version}')
+
+            if state is not None:
+                after_id, end_id = state
+                while after_id < end_id:
+                    with transaction(conn) as cursor:
+                        after_id = migration.backfill(cursor, after_id, end_id, chunk_size)
+                        cursor.execute('''
+                            UPDATE migration_progress SET after_id = ? WHERE version = ?
+                        ''', (after_id, migration.version))
+                    if progress is not None:
+                        progress(f"Версия {migration.version}: обработано до id {after_id} из {end_id}")
+                with transaction(conn) as cursor:
+                    cursor.execute('DELETE FROM migration_progress WHERE version = ?',
+                                   (migration.version,))
+                    cursor.execute(f'PRAGMA user_version = {migration.version}')
+
+            current = migration.version
+
+        self.invalidate_cache()
+        return current
+
+    @profiled("db.check_query_plans")
+    def check_query_plans(self) -> List[str]:
+        # Проверка EXPLAIN QUERY PLAN для запросов таблицы рекордов и истории:
+        # каждый должен читать свой индекс (для рекордов — только его) и не сортировать.
+        # Возвращает список найденных проблем, пустой — всё в порядке.
+        problems = []
+        with self._connect() as conn:
+            for query, params, index, covering in QUERY_PLAN_CHECKS:
+                plan = [row[-1] for row in conn.execute('EXPLAIN QUERY PLAN ' + query, params)]
+                expected = f"USING COVERING INDEX {index}" if covering else f"INDEX {index}"
+                if not any(expected in step for step in plan):
+                    problems.append(f"{index}: в плане нет {expected}: {plan}")
+                if any("TEMP B-TREE" in step for step in plan):
+                    problems.append(f"{index}: сортировка во временном B-дереве: {plan}")
+        return problems
+
+    def _rebuild_level_stats(self, cursor: sqlite3.Cursor) -> None:
+        # Пересчёт сводной таблицы уровней по всем сохранённым играм
+        cursor.execute('DELETE FROM level_stats')
+        cursor.execute('''
+            INSERT INTO level_stats
+            (level, total_games, total_wins, total_score, max_score, min_score, efficiency_sum)
+            SELECT 
+                level,
+                COUNT(*),
+                SUM(CASE WHEN victory = 1 THEN 1 ELSE 0 END),
+                SUM(score),
+                MAX(score),
+                MIN(score),
+                COALESCE(SUM(moves_used * 1.0 / total_moves), 0)
+            FROM game_results
+            GROUP BY level
+        ''')
+
+    @profiled("db.rebuild_level_stats")
+    def rebuild_level_stats(self) -> None:
+        # Пересчёт сводной статистики уровней (для старых или исправленных баз)
+        with self._connect() as conn:
+            self._rebuild_level_stats(conn.cursor())
             conn.commit()
+        self.invalidate_cache()
     
+    def invalidate_cache(self) -> None:
+        # Новое поколение данных: все закэшированные результаты устаревают
+        with self._cache_lock:
+            self._write_generation += 1
+            self._query_cache.clear()
+
+    def _insert_result(self,
+                       cursor: sqlite3.Cursor,
+                       player_name: str,
+                       score: int,
+                       moves_used: int,
+                       total_moves: int,
+                       level: int,
+                       victory: bool) -> int:
+        # Вставка результата и обновление статистики игрока в текущей транзакции
+        cursor.execute('''
+            INSERT INTO game_results 
+            (player_name, score, moves_used, total_moves, level, game_date, victory)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        ''', (player_name, score, moves_used, total_moves, level, datetime.now(), victory))
+        
+        game_id = cursor.lastrowid
+        
+        # Обновляем статистику игрока
+        cursor.execute(PLAYER_STATS_UPSERT,
+                       (player_name, 1, 1 if victory else 0, score, score, datetime.now()))
+
+        # Обновляем сводную статистику уровня
+        efficiency = moves_used / total_moves if total_moves else 0
+        cursor.execute(LEVEL_STATS_UPSERT,
+                       (level, 1, 1 if victory else 0, score, score, score, efficiency))
+        cursor.execute(SCORE_HISTOGRAM_UPSERT, (level, score, moves_used, 1))
+
+        return game_id
+
+    @profiled("db.save_game_result")
     def save_game_result(self, 
                         player_name: str, 
                         score: int, 
@@ -75,132 +579,323 @@ class GameDatabase:
                         level: int = 1, 
                         victory: bool = True) -> int:
         # Сохранение результата игры в базу данных
-        with sqlite3.connect(self.db_path, detect_types=sqlite3.PARSE_DECLTYPES) as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                INSERT INTO game_results 
-                (player_name, score, moves_used, total_moves, level, game_date, victory)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            ''', (player_name, score, moves_used, total_moves, level, datetime.now(), victory))
-            
-            game_id = cursor.lastrowid
-            
-            # Обновляем статистику игрока
-            cursor.execute('''
-                INSERT OR REPLACE INTO player_stats 
-                (player_name, total_games, total_wins, total_score, best_score, last_played)
-                VALUES (
-                    ?,
-                    COALESCE((SELECT total_games + 1 FROM player_stats WHERE player_name = ?), 1),
-                    COALESCE((SELECT total_wins + ? FROM player_stats WHERE player_name = ?), ?),
-                    COALESCE((SELECT total_score + ? FROM player_stats WHERE player_name = ?), ?),
-                    MAX(?, COALESCE((SELECT best_score FROM player_stats WHERE player_name = ?), 0)),
-                    ?
-                )
-            ''', (player_name, player_name, 
-                  1 if victory else 0, player_name, 1 if victory else 0,
-                  score, player_name, score,
-                  score, player_name,
-                  datetime.now()))
-            
+        with self._connect() as conn:
+            game_id = self._insert_result(conn.cursor(), player_name, score,
+                                          moves_used, total_moves, level, victory)
             conn.commit()
-            return game_id
-    
+        self.invalidate_cache()
+        return game_id
+
+    @profiled("db.save_game_results_bulk")
+    def save_game_results_bulk(self,
+                               results: Iterable[Tuple],
+                               chunk_size: int = BULK_CHUNK_SIZE) -> int:
+        # Массовое сохранение одной транзакцией. Каждый результат — кортеж
+        # (player_name, score, moves_used, total_moves, level, victory[, game_date]);
+        # без даты игра записывается текущим временем. Результаты читаются
+        # порциями по chunk_size, статистика игроков и уровней обновляется
+        # одной строкой на игрока или уровень в порции. Возвращает число записей.
+        if chunk_size < 1:
+            raise ValueError("Размер порции должен быть положительным")
+
+        saved = 0
+        iterator = iter(results)
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            while True:
+                chunk = list(itertools.islice(iterator, chunk_size))
+                if not chunk:
+                    break
+                self._insert_chunk(cursor, chunk)
+                saved += len(chunk)
+        self.invalidate_cache()
+        return saved
+
+    def _insert_chunk(self, cursor: sqlite3.Cursor, chunk: List[Tuple]) -> None:
+        # Вставка порции результатов и сводное обновление статистики
+        now = datetime.now()
+        rows = []
+        players: Dict[str, List] = {}
+        levels: Dict[int, List] = {}
+        histogram: Dict[Tuple[int, int, int], int] = {}
+        for result in chunk:
+            player_name, score, moves_used, total_moves, level, victory = result[:6]
+            game_date = result[6] if len(result) > 6 else now
+            win = 1 if victory else 0
+            rows.append((player_name, score, moves_used, total_moves, level, game_date, victory))
+
+            player = players.get(player_name)
+            if player is None:
+                players[player_name] = [player_name, 1, win, score, score, game_date]
+            else:
+                player[1] += 1
+                player[2] += win
+                player[3] += score
+                player[4] = max(player[4], score)
+                player[5] = max(player[5], game_date)
+
+            efficiency = moves_used / total_moves if total_moves else 0
+            stats = levels.get(level)
+            if stats is None:
+                levels[level] = [level, 1, win, score, score, score, efficiency]
+            else:
+                stats[1] += 1
+                stats[2] += win
+                stats[3] += score
+                stats[4] = max(stats[4], score)
+                stats[5] = min(stats[5], score)
+                stats[6] += efficiency
+
+            key = (level, score, moves_used)
+            histogram[key] = histogram.get(key, 0) + 1
+
+        cursor.executemany('''
+            INSERT INTO game_results 
+            (player_name, score, moves_used, total_moves, level, game_date, victory)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        ''', rows)
+        cursor.executemany(PLAYER_STATS_UPSERT, players.values())
+        cursor.executemany(LEVEL_STATS_UPSERT, levels.values())
+        cursor.executemany(SCORE_HISTOGRAM_UPSERT,
+                           [key + (games,) for key, games in histogram.items()])
+
+    @profiled("db.save_game_result_async")
+    def save_game_result_async(self,
+                               player_name: str,
+                               score: int,
+                               moves_used: int,
+                               total_moves: int,
+                               level: int = 1,
+                               victory: bool = True,
+                               callback: Optional[Callable[[Future], None]] = None) -> Future:
+        # Сохранение без ожидания диска: результат встаёт в очередь,
+        # фоновый поток пишет очередь пачками. Future вернёт ID записи,
+        # callback вызывается из потока записи с этим Future.
+        future: Future = Future()
+        if callback is not None:
+            future.add_done_callback(callback)
+        self._ensure_writer()
+        self._write_queue.put(((player_name, score, moves_used, total_moves, level, victory), future))
+        return future
+
+    @profiled("db.flush")
+    def flush(self) -> None:
+        # Ожидание, пока фоновый поток запишет всё, что уже стоит в очереди
+        if self._writer is not None:
+            self._write_queue.join()
+
+    def _ensure_writer(self) -> None:
+        with self._writer_lock:
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._writer_loop,
+                                                name="GameDatabaseWriter", daemon=True)
+                self._writer.start()
+
+    def _writer_loop(self) -> None:
+        while True:
+            item = self._write_queue.get()
+            if item is None:
+                self._write_queue.task_done()
+                return
+
+            batch = [item]
+            stop = False
+            while len(batch) < WRITE_BATCH_SIZE:
+                try:
+                    item = self._write_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    # Сигнал остановки: дописываем пачку и выходим
+                    self._write_queue.task_done()
+                    stop = True
+                    break
+                batch.append(item)
+
+            self._write_batch(batch)
+            for _ in batch:
+                self._write_queue.task_done()
+            if stop:
+                return
+
+    @profiled("db.write_batch")
+    def _write_batch(self, batch: List[Tuple[tuple, Future]]) -> None:
+        # Вся пачка записывается одной транзакцией
+        try:
+            with self._connect() as conn:
+                cursor = conn.cursor()
+                game_ids = [self._insert_result(cursor, *args) for args, _ in batch]
+        except Exception as e:
+            for _, future in batch:
+                future.set_exception(e)
+            return
+
+        self.invalidate_cache()
+        for (_, future), game_id in zip(batch, game_ids):
+            future.set_result(game_id)
+
+    @profiled("db.get_top_scores")
+    @cached_query
     def get_top_scores(self, 
                       level: Optional[int] = None, 
                       limit: int = 10) -> List[Tuple]:
         # Получение лучших результатов
-        with sqlite3.connect(self.db_path, detect_types=sqlite3.PARSE_DECLTYPES) as conn:
+        return self.get_top_scores_page(level, limit)[0]
+    
+    @profiled("db.get_top_scores_page")
+    @cached_query
+    def get_top_scores_page(self,
+                            level: Optional[int] = None,
+                            limit: int = 10,
+                            after: Optional[TopScoresCursor] = None
+                            ) -> Tuple[List[Tuple], Optional[TopScoresCursor]]:
+        # Страница лучших результатов, начиная после ключа after
+        # (None — с первого места). Возвращает строки и ключ следующей
+        # страницы; None, если дальше результатов нет.
+        params: List[Any] = []
+        if level is not None:
+            params.append(level)
+        if after is not None:
+            score, moves_used, game_id = after
+            params += [score, score, moves_used, moves_used, game_id]
+        params.append(limit + 1)
+        
+        with self._connect() as conn:
             cursor = conn.cursor()
-            
-            if level is not None:
-                cursor.execute('''
-                    SELECT player_name, score, moves_used, total_moves, game_date, level
-                    FROM game_results 
-                    WHERE level = ? AND victory = 1
-                    ORDER BY score DESC, moves_used ASC
-                    LIMIT ?
-                ''', (level, limit))
-            else:
-                cursor.execute('''
-                    SELECT player_name, score, moves_used, total_moves, game_date, level
-                    FROM game_results 
-                    WHERE victory = 1
-                    ORDER BY score DESC, moves_used ASC
-                    LIMIT ?
-                ''', (limit,))
-            
-            return cursor.fetchall()
+            cursor.execute(top_scores_query(level is not None, after is not None), params)
+            rows = cursor.fetchall()
+        
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            _, score, moves_used, _, _, _, game_id = rows[-1]
+            next_cursor = (score, moves_used, game_id)
+        return [row[:-1] for row in rows], next_cursor
     
+    @profiled("db.get_recent_games")
+    @cached_query
     def get_recent_games(self, 
                         player_name: Optional[str] = None, 
                         limit: int = 10) -> List[Tuple]:
         # Получение последних игр
-        with sqlite3.connect(self.db_path, detect_types=sqlite3.PARSE_DECLTYPES) as conn:
+        return self.get_recent_games_page(player_name, limit)[0]
+    
+    @profiled("db.get_recent_games_page")
+    @cached_query
+    def get_recent_games_page(self,
+                              player_name: Optional[str] = None,
+                              limit: int = 10,
+                              after: Optional[RecentGamesCursor] = None
+                              ) -> Tuple[List[Tuple], Optional[RecentGamesCursor]]:
+        # Страница последних игр, начиная после ключа after (None — с самой
+        # новой). Возвращает строки и ключ следующей страницы или None.
+        params: List[Any] = []
+        if player_name:
+            params.append(player_name)
+        if after is not None:
+            game_date, game_id = after
+            params += [game_date, game_date, game_id]
+        params.append(limit + 1)
+        
+        with self._connect() as conn:
             cursor = conn.cursor()
-            
-            if player_name:
-                cursor.execute('''
-                    SELECT player_name, score, moves_used, total_moves, game_date, level, victory
-                    FROM game_results 
-                    WHERE player_name = ?
-                    ORDER BY game_date DESC
-                    LIMIT ?
-                ''', (player_name, limit))
-            else:
-                cursor.execute('''
-                    SELECT player_name, score, moves_used, total_moves, game_date, level, victory
-                    FROM game_results 
-                    ORDER BY game_date DESC
-                    LIMIT ?
-                ''', (limit,))
-            
-            return cursor.fetchall()
+            cursor.execute(recent_games_query(bool(player_name), after is not None), params)
+            rows = cursor.fetchall()
+        
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            game_date, game_id = rows[-1][4], rows[-1][-1]
+            next_cursor = (game_date, game_id)
+        return [row[:-1] for row in rows], next_cursor
     
+    @profiled("db.get_player_stats")
+    @cached_query
     def get_player_stats(self, player_name: str) -> Optional[Tuple]:
         # Получение статистики игрока
-        with sqlite3.connect(self.db_path, detect_types=sqlite3.PARSE_DECLTYPES) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute('''
                 SELECT * FROM player_stats WHERE player_name = ?
             ''', (player_name,))
             return cursor.fetchone()
     
+    @profiled("db.get_level_stats")
+    @cached_query
     def get_level_stats(self, level: int) -> Tuple:
-        # Получение статистики по уровню
-        with sqlite3.connect(self.db_path, detect_types=sqlite3.PARSE_DECLTYPES) as conn:
+        # Получение статистики по уровню из сводной таблицы
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute('''
                 SELECT 
-                    COUNT(*) as total_games,
-                    SUM(CASE WHEN victory = 1 THEN 1 ELSE 0 END) as wins,
-                    AVG(score) as avg_score,
-                    MAX(score) as max_score,
-                    MIN(score) as min_score,
-                    AVG(moves_used * 1.0 / total_moves) * 100 as avg_efficiency
-                FROM game_results
+                    total_games,
+                    total_wins as wins,
+                    total_score * 1.0 / total_games as avg_score,
+                    max_score,
+                    min_score,
+                    efficiency_sum / total_games * 100 as avg_efficiency
+                FROM level_stats
                 WHERE level = ?
             ''', (level,))
-            return cursor.fetchone()
+            return cursor.fetchone() or (0, None, None, None, None, None)
     
+    @profiled("db.get_score_rank")
+    @cached_query
+    def get_score_rank(self, level: int, score: int, moves_used: int) -> Tuple[int, int, float]:
+        # Место результата среди всех игр уровня: (место, всего игр, процент
+        # лучших, в который он входит). Порядок тот же, что в таблице рекордов:
+        # больше очков, при равенстве меньше ходов; равные результаты делят место.
+        # Считается по распределению score_histogram, а не по game_results,
+        # поэтому не зависит от числа сохранённых игр.
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT 
+                    COALESCE(SUM(games), 0)
+                FROM score_histogram
+                WHERE level = ? AND score >= ?
+                  AND (score > ? OR moves_used < ?)
+            ''', (level, score, score, moves_used))
+            better = cursor.fetchone()[0]
+            cursor.execute('SELECT total_games FROM level_stats WHERE level = ?', (level,))
+            row = cursor.fetchone()
+        
+        total = row[0] if row else 0
+        rank = better + 1
+        total = max(total, rank)
+        return rank, total, rank / total * 100
+    
+    @profiled("db.get_global_stats")
+    @cached_query
     def get_global_stats(self) -> Tuple:
-        # Получение статистики по всем играм
-        with sqlite3.connect(self.db_path, detect_types=sqlite3.PARSE_DECLTYPES) as conn:
+        # Получение статистики по всем играм: сумма по уровням из сводной таблицы
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute('''
                 SELECT 
-                    COUNT(*) as total_games,
-                    SUM(CASE WHEN victory = 1 THEN 1 ELSE 0 END) as wins,
-                    AVG(score) as avg_score,
-                    MAX(score) as max_score,
-                    MIN(score) as min_score,
-                    COUNT(DISTINCT player_name) as unique_players
-                FROM game_results
+                    COALESCE(SUM(total_games), 0) as total_games,
+                    SUM(total_wins) as wins,
+                    SUM(total_score) * 1.0 / SUM(total_games) as avg_score,
+                    MAX(max_score) as max_score,
+                    MIN(min_score) as min_score,
+                    (SELECT COUNT(*) FROM player_stats) as unique_players
+                FROM level_stats
             ''')
             return cursor.fetchone()
     
-# Создаем экземпляр базы данных для удобства использования
-db = GameDatabase()
+# Глобальный экземпляр базы игры создаётся при первом обращении к database.db
+# или get_database(), а не при импорте модуля: CLI, бенчмарк и game_session --db
+# работают со своими файлами и не должны обновлять схему game_results.db.
+_db: Optional[GameDatabase] = None
+_db_lock = threading.Lock()
+
+
+def __getattr__(name: str) -> Any:
+    # "from database import db" получает глобальный экземпляр через get_database()
+    if name == "db":
+        return get_database()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 def init_database(db_path: str = "game_results.db") -> GameDatabase:
     # Инициализация базы данных с указанным путем
@@ -208,18 +903,55 @@ def init_database(db_path: str = "game_results.db") -> GameDatabase:
 
 
 def get_database() -> GameDatabase:
-    # Получение глобального экземпляра базы данных
-    return db
+    # Получение глобального экземпляра базы данных; создаётся при первом вызове
+    global _db
+    with _db_lock:
+        if _db is None:
+            _db = GameDatabase()
+            atexit.register(_db.close)
+        return _db
 
 
 if __name__ == "__main__":
-    # Тестирование базы данных
-    test_db = GameDatabase("test.db")
-    print("База данных инициализирована успешно!")
-    print("Доступные методы:")
-    print("save_game_result(): сохранение результата игры")
-    print("get_top_scores(): получение лучших результатов")
-    print("get_recent_games(): получение последних игр")
-    print("get_player_stats(): статистика игрока")
-    print("get_level_stats(): статистика уровня")
-    print("get_global_stats(): глобальная статистика")
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Обслуживание базы результатов")
+    parser.add_argument("command", nargs="?", default="info",
+                        choices=["info", "status", "migrate", "rebuild-stats", "check-plans"])
+    parser.add_argument("--db", default="test.db", help="путь к базе SQLite")
+    parser.add_argument("--to", type=int, help="версия схемы для migrate (по умолчанию последняя)")
+    parser.add_argument("--chunk-size", type=int, default=MIGRATION_CHUNK_SIZE,
+                        help="строк в одной транзакции дозаполнения")
+    args = parser.parse_args()
+
+    # status и migrate открывают базу без автоматического обновления схемы
+    test_db = GameDatabase(args.db, auto_migrate=args.command not in ("status", "migrate"))
+    if args.command == "status":
+        print(f"Версия схемы: {test_db.schema_version()} из {SCHEMA_VERSION}")
+        for migration in MIGRATIONS:
+            mark = "+" if migration.version <= test_db.schema_version() else " "
+            print(f"  [{mark}] {migration.version}: {migration.description}")
+    elif args.command == "migrate":
+        version = test_db.migrate(args.to, args.chunk_size, progress=print)
+        print(f"Версия схемы: {version}")
+    elif args.command == "rebuild-stats":
+        test_db.rebuild_level_stats()
+        print(f"Сводная статистика уровней пересчитана: {args.db}")
+    elif args.command == "check-plans":
+        problems = test_db.check_query_plans()
+        for problem in problems:
+            print(problem)
+        print("Планы запросов в порядке" if not problems else f"Проблем: {len(problems)}")
+        test_db.close()
+        raise SystemExit(1 if problems else 0)
+    else:
+        # Тестирование базы данных
+        print("База данных инициализирована успешно!")
+        print("Доступные методы:")
+        print("save_game_result(): сохранение результата игры")
+        print("get_top_scores(): получение лучших результатов")
+        print("get_recent_games(): получение последних игр")
+        print("get_player_stats(): статистика игрока")
+        print("get_level_stats(): статистика уровня")
+        print("get_global_stats(): глобальная статистика")
+    test_db.close()
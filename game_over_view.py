@@ -1,5 +1,6 @@
 import arcade
 from database import db
+from ui_batch import UIBatch
 
 
 SCREEN_WIDTH = 800
@@ -21,6 +22,15 @@ class GameOverView(arcade.View):
         self.completion_percent = min(100, (score / max_possible_score) * 100) if max_possible_score > 0 else 0
         self.is_win = score > 0
         
+        # Место результата на уровне: (место, всего игр, процент лучших).
+        # Появляется, когда фоновая запись сохранит игру.
+        self.rank_info = None
+        
+        # Экран собирается один раз при показе; меняется только подпись с местом
+        self.ui = None
+        self.rank_label = None
+        self.shown_rank_info = None
+        
         # Сохраняем результат в базу данных
         self.save_to_database()
         
@@ -33,52 +43,81 @@ class GameOverView(arcade.View):
             self.button_y_positions = [225, 150, 75]
     
     def save_to_database(self):
-        # Сохранение результата игры в базу данных 
+        # Сохранение результата игры в базу данных.
+        # Запись идёт в фоновом потоке, поэтому переход на экран не ждёт диска.
         try:
-            db.save_game_result(
+            db.save_game_result_async(
                 player_name=self.player_name,
                 score=self.score,
                 moves_used=self.moves_used,
                 total_moves=self.total_moves,
                 level=self.level,
-                victory=self.is_win
+                victory=self.is_win,
+                callback=self._report_saved
             )
         except Exception as e:
             # Внутренняя ошибка
             print(f"Ошибка при сохранении в БД: {e}")
+
+    def _report_saved(self, future):
+        # Вызывается из потока записи: сообщаем об ошибке, иначе узнаём место
+        # уже с учётом этой игры. Отрисовка подхватит rank_info в следующем кадре.
+        if future.exception() is not None:
+            print(f"Ошибка при сохранении в БД: {future.exception()}")
+            return
+        try:
+            self.rank_info = db.get_score_rank(self.level, self.score, self.moves_used)
+        except Exception as e:
+            print(f"Ошибка при получении места: {e}")
     
     def on_show_view(self):
         arcade.set_background_color(arcade.color.DARK_GRAY)
+        if self.ui is None:
+            self.ui = self.build_ui()
         
     def on_draw(self):
         self.clear()
         
+        # Место приходит из потока записи — подпись обновляется один раз
+        if self.rank_info is not self.shown_rank_info:
+            self.shown_rank_info = self.rank_info
+            rank, total, top_percent = self.rank_info
+            self.rank_label.text = f"Место #{rank} из {total} — лучшие {max(top_percent, 0.1):.1f}%"
+        
+        self.ui.draw()
+    
+    def build_ui(self):
+        ui = UIBatch()
+        
         # Фон
-        arcade.draw_lrbt_rectangle_filled(
-            0, SCREEN_WIDTH, 0, SCREEN_HEIGHT,
-            arcade.color.GRAY
-        )
+        ui.add_rect(0, SCREEN_WIDTH, 0, SCREEN_HEIGHT, arcade.color.GRAY)
         
         # Заголовок в зависимости от результата
         status_text = "ПОБЕДА!" if self.is_win else "ПОРАЖЕНИЕ"
         status_color = arcade.color.PALE_PINK if self.is_win else arcade.color.RED
         
-        title = arcade.Text(
+        ui.add_text(
             status_text,
             SCREEN_WIDTH // 2, SCREEN_HEIGHT - 100,
             status_color, 48,
             anchor_x="center", font_name="Arial", bold=True
         )
-        title.draw()
         
         # Подзаголовок с уровнем
-        subtitle = arcade.Text(
+        ui.add_text(
             f"Уровень {self.level}",
             SCREEN_WIDTH // 2, SCREEN_HEIGHT - 150,
             arcade.color.LIGHT_GRAY, 24,
             anchor_x="center", font_name="Arial"
         )
-        subtitle.draw()
+        
+        # Место среди всех игр уровня, пока пустое
+        self.rank_label = ui.add_text(
+            "",
+            SCREEN_WIDTH // 2, SCREEN_HEIGHT - 185,
+            arcade.color.GOLD, 18,
+            anchor_x="center", font_name="Arial"
+        )
         
         # Статистика игры
         y = SCREEN_HEIGHT - 220
@@ -90,20 +129,20 @@ class GameOverView(arcade.View):
         ]
         
         for text, color in stats_items:
-            stat_text = arcade.Text(
+            ui.add_text(
                 text,
                 SCREEN_WIDTH // 2, y,
                 color, 22,
                 anchor_x="center", font_name="Arial"
             )
-            stat_text.draw()
             y -= 50
         
         # Кнопки
-        self.draw_buttons()
+        self.build_buttons(ui)
+        return ui
     
-    def draw_buttons(self):
-        """Отрисовка кнопок"""
+    def build_buttons(self, ui):
+        """Сборка кнопок"""
         colors = {
             "ПОВТОРИТЬ УРОВЕНЬ": arcade.color.LIGHT_BLUE,
             "СЛЕДУЮЩИЙ УРОВЕНЬ": arcade.color.LIGHT_BLUE,
@@ -114,35 +153,17 @@ class GameOverView(arcade.View):
         for y_pos, text in zip(self.button_y_positions, self.button_texts):
             color = colors.get(text, arcade.color.GRAY)
             
-            # Фон кнопки
-            arcade.draw_lrbt_rectangle_filled(
+            ui.add_button(
                 left=SCREEN_WIDTH // 2 - 200,
                 right=SCREEN_WIDTH // 2 + 200,
                 bottom=y_pos - 19,
                 top=y_pos + 25,
-                color=color
-            )
-            
-            # Рамка кнопки
-            arcade.draw_lrbt_rectangle_outline(
-                left=SCREEN_WIDTH // 2 - 200,
-                right=SCREEN_WIDTH // 2 + 200,
-                bottom=y_pos - 19,
-                top=y_pos + 25,
-                color=arcade.color.WHITE,
-                border_width=2
-            )
-            
-            # Текст кнопки
-            arcade.draw_text(
-                text,
-                SCREEN_WIDTH // 2,
-                y_pos,
-                arcade.color.WHITE,
+                fill_color=color,
+                border_color=arcade.color.WHITE,
+                border_width=2,
+                text=text,
+                text_y=y_pos,
                 font_size=20,
-                anchor_x="center",
-                anchor_y="center",
-                bold=True,
                 font_name="Arial"
             )
     
@@ -174,11 +195,11 @@ class GameOverView(arcade.View):
     def restart_level(self):
         # Перезапуск текущего уровня
         if self.level == 1:
-            from level1 import GameView as LevelView
+            from level_first import GameView as LevelView
         elif self.level == 2:
-            from level2 import GameView as LevelView
+            from level_second import GameView as LevelView
         elif self.level == 3:
-            from level3 import GameView as LevelView
+            from level_third import GameView as LevelView
         else:
             return
         
@@ -196,9 +217,9 @@ class GameOverView(arcade.View):
             return
             
         if next_level == 2:
-            from level2 import GameView as LevelView
+            from level_second import GameView as LevelView
         elif next_level == 3:
-            from level3 import GameView as LevelView
+            from level_third import GameView as LevelView
         else:
             return
         
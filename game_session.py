@@ -0,0 +1,214 @@
+# Игра без окна, текстур и звуков: те же правила, что и в GameView
+# (сдвиг с переходом через край, поиск совпадений, удаление, падение плиток,
+# очки и START_MOVES), но без arcade. Используется для настройки уровней
+# и нагрузочной проверки базы результатов.
+#
+# Запуск: python game_session.py --games 1000 --policy greedy --level 1 2 3
+import argparse
+import random
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from level_config import LEVELS, START_MOVES, TILE_TYPES
+from match_engine import BitBoard, generate_layout
+
+NUM_TILE_TYPES = len(TILE_TYPES)
+DIRECTIONS = ["up", "down", "left", "right"]
+
+Move = Tuple[int, int, str]
+
+
+class GameSession:
+    def __init__(self, level: int = 1, seed: Optional[int] = None):
+        self.level = level
+        self.config = LEVELS[level]
+        self.rows = self.config["rows"]
+        self.cols = self.config["cols"]
+        self.rng = random.Random(seed)
+
+        self.board = BitBoard(self.rows, self.cols, NUM_TILE_TYPES)
+        self.moves_left = START_MOVES
+        self.moves_used = 0
+        self.score = 0
+        self.game_over = False
+
+        self.setup()
+
+    @property
+    def victory(self) -> bool:
+        return self.score > 0
+
+    def setup(self) -> None:
+        # Начальное поле, как в GameView.setup / generate_initial_grid
+        if self.config["match_free_start"]:
+            layout = generate_layout(self.rows, self.cols, NUM_TILE_TYPES,
+                                     self.config["min_match_length"], self.rng)
+        else:
+            layout = [[self.rng.randint(0, NUM_TILE_TYPES - 1) for _ in range(self.cols)]
+                      for _ in range(self.rows)]
+
+        for row in range(self.rows):
+            for col in range(self.cols):
+                self.board.set(row, col, layout[row][col])
+
+        if not self.config["match_free_start"]:
+            self.resolve_cascade()
+
+    def target_cell(self, row: int, col: int, direction: str) -> Tuple[int, int]:
+        # Соседняя клетка с циклическим сдвигом, как в GameView.shift_tile
+        if direction == "up":
+            return (row - 1) % self.rows, col
+        if direction == "down":
+            return (row + 1) % self.rows, col
+        if direction == "left":
+            return row, (col - 1) % self.cols
+        if direction == "right":
+            return row, (col + 1) % self.cols
+        raise ValueError(f"Неизвестное направление: {direction}")
+
+    def legal_moves(self) -> List[Move]:
+        return [(row, col, direction)
+                for row in range(self.rows)
+                for col in range(self.cols)
+                for direction in DIRECTIONS]
+
+    def shift_tile(self, row: int, col: int, direction: str) -> int:
+        # Ход игрока; возвращает заработанные очки
+        if self.game_over:
+            raise ValueError("Игра уже закончена")
+
+        self.moves_left -= 1
+        self.moves_used += 1
+        new_row, new_col = self.target_cell(row, col, direction)
+        self.board.swap(row, col, new_row, new_col)
+
+        gained, has_matches = self.check_matches()
+
+        # Как и в GameView, игра заканчивается сразу после последнего хода:
+        # падение плиток после него уже не засчитывается
+        if self.moves_left <= 0:
+            self.game_over = True
+        elif has_matches:
+            # Ряды хода уже удалены, каскад начинается с падения плиток
+            gained += self.resolve_cascade(already_matched=True)
+        return gained
+
+    def check_matches(self) -> Tuple[int, bool]:
+        matches, points, _ = self.board.find_matches(self.config["min_match_length"],
+                                                     self.config["match_points"],
+                                                     incremental=True)
+        self.score += points
+        for row, col in matches:
+            self.board.clear(row, col)
+        return points, bool(matches)
+
+    def fill_empty_spaces(self) -> None:
+        # Плитки падают вниз, пустые клетки сверху заполняются новыми
+        for col in range(self.cols):
+            column = [self.board.get(row, col) for row in range(self.rows - 1, -1, -1)]
+            column = [tile_type for tile_type in column if tile_type is not None]
+
+            for i, tile_type in enumerate(column):
+                self.board.set(self.rows - 1 - i, col, tile_type)
+            for i in range(len(column), self.rows):
+                self.board.set(self.rows - 1 - i, col, self.rng.randint(0, NUM_TILE_TYPES - 1))
+
+    def resolve_cascade(self, already_matched: bool = False) -> int:
+        # Удаление, падение и повторная проверка, пока на поле есть ряды.
+        # already_matched: ряды уже удалены вызывающим, осталось заполнить пустоты.
+        if already_matched:
+            gained, has_matches = 0, True
+        else:
+            gained, has_matches = self.check_matches()
+        while has_matches:
+            self.fill_empty_spaces()
+            points, has_matches = self.check_matches()
+            gained += points
+        return gained
+
+    def move_points(self, row: int, col: int, direction: str) -> int:
+        # Очки, которые ход принесёт сразу, без изменения текущего поля
+        board = self.board.copy()
+        new_row, new_col = self.target_cell(row, col, direction)
+        board.swap(row, col, new_row, new_col)
+        _, points, _ = board.find_matches(self.config["min_match_length"],
+                                          self.config["match_points"],
+                                          incremental=True)
+        return points
+
+
+def random_policy(session: GameSession, rng: random.Random) -> Move:
+    return rng.choice(session.legal_moves())
+
+
+def greedy_policy(session: GameSession, rng: random.Random) -> Move:
+    # Ход с наибольшими немедленными очками, при равенстве — случайный
+    best_points = -1
+    best_moves: List[Move] = []
+    for move in session.legal_moves():
+        points = session.move_points(*move)
+        if points > best_points:
+            best_points = points
+            best_moves = [move]
+        elif points == best_points:
+            best_moves.append(move)
+    return rng.choice(best_moves)
+
+
+POLICIES: Dict[str, Callable[[GameSession, random.Random], Move]] = {
+    "random": random_policy,
+    "greedy": greedy_policy,
+}
+
+
+def play_game(level: int, seed: int, policy: Callable[[GameSession, random.Random], Move]) -> GameSession:
+    session = GameSession(level, seed)
+    rng = random.Random(seed)
+    while not session.game_over:
+        session.shift_tile(*policy(session, rng))
+    return session
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Пакетный прогон игр без окна")
+    parser.add_argument("--level", type=int, nargs="+", default=[1, 2, 3], choices=sorted(LEVELS))
+    parser.add_argument("--games", type=int, default=1000, help="число игр на уровень")
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="random")
+    parser.add_argument("--seed", type=int, default=0, help="сид первой игры, дальше seed + i")
+    parser.add_argument("--db", help="сохранять результаты в указанную базу SQLite")
+    args = parser.parse_args()
+
+    database = None
+    if args.db:
+        from database import GameDatabase
+        database = GameDatabase(args.db)
+
+    policy = POLICIES[args.policy]
+    for level in args.level:
+        total_score = 0
+        wins = 0
+        moves = 0
+        results = []
+        start = time.perf_counter()
+
+        for i in range(args.games):
+            session = play_game(level, args.seed + i, policy)
+            total_score += session.score
+            wins += session.victory
+            moves += session.moves_used
+            if database is not None:
+                results.append((f"bot-{args.policy}", session.score, session.moves_used,
+                                START_MOVES, level, session.victory))
+
+        if database is not None:
+            database.save_game_results_bulk(results)
+
+        elapsed = max(time.perf_counter() - start, 1e-9)
+        print(f"Уровень {level}: {args.games} игр за {elapsed:.2f} с — "
+              f"{args.games / elapsed:.1f} игр/с, {moves / elapsed:.1f} ходов/с, "
+              f"средний счет {total_score / max(args.games, 1):.1f}, "
+              f"побед {wins / max(args.games, 1) * 100:.1f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+# Режим простоя: когда на поле ничего не движется и игрок ничего не делает,
+# окно обновляется и перерисовывается реже. Ввод возвращает полную частоту
+# сразу, ещё до следующего кадра, поэтому задержки отклика не появляется.
+import time
+from typing import Callable
+
+import arcade
+from arcade.gl import geometry
+
+ACTIVE_RATE = 1 / 60
+IDLE_RATE = 1 / 10
+# Сколько секунд поле должно стоять без анимаций и ввода до перехода в простой
+IDLE_DELAY = 0.5
+# Шейдеры arcade для вывода текстуры на весь экран
+FRAME_VERTEX_SHADER = ":resources:shaders/texture_default_projection_vs.glsl"
+FRAME_FRAGMENT_SHADER = ":resources:shaders/texture_fs.glsl"
+
+
+class IdleThrottle:
+    def __init__(self, active_rate: float = ACTIVE_RATE, idle_rate: float = IDLE_RATE,
+                 idle_delay: float = IDLE_DELAY):
+        self.active_rate = active_rate
+        self.idle_rate = idle_rate
+        self.idle_delay = idle_delay
+        self.idle = False
+        self.last_activity = time.perf_counter()
+        # Умеет ли окно само реже вызывать on_draw; если нет, сцена в простое
+        # рисуется в текстуру frame, а кадры между перерисовками выводят её
+        self.draw_rate_supported = False
+        self.last_draw = 0.0
+        self.frame = None
+        self.frame_ready = False
+        self.quad = None
+        self.program = None
+
+    def wake(self) -> None:
+        # Ввод или запланированное событие: полная частота с ближайшего кадра
+        self.last_activity = time.perf_counter()
+        self.frame_ready = False
+        if self.idle:
+            self.idle = False
+            self.set_rate(self.active_rate)
+
+    def update(self, busy: bool) -> None:
+        # Вызывается из on_update; busy — идут анимации или ждут отложенные шаги
+        if busy:
+            self.wake()
+        elif not self.idle and time.perf_counter() - self.last_activity >= self.idle_delay:
+            self.idle = True
+            self.set_rate(self.idle_rate)
+
+    def draw(self, draw_scene: Callable[[], None], background) -> None:
+        # Вызывается из on_draw вместо очистки окна и отрисовки сцены.
+        # На содержимое заднего буфера после flip полагаться нельзя, поэтому
+        # каждый кадр перерисовывается целиком: в простое сцена рисуется
+        # в текстуру не чаще idle_rate, а остальные кадры выводят эту текстуру.
+        # Всё, что рисуется поверх экрана (таблица замеров), тоже ложится на чистый кадр.
+        window = arcade.get_window()
+        if not self.idle or self.draw_rate_supported:
+            window.clear(background)
+            draw_scene()
+            return
+
+        now = time.perf_counter()
+        size = window.get_framebuffer_size()
+        if (not self.frame_ready or self.frame.size != tuple(size)
+                or now - self.last_draw >= self.idle_rate):
+            self.capture(window, size, draw_scene, background)
+            self.last_draw = now
+        self.show_frame(window)
+
+    def capture(self, window, size, draw_scene: Callable[[], None], background) -> None:
+        # window.clear() очищает экран, а не текущий буфер, поэтому текстура
+        # очищается отдельно и сцена рисуется без очистки
+        ctx = window.ctx
+        if self.frame is None or self.frame.size != tuple(size):
+            self.frame = ctx.framebuffer(color_attachments=[ctx.texture(tuple(size))])
+        with self.frame.activate():
+            self.frame.clear(background)
+            draw_scene()
+        self.frame_ready = True
+
+    def show_frame(self, window) -> None:
+        ctx = window.ctx
+        if self.quad is None:
+            self.quad = geometry.quad_2d_fs()
+            self.program = ctx.load_program(vertex_shader=FRAME_VERTEX_SHADER,
+                                            fragment_shader=FRAME_FRAGMENT_SHADER)
+        # Кадр копируется как есть: смешивание с прошлым кадром не нужно
+        self.frame.color_attachments[0].use(0)
+        with ctx.enabled_only():
+            self.quad.render(self.program)
+
+    def set_rate(self, rate: float) -> None:
+        window = arcade.get_window()
+        window.set_update_rate(rate)
+        # set_draw_rate есть не во всех версиях arcade
+        self.draw_rate_supported = hasattr(window, "set_draw_rate")
+        if self.draw_rate_supported:
+            window.set_draw_rate(rate)
@@ -0,0 +1,185 @@
+import arcade
+from database import db
+from ui_batch import UIBatch
+
+
+SCREEN_WIDTH = 800
+SCREEN_HEIGHT = 600
+
+# Сколько строк видно на экране и сколько подгружается за один запрос
+VISIBLE_ROWS = 10
+PAGE_SIZE = 20
+ROW_HEIGHT = 36
+LIST_TOP = SCREEN_HEIGHT - 170
+
+# Фильтр по уровню: None — все уровни
+LEVEL_FILTERS = [None, 1, 2, 3]
+MODES = ["top", "recent"]
+
+
+class LeaderboardView(arcade.View):
+    # Прокручиваемая таблица рекордов и история игр.
+    # Строки подгружаются страницами по ключу последней загруженной строки,
+    # поэтому прокрутка вглубь стоит столько же, сколько первая страница.
+
+    def __init__(self, level=None, mode="top"):
+        super().__init__()
+        self.window = None
+        self.level = level
+        self.mode = mode
+        self.ui = None
+        self.reset_rows()
+
+    def reset_rows(self):
+        # Сброс загруженных строк при смене режима или уровня
+        self.rows = []
+        self.next_cursor = None
+        self.exhausted = False
+        self.error = None
+        self.scroll = 0
+        self.load_more()
+        self.build_ui()
+
+    def load_more(self):
+        # Загрузка следующей страницы
+        if self.exhausted:
+            return
+        try:
+            if self.mode == "top":
+                rows, self.next_cursor = db.get_top_scores_page(
+                    level=self.level, limit=PAGE_SIZE, after=self.next_cursor)
+            else:
+                rows, self.next_cursor = db.get_recent_games_page(
+                    limit=PAGE_SIZE, after=self.next_cursor)
+        except Exception as e:
+            self.error = str(e)
+            self.exhausted = True
+            return
+        self.rows.extend(rows)
+        self.exhausted = self.next_cursor is None
+
+    def scroll_by(self, delta):
+        # Прокрутка на delta строк; недостающие страницы догружаются
+        target = max(self.scroll + delta, 0)
+        while target + VISIBLE_ROWS > len(self.rows) and not self.exhausted:
+            self.load_more()
+        self.scroll = min(target, max(len(self.rows) - VISIBLE_ROWS, 0))
+        self.build_ui()
+
+    def format_row(self, index, row):
+        if self.mode == "top":
+            player_name, score, moves_used, total_moves, game_date, level = row
+            return (f"{index + 1}. {player_name[:12]}: {score} очков "
+                    f"({moves_used}/{total_moves} ходов), уровень {level}")
+        player_name, score, moves_used, total_moves, game_date, level, victory = row
+        result = "победа" if victory else "поражение"
+        return (f"{game_date:%d.%m %H:%M} {player_name[:12]}: {score} очков, "
+                f"уровень {level}, {result}")
+
+    def build_ui(self):
+        # Экран пересобирается только при прокрутке или смене фильтра, а не каждый кадр
+        if self.ui is not None:
+            self.ui.delete()
+        ui = UIBatch()
+
+        # История показывает все уровни, фильтр по уровню — только у рекордов
+        if self.mode == "top":
+            title = "ЛУЧШИЕ РЕЗУЛЬТАТЫ"
+            level = "все уровни" if self.level is None else f"уровень {self.level}"
+            hint = f"{level}  (←/→ — уровень, TAB — история игр)"
+        else:
+            title = "ПОСЛЕДНИЕ ИГРЫ"
+            hint = "все уровни  (TAB — лучшие результаты)"
+        ui.add_text(title, SCREEN_WIDTH // 2, SCREEN_HEIGHT - 80,
+                    arcade.color.GOLD, 36, anchor_x="center", font_name="Arial")
+        ui.add_text(hint, SCREEN_WIDTH // 2, SCREEN_HEIGHT - 120,
+                    arcade.color.LIGHT_GRAY, 18, anchor_x="center", font_name="Arial")
+
+        if self.error:
+            ui.add_text(f"Ошибка загрузки: {self.error[:50]}...",
+                        SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2,
+                        arcade.color.RED, 20, anchor_x="center", font_name="Arial")
+        elif not self.rows:
+            ui.add_text("Пока нет результатов",
+                        SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2,
+                        arcade.color.LIGHT_GRAY, 24, anchor_x="center", font_name="Arial")
+        else:
+            visible = self.rows[self.scroll:self.scroll + VISIBLE_ROWS]
+            for i, row in enumerate(visible):
+                ui.add_text(self.format_row(self.scroll + i, row),
+                            60, LIST_TOP - i * ROW_HEIGHT,
+                            arcade.color.WHITE, 18, font_name="Arial")
+
+        more = "" if self.exhausted else "+"
+        shown = min(self.scroll + VISIBLE_ROWS, len(self.rows))
+        ui.add_text(f"{self.scroll + 1 if self.rows else 0}–{shown} из {len(self.rows)}{more}  "
+                    f"(↑/↓, колесо мыши, PgUp/PgDn)",
+                    SCREEN_WIDTH // 2, 125,
+                    arcade.color.LIGHT_GRAY, 16, anchor_x="center", font_name="Arial")
+
+        # Кнопка возврата
+        ui.add_button(
+            left=SCREEN_WIDTH // 2 - 100,
+            right=SCREEN_WIDTH // 2 + 100,
+            bottom=50,
+            top=100,
+            fill_color=arcade.color.DARK_RED,
+            border_color=arcade.color.RED,
+            border_width=2,
+            text="НАЗАД",
+            text_y=75,
+            font_size=22,
+            font_name="Arial"
+        )
+        self.ui = ui
+
+    def on_show_view(self):
+        arcade.set_background_color(arcade.color.GRAY)
+
+    def on_draw(self):
+        self.clear()
+        self.ui.draw()
+
+    def on_mouse_scroll(self, x, y, scroll_x, scroll_y):
+        # Колесо вверх — к началу списка
+        self.scroll_by(-int(scroll_y))
+
+    def on_mouse_press(self, x, y, button, modifiers):
+        # Проверка кнопки возврата
+        back_left = SCREEN_WIDTH // 2 - 100
+        back_right = SCREEN_WIDTH // 2 + 100
+        back_top = 100
+        back_bottom = 50
+
+        if back_left <= x <= back_right and back_bottom <= y <= back_top:
+            self.return_to_menu()
+
+    def on_key_press(self, key, modifiers):
+        # Прокрутка, смена уровня и режима
+        if key == arcade.key.ESCAPE:
+            self.return_to_menu()
+        elif key == arcade.key.DOWN:
+            self.scroll_by(1)
+        elif key == arcade.key.UP:
+            self.scroll_by(-1)
+        elif key == arcade.key.PAGEDOWN:
+            self.scroll_by(VISIBLE_ROWS)
+        elif key == arcade.key.PAGEUP:
+            self.scroll_by(-VISIBLE_ROWS)
+        elif key == arcade.key.HOME:
+            self.scroll_by(-self.scroll)
+        elif key in (arcade.key.LEFT, arcade.key.RIGHT) and self.mode == "top":
+            step = 1 if key == arcade.key.RIGHT else -1
+            index = LEVEL_FILTERS.index(self.level)
+            self.level = LEVEL_FILTERS[(index + step) % len(LEVEL_FILTERS)]
+            self.reset_rows()
+        elif key == arcade.key.TAB:
+            self.mode = MODES[(MODES.index(self.mode) + 1) % len(MODES)]
+            self.reset_rows()
+
+    def return_to_menu(self):
+        # Возврат в главное меню
+        from start_view import StartView
+        start_view = StartView()
+        start_view.window = self.window
+        self.window.show_view(start_view)
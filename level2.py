@@ -1,690 +0,0 @@
-import arcade
-import random
-from database import db
-
-
-SCREEN_WIDTH = 800
-SCREEN_HEIGHT = 600
-SCREEN_TITLE = "Puzzle Slider - Level 2"
-
-GRID_ROWS = 4  
-GRID_COLS = 4  
-TILE_SIZE = 100  
-GRID_X = (SCREEN_WIDTH - GRID_COLS * TILE_SIZE) // 2
-GRID_Y = (SCREEN_HEIGHT - GRID_ROWS * TILE_SIZE) // 2
-START_MOVES = 10
-TILE_TYPES = ["red", "blue", "green", "yellow", "purple"]
-
-
-class Tile(arcade.Sprite):
-    def __init__(self, tile_type, row, col):
-        self.tile_type = tile_type # номер цвета от 0-4
-        self.row = row
-        self.col = col
-
-        image_name = TILE_TYPES[tile_type]
-        image_path = f"resources/sprites/tiles/{image_name}.png"
-
-        super().__init__(image_path)
-        self.scale = TILE_SIZE / 100  
-        self.update_position() # Располагаем плитку на экране
-
-    def update_position(self):
-        # Вычисляем координаты центра плитки
-        self.center_x = GRID_X + self.col * TILE_SIZE + TILE_SIZE // 2
-        self.center_y = GRID_Y + (GRID_ROWS - 1 - self.row) * TILE_SIZE + TILE_SIZE // 2
-
-
-class Arrow(arcade.Sprite):
-    def __init__(self, direction, x, y):
-        self.direction = direction # Направление
-        image_path = f"resources/sprites/arrows/{direction}.png"
-
-        super().__init__(image_path)
-        self.scale = 0.6
-        self.center_x = x
-        self.center_y = y
-
-
-class GameView(arcade.View):
-    def __init__(self):
-        super().__init__()
-        self.level = 2
-        self.window = None
-        self.player_name = "Player"
-        
-        # Создаем сетку
-        self.grid = [[None for _ in range(GRID_COLS)] for _ in range(GRID_ROWS)]
-        self.selected_tile = None
-        self.moves_left = START_MOVES
-        self.moves_used = 0
-        self.score = 0
-        self.game_over = False
-        self.showing_stats = False
-        self.showing_high_scores = False
-        self.result_saved = False
-
-        self.tile_list = arcade.SpriteList()
-        self.arrow_list = arcade.SpriteList()
-        
-        self.score_text = None
-        self.moves_text = None
-        self.level_text = None
-        
-        self.setup()
-
-    def setup(self):
-        # Начало уровня
-        self.tile_list.clear()
-        self.arrow_list.clear()
-        self.selected_tile = None
-        self.moves_left = START_MOVES
-        self.moves_used = 0
-        self.score = 0  
-        self.game_over = False
-        self.showing_stats = False
-        self.showing_high_scores = False
-        self.result_saved = False
-        self.score_text = arcade.Text(
-            f"Очки: {self.score}",
-            20, SCREEN_HEIGHT - 40,
-            arcade.color.WHITE, 22,
-            font_name="Arial"
-        )
-        self.moves_text = arcade.Text(
-            f"Ходы: {self.moves_left}",
-            20, SCREEN_HEIGHT - 75,
-            arcade.color.PALE_GREEN, 22,
-            font_name="Arial"
-        )
-        self.level_text = arcade.Text(
-            f"Уровень {self.level}",
-            SCREEN_WIDTH - 150, SCREEN_HEIGHT - 40,
-            arcade.color.LIGHT_GRAY, 22,
-            font_name="Arial"
-        )
- 
-        self.generate_initial_grid()
-
-    def save_game_result(self):
-        # Сохранение результата игры в базу данных
-        if self.result_saved:
-            return
-        
-        victory = self.score > 0
-        total_moves = START_MOVES
-        moves_used = total_moves - self.moves_left
-        
-        try:
-            game_id = db.save_game_result(
-                player_name=self.player_name,
-                score=self.score,
-                moves_used=moves_used,
-                total_moves=total_moves,
-                level=self.level,
-                victory=victory
-            )
-            self.result_saved = True
-            print(f"Результат сохранен (ID: {game_id}): {self.player_name}, "
-                  f"{self.score} очков, {'Победа' if victory else 'Поражение'}")
-        except Exception as e:
-            print(f"Ошибка при сохранении результата: {e}")
-
-    def show_game_over(self):
-        # Экран завершения игры
-        if self.result_saved:
-            return
-        
-        total_moves = START_MOVES
-        moves_used = total_moves - self.moves_left
-        
-        try:
-            from game_over_view import GameOverView
-            final_view = GameOverView(
-                score=self.score,
-                moves_used=moves_used,
-                total_moves=total_moves,
-                level=self.level,
-                player_name=self.player_name
-            )
-            final_view.window = self.window
-            self.window.show_view(final_view)
-        except ImportError as e:
-            print(f"Ошибка импорта GameOverView: {e}")
-            self.save_game_result()
-
-    def return_to_menu(self):
-        # Возврат в главное меню
-        try:
-            from start_view import StartView
-            start_view = StartView()
-            start_view.window = self.window
-            self.window.show_view(start_view)
-        except ImportError:
-            arcade.close_window()
-
-    def generate_initial_grid(self):
-        # Генерирует начальное поле
-        max_attempts = 100
-        
-        for attempt in range(max_attempts):
-            for row in range(GRID_ROWS):
-                for col in range(GRID_COLS):
-                    tile_type = random.randint(0, len(TILE_TYPES) - 1)
-                    tile = Tile(tile_type, row, col)
-                    self.grid[row][col] = tile
-                    self.tile_list.append(tile)
-            
-            if not self.has_matches_in_grid():
-                return
-            
-            self.tile_list.clear()
-            self.grid = [[None for _ in range(GRID_COLS)] for _ in range(GRID_ROWS)]
-        
-        print(f"Предупреждение: не удалось сгенерировать поле без совпадений за {max_attempts} попыток")
-
-    def has_matches_in_grid(self):
-        # Проверяем четверки по горизонтали
-        for row in range(GRID_ROWS):
-            for col in range(GRID_COLS - 3):
-                t0, t1, t2, t3 = (self.grid[row][col], self.grid[row][col + 1], 
-                                  self.grid[row][col + 2], self.grid[row][col + 3])
-                if t0 and t1 and t2 and t3 and t0.tile_type == t1.tile_type == t2.tile_type == t3.tile_type:
-                    return True
-
-        # Проверяем четверки по вертикали
-        for col in range(GRID_COLS):
-            for row in range(GRID_ROWS - 3):
-                t0, t1, t2, t3 = (self.grid[row][col], self.grid[row + 1][col], 
-                                  self.grid[row + 2][col], self.grid[row + 3][col])
-                if t0 and t1 and t2 and t3 and t0.tile_type == t1.tile_type == t2.tile_type == t3.tile_type:
-                    return True
-
-        # Проверяем тройки по горизонтали
-        for row in range(GRID_ROWS):
-            for col in range(GRID_COLS - 2):
-                t0, t1, t2 = self.grid[row][col], self.grid[row][col + 1], self.grid[row][col + 2]
-                if t0 and t1 and t2 and t0.tile_type == t1.tile_type == t2.tile_type:
-                    return True
-
-        # Проверяем тройки по вертикали
-        for col in range(GRID_COLS):
-            for row in range(GRID_ROWS - 2):
-                t0, t1, t2 = self.grid[row][col], self.grid[row + 1][col], self.grid[row + 2][col]
-                if t0 and t1 and t2 and t0.tile_type == t1.tile_type == t2.tile_type:
-                    return True
-
-        return False
-
-    def on_draw(self):
-        self.clear(arcade.color.GRAY)
-
-        # Рисуем границу сетки
-        left = GRID_X - 5
-        right = GRID_X + GRID_COLS * TILE_SIZE + 5
-        bottom = GRID_Y - 5
-        top = GRID_Y + GRID_ROWS * TILE_SIZE + 5
-        arcade.draw_line(left, bottom, right, bottom, arcade.color.WHITE_SMOKE, 3)
-        arcade.draw_line(left, top, right, top, arcade.color.WHITE_SMOKE, 3)
-        arcade.draw_line(left, bottom, left, top, arcade.color.WHITE_SMOKE, 3)
-        arcade.draw_line(right, bottom, right, top, arcade.color.WHITE_SMOKE, 3)
-
-        self.tile_list.draw()
-        self.arrow_list.draw()
-        self.draw_ui()
-
-        if self.game_over:
-            self.draw_game_over_screen()
-
-    def draw_ui(self):
-        # Обновляем текст
-        self.score_text.value = f"Очки: {self.score}"
-        if self.moves_left > 3:
-            self.moves_text.color = arcade.color.PALE_GREEN
-        else:
-            self.moves_text.color = arcade.color.RED
-        self.moves_text.value = f"Ходы: {self.moves_left}"
-        
-        # Рисуем текстовые объекты
-        self.score_text.draw()
-        self.moves_text.draw()
-        self.level_text.draw()
-
-    def draw_game_over_screen(self):
-        # Отрисовка экрана завершения игры
-        arcade.draw_lrbt_rectangle_filled(
-            0, SCREEN_WIDTH, 0, SCREEN_HEIGHT,
-            (0, 0, 0, 180)
-        )
-        
-        if not self.showing_stats and not self.showing_high_scores:
-            # Сохраняем результат
-            if not self.result_saved:
-                self.save_game_result()
-            
-            # Показываем временное сообщение
-            loading_text = arcade.Text(
-                "Загрузка результатов...",
-                SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2,
-                arcade.color.WHITE, 28,
-                anchor_x="center", font_name="Arial"
-            )
-            loading_text.draw()
-        
-        elif self.showing_high_scores:
-            self.show_high_scores_screen()
-        
-        elif self.showing_stats:
-            self.show_statistics_screen()
-
-    def _show_arrows(self):
-        self.arrow_list.clear()
-        cx, cy = self.selected_tile.center_x, self.selected_tile.center_y
-        arrow_offset = TILE_SIZE // 2 + 10
-        offsets = {
-            "up": (0, arrow_offset),
-            "down": (0, -arrow_offset),
-            "left": (-arrow_offset, 0),
-            "right": (arrow_offset, 0)
-        }
-        for direction, (dx, dy) in offsets.items():
-            self.arrow_list.append(Arrow(direction, cx + dx, cy + dy))
-
-    def on_mouse_press(self, x, y, button, modifiers):
-        if self.game_over:
-            return
-
-        for arrow in self.arrow_list:
-            if arrow.collides_with_point((x, y)):
-                self.shift_tile(arrow.direction)
-                self.selected_tile = None
-                self.arrow_list.clear()
-                return
-
-        for tile in self.tile_list:
-            if tile.collides_with_point((x, y)):
-                self.selected_tile = tile
-                self._show_arrows()
-                return
-
-        if self.selected_tile:
-            self.selected_tile = None
-            self.arrow_list.clear()
-
-    def shift_tile(self, direction):
-        if not self.selected_tile or self.moves_left <= 0:
-            return
-
-        self.moves_left -= 1
-        self.moves_used += 1
-        old_row, old_col = self.selected_tile.row, self.selected_tile.col
-
-        if direction == "up":
-            new_row, new_col = (old_row - 1) % GRID_ROWS, old_col
-        elif direction == "down":
-            new_row, new_col = (old_row + 1) % GRID_ROWS, old_col
-        elif direction == "left":
-            new_row, new_col = old_row, (old_col - 1) % GRID_COLS
-        elif direction == "right":
-            new_row, new_col = old_row, (old_col + 1) % GRID_COLS
-
-        other_tile = self.grid[new_row][new_col]
-        self.grid[old_row][old_col] = other_tile
-        self.grid[new_row][new_col] = self.selected_tile
-
-        if other_tile:
-            other_tile.row, other_tile.col = old_row, old_col
-            other_tile.update_position()
-
-        self.selected_tile.row, self.selected_tile.col = new_row, new_col
-        self.selected_tile.update_position()
-
-        # Ищем совпадения после перемещения
-        self.check_matches()
-
-        if self.moves_left <= 0 and not self.game_over:
-            self.game_over = True
-            self.show_game_over()
-
-    def check_matches(self):
-        # Проверка совпадений
-        matches = set()
-        points_to_add = 0
-
-        # Сначала проверяем четверки (40 очков)
-        # Четверки по горизонтали
-        for row in range(GRID_ROWS):
-            for col in range(GRID_COLS - 3):
-                tiles = [self.grid[row][col + i] for i in range(4)]
-                
-                if all(tile is not None for tile in tiles):
-                    first_type = tiles[0].tile_type
-                    if all(tile.tile_type == first_type for tile in tiles):
-                        quad_positions = [(row, col + i) for i in range(4)]
-                        # Проверяем, что эти плитки еще не входят в другие совпадения
-                        if not any(pos in matches for pos in quad_positions):
-                            for pos in quad_positions:
-                                matches.add(pos)
-                            points_to_add += 40
-                            print(f"Найдена четверка в строке {row}, столбец {col}-{col+3}")
-        
-        # Четверки по вертикали (40 очков)
-        for col in range(GRID_COLS):
-            for row in range(GRID_ROWS - 3):
-                tiles = [self.grid[row + i][col] for i in range(4)]
-                
-                if all(tile is not None for tile in tiles):
-                    first_type = tiles[0].tile_type
-                    if all(tile.tile_type == first_type for tile in tiles):
-                        quad_positions = [(row + i, col) for i in range(4)]
-                        if not any(pos in matches for pos in quad_positions):
-                            for pos in quad_positions:
-                                matches.add(pos)
-                            points_to_add += 40
-                            print(f"Найдена четверка в столбце {col}, строка {row}-{row+3}")
-        
-        # Теперь проверяем тройки (30 очков), только те которые не входят в четверки
-        # Тройки по горизонтали
-        for row in range(GRID_ROWS):
-            for col in range(GRID_COLS - 2):
-                tiles = [self.grid[row][col + i] for i in range(3)]
-                
-                if all(tile is not None for tile in tiles):
-                    first_type = tiles[0].tile_type
-                    if all(tile.tile_type == first_type for tile in tiles):
-                        triple_positions = [(row, col + i) for i in range(3)]
-                        # Проверяем, что эти плитки не входят в четверки
-                        if not any(pos in matches for pos in triple_positions):
-                            for pos in triple_positions:
-                                matches.add(pos)
-                            points_to_add += 30
-                            print(f"Найдена тройка в строке {row}, столбец {col}-{col+2}")
-        
-        # Тройки по вертикали (30 очков)
-        for col in range(GRID_COLS):
-            for row in range(GRID_ROWS - 2):
-                tiles = [self.grid[row + i][col] for i in range(3)]
-                
-                if all(tile is not None for tile in tiles):
-                    first_type = tiles[0].tile_type
-                    if all(tile.tile_type == first_type for tile in tiles):
-                        triple_positions = [(row + i, col) for i in range(3)]
-                        if not any(pos in matches for pos in triple_positions):
-                            for pos in triple_positions:
-                                matches.add(pos)
-                            points_to_add += 30
-                            print(f"Найдена тройка в столбце {col}, строка {row}-{row+2}")
-        
-        if matches:
-            self.score += points_to_add
-            print(f"Всего найдено {len(matches)} плиток в совпадениях")
-            print(f"Добавлено очков: {points_to_add}")
-            self.remove_matches(list(matches))
-        else:
-            print("Совпадений не найдено")
-
-    def remove_matches(self, positions):
-        # Удаление совпавших плиток
-        for row, col in positions:
-            tile = self.grid[row][col]
-            if tile:
-                self.tile_list.remove(tile)
-                self.grid[row][col] = None
-        
-        self.fill_empty_spaces()
-        self.check_matches()
-
-    def fill_empty_spaces(self):
-        # Заполнение пустот новыми плитками
-        for col in range(GRID_COLS):
-            # Собираем все плитки в столбце снизу вверх
-            column_tiles = [self.grid[row][col] for row in range(GRID_ROWS - 1, -1, -1) if self.grid[row][col]]
-            
-            # Опускаем существующие плитки вниз
-            for i, tile in enumerate(column_tiles):
-                row = GRID_ROWS - 1 - i
-                tile.row, tile.col = row, col
-                tile.update_position()
-                self.grid[row][col] = tile
-            
-            # Добавляем новые плитки сверху
-            for i in range(len(column_tiles), GRID_ROWS):
-                row = GRID_ROWS - 1 - i
-                new_type = random.randint(0, len(TILE_TYPES) - 1)
-                new_tile = Tile(new_type, row, col)
-                self.grid[row][col] = new_tile
-                self.tile_list.append(new_tile)
-
-    def on_key_press(self, key, modifiers):
-        if key == arcade.key.ESCAPE:
-            if not self.game_over:
-                self.return_to_menu()
-            return
-        
-        if self.game_over and not self.result_saved:
-            if key == arcade.key.R:
-                self.setup()
-            
-            elif key == arcade.key.TAB:
-                self.showing_high_scores = not self.showing_high_scores
-                self.showing_stats = False if self.showing_high_scores else self.showing_stats
-            
-            elif key == arcade.key.S:
-                self.showing_stats = not self.showing_stats
-                self.showing_high_scores = False if self.showing_stats else self.showing_high_scores
-
-        def show_high_scores_screen(self):
-            # Отображение таблицы лучших результатов
-            arcade.draw_lrbt_rectangle_filled(
-                0, SCREEN_WIDTH, 0, SCREEN_HEIGHT,
-                (0, 0, 0, 220)
-            )
-            
-            title = arcade.Text(
-                "ЛУЧШИЕ РЕЗУЛЬТАТЫ",
-                SCREEN_WIDTH // 2, SCREEN_HEIGHT - 80,
-                arcade.color.GOLD, 36,
-                anchor_x="center", font_name="Arial"
-            )
-            subtitle = arcade.Text(
-                f"Уровень {self.level}",
-                SCREEN_WIDTH // 2, SCREEN_HEIGHT - 120,
-                arcade.color.LIGHT_GRAY, 24,
-                anchor_x="center", font_name="Arial"
-            )
-            title.draw()
-            subtitle.draw()
-            
-            try:
-                top_scores = db.get_top_scores(level=self.level, limit=8)
-                
-                if top_scores:
-                    y = SCREEN_HEIGHT - 180
-                    
-                    # Заголовки таблицы
-                    headers = ["Место", "Игрок", "Очки", "Ходы"]
-                    header_x = [100, 250, 450, 550]
-                    
-                    for i, header in enumerate(headers):
-                        header_text = arcade.Text(
-                            header,
-                            header_x[i], y,
-                            arcade.color.CYAN, 20,
-                            anchor_x="left", font_name="Arial"
-                        )
-                        header_text.draw()
-                    
-                    y -= 40
-                    
-                    # Данные
-                    for rank, (player_name, score, moves_used, total_moves, 
-                              game_date, level) in enumerate(top_scores, 1):
-                        
-                        row_data = [
-                            f"{rank}.",
-                            player_name[:12],
-                            str(score),
-                            f"{moves_used}/{total_moves}"
-                        ]
-                        
-                        for i, data in enumerate(row_data):
-                            color = arcade.color.WHITE
-                            if rank == 1:
-                                color = arcade.color.GOLD
-                            elif rank == 2:
-                                color = arcade.color.SILVER
-                            elif rank == 3:
-                                color = arcade.color.BRONZE
-                                
-                            data_text = arcade.Text(
-                                data,
-                                header_x[i], y,
-                                color, 18,
-                                anchor_x="left", font_name="Arial"
-                            )
-                            data_text.draw()
-                        
-                        y -= 35
-                        
-                        # Дата игры
-                        if isinstance(game_date, str):
-                            date_str = game_date[:16]
-                        else:
-                            date_str = game_date.strftime("%Y-%m-%d %H:%M")
-                        
-                        date_text = arcade.Text(
-                            date_str,
-                            250, y,
-                            arcade.color.GRAY, 14,
-                            anchor_x="left", font_name="Arial"
-                        )
-                        date_text.draw()
-                        
-                        y -= 25
-                        
-                        if y < 100:
-                            break
-                else:
-                    no_scores = arcade.Text(
-                        "Пока нет результатов для этого уровня",
-                        SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2,
-                        arcade.color.LIGHT_GRAY, 24,
-                        anchor_x="center", font_name="Arial"
-                    )
-                    no_scores.draw()
-                    
-            except Exception as e:
-                error_text = arcade.Text(
-                    f"Ошибка загрузки результатов: {str(e)[:50]}...",
-                    SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2,
-                    arcade.color.RED, 20,
-                    anchor_x="center", font_name="Arial"
-                )
-                error_text.draw()
-            
-            # Кнопка возврата
-            back_text = arcade.Text(
-                "Нажмите TAB для возврата",
-                SCREEN_WIDTH // 2, 50,
-                arcade.color.LIGHT_GRAY, 22,
-                anchor_x="center", font_name="Arial"
-            )
-            back_text.draw()
-
-    def show_statistics_screen(self):
-        # Отображение статистики
-        arcade.draw_lrbt_rectangle_filled(
-            0, SCREEN_WIDTH, 0, SCREEN_HEIGHT,
-            (0, 0, 0, 220)
-        )
-        
-        title = arcade.Text(
-            "СТАТИСТИКА",
-            SCREEN_WIDTH // 2, SCREEN_HEIGHT - 80,
-            arcade.color.CYAN, 36,
-            anchor_x="center", font_name="Arial"
-        )
-        title.draw()
-        
-        try:
-            # Статистика уровня
-            level_stats = db.get_level_stats(self.level)
-            if level_stats:
-                total_games, wins, avg_score, max_score, min_score, avg_efficiency = level_stats
-                win_rate = (wins / total_games * 100) if total_games > 0 else 0
-                
-                y = SCREEN_HEIGHT - 140
-                stats_items = [
-                    (f"Статистика уровня {self.level}:", arcade.color.YELLOW),
-                    (f"Всего игр: {int(total_games)}", arcade.color.WHITE),
-                    (f"Побед: {int(wins)} ({win_rate:.1f}%)", arcade.color.GREEN),
-                    (f"Средний счет: {avg_score:.1f}" if avg_score else "Средний счет: 0", arcade.color.LIGHT_BLUE),
-                    (f"Лучший счет: {int(max_score) if max_score else 0}", arcade.color.GOLD),
-                ]
-                
-                for text, color in stats_items:
-                    stat_text = arcade.Text(
-                        text,
-                        SCREEN_WIDTH // 2, y,
-                        color, 24,
-                        anchor_x="center", font_name="Arial"
-                    )
-                    stat_text.draw()
-                    y -= 40
-            
-            # Личная статистика
-            player_stats = db.get_player_stats(self.player_name)
-            if player_stats:
-                player_name, total_games, total_wins, total_score, best_score, last_played = player_stats
-                personal_win_rate = (total_wins / total_games * 100) if total_games > 0 else 0
-                
-                y -= 40
-                personal_items = [
-                    (f"Ваша статистика ({self.player_name}):", arcade.color.YELLOW),
-                    (f"Игр сыграно: {total_games}", arcade.color.WHITE),
-                    (f"Побед: {total_wins} ({personal_win_rate:.1f}%)", arcade.color.GREEN),
-                    (f"Всего очков: {total_score}", arcade.color.LIGHT_BLUE),
-                    (f"Лучший счет: {best_score}", arcade.color.GOLD),
-                ]
-                
-                for text, color in personal_items:
-                    stat_text = arcade.Text(
-                        text,
-                        SCREEN_WIDTH // 2, y,
-                        color, 22,
-                        anchor_x="center", font_name="Arial"
-                    )
-                    stat_text.draw()
-                    y -= 35
-                
-        except Exception as e:
-            error_text = arcade.Text(
-                f"Ошибка загрузки статистики: {e}",
-                SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2,
-                arcade.color.RED, 20,
-                anchor_x="center", font_name="Arial"
-            )
-            error_text.draw()
-        
-        # Кнопка возврата
-        back_text = arcade.Text(
-            "Нажмите S для возврата",
-            SCREEN_WIDTH // 2, 50,
-            arcade.color.LIGHT_GRAY, 22,
-            anchor_x="center", font_name="Arial"
-        )
-        back_text.draw()
-
-
-def main():
-    # Отдельный запуск уровня (для тестирования)
-    window = arcade.Window(SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE)
-    game_view = GameView()
-    game_view.window = window
-    game_view.player_name = "Player"
-    window.show_view(game_view)
-    arcade.run()
-
-
-if __name__ == "__main__":
-    main()
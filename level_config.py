@@ -0,0 +1,19 @@
+# Параметры уровней без arcade: их читают и окна уровней (level_first/second/third.py),
+# и игра без окна (game_session.py), поэтому правила не расходятся.
+from typing import Dict
+
+# Цвета плиток; номер цвета — индекс в этом списке
+TILE_TYPES = ["red", "blue", "green", "yellow", "purple"]
+START_MOVES = 10
+
+# min_match_length и match_points — минимальная длина ряда и очки за ряд каждой длины.
+# match_free_start: поле строится без готовых рядов (уровни 2 и 3),
+# иначе оно случайное и стартовые ряды сразу засчитываются (уровень 1).
+LEVELS: Dict[int, Dict] = {
+    1: {"rows": 3, "cols": 3, "tile_size": 130, "min_match_length": 3,
+        "match_points": {3: 30}, "match_free_start": False},
+    2: {"rows": 4, "cols": 4, "tile_size": 100, "min_match_length": 3,
+        "match_points": {3: 30, 4: 40}, "match_free_start": True},
+    3: {"rows": 5, "cols": 5, "tile_size": 80, "min_match_length": 3,
+        "match_points": {3: 30, 4: 40, 5: 50}, "match_free_start": True},
+}
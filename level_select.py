@@ -1,4 +1,5 @@
 import arcade
+from ui_batch import UIBatch
 
 
 SCREEN_WIDTH = 800
@@ -11,39 +12,57 @@ class LevelSelectView(arcade.View):
         self.window = None
         self.selected_level = 1
         
+        # Неизменная часть экрана и кнопки уровней, которые зависят
+        # от выбранного уровня и пересобираются только при его смене
+        self.ui = None
+        self.level_buttons_ui = None
+        self.level_buttons_for = None
+        
     def on_show_view(self):
         arcade.set_background_color(arcade.color.GRAY)
+        if self.ui is None:
+            self.ui = self.build_ui()
         
     def on_draw(self):
         self.clear()
         
-        # Заголовок
-        arcade.draw_text("ВЫБЕРИТЕ УРОВЕНЬ",
-                         SCREEN_WIDTH // 2,
-                         SCREEN_HEIGHT - 100,
-                         arcade.color.PALE_PINK,
-                         font_size=40,
-                         anchor_x="center",
-                         bold=True)
+        if self.level_buttons_for != self.selected_level:
+            self.build_level_buttons()
         
-        # Описание уровней
-        level_descriptions = [
-            "3x3 поле, тройки",
-            "4x4 поле, тройки и четверки",
-            "5x5 поле, тройки, четверки и пятерки"
-        ]
+        self.ui.draw()
+        self.level_buttons_ui.draw()
         
-        # Кнопки выбора уровня
-        self.draw_level_buttons(level_descriptions)
+    def build_ui(self):
+        ui = UIBatch()
+        
+        # Заголовок
+        ui.add_text("ВЫБЕРИТЕ УРОВЕНЬ",
+                    SCREEN_WIDTH // 2,
+                    SCREEN_HEIGHT - 100,
+                    arcade.color.PALE_PINK,
+                    font_size=40,
+                    anchor_x="center",
+                    bold=True)
         
         # Кнопка запуска
-        self.draw_start_button()
+        self.build_start_button(ui)
         
         # Кнопка возврата
-        self.draw_back_button()
+        self.build_back_button(ui)
+        return ui
+        
+    def build_level_buttons(self):
+        # Сборка кнопок уровней с подсветкой выбранного
+        if self.level_buttons_ui is not None:
+            self.level_buttons_ui.delete()
+        ui = UIBatch()
         
-    def draw_level_buttons(self, descriptions):
-        # Отрисовка кнопок уровней
+        # Описание уровней
+        descriptions = [
+            "3x3 поле, тройки",
+            "4x4 поле, тройки и четверки",
+            "5x5 поле, тройки, четверки и пятерки"
+        ]
         button_y_pos = [400, 300, 200]
         
         for i, (y_pos, desc) in enumerate(zip(button_y_pos, descriptions), 1):
@@ -55,17 +74,15 @@ class LevelSelectView(arcade.View):
                 button_color = arcade.color.LIGHT_BLUE
                 text_color = arcade.color.WHITE
             
-            # Рисуем фон кнопки
-            arcade.draw_lrbt_rectangle_filled(
+            # Фон и рамка кнопки
+            ui.add_rect(
                 left=SCREEN_WIDTH // 2 - 250,
                 right=SCREEN_WIDTH // 2 + 250,
                 bottom=y_pos - 40,
                 top=y_pos + 40,
                 color=button_color
             )
-            
-            # Рисуем рамку
-            arcade.draw_lrbt_rectangle_outline(
+            ui.add_rect_outline(
                 left=SCREEN_WIDTH // 2 - 250,
                 right=SCREEN_WIDTH // 2 + 250,
                 bottom=y_pos - 40,
@@ -75,85 +92,56 @@ class LevelSelectView(arcade.View):
             )
             
             # Номер уровня
-            arcade.draw_text(f"УРОВЕНЬ {i}",
-                            SCREEN_WIDTH // 2,
-                            y_pos + 10,
-                            text_color,
-                            font_size=24,
-                            anchor_x="center",
-                            anchor_y="center",
-                            bold=True)
+            ui.add_text(f"УРОВЕНЬ {i}",
+                        SCREEN_WIDTH // 2,
+                        y_pos + 10,
+                        text_color,
+                        font_size=24,
+                        anchor_x="center",
+                        anchor_y="center",
+                        bold=True)
             
             # Описание
-            arcade.draw_text(desc,
-                            SCREEN_WIDTH // 2,
-                            y_pos - 15,
-                            text_color,
-                            font_size=22,
-                            anchor_x="center",
-                            anchor_y="center")
-    
-    def draw_start_button(self):
-        # Отрисовка кнопки запуска уровня
-        # Рисуем фон кнопки
-        arcade.draw_lrbt_rectangle_filled(
-            left=SCREEN_WIDTH // 2 - 150,
-            right=SCREEN_WIDTH // 2 + 150,
-            bottom=100,
-            top=150,
-            color=arcade.color.PALE_BLUE
-        )
+            ui.add_text(desc,
+                        SCREEN_WIDTH // 2,
+                        y_pos - 15,
+                        text_color,
+                        font_size=22,
+                        anchor_x="center",
+                        anchor_y="center")
         
-        # Рисуем рамку
-        arcade.draw_lrbt_rectangle_outline(
+        self.level_buttons_ui = ui
+        self.level_buttons_for = self.selected_level
+    
+    def build_start_button(self, ui):
+        # Кнопка запуска уровня
+        ui.add_button(
             left=SCREEN_WIDTH // 2 - 150,
             right=SCREEN_WIDTH // 2 + 150,
             bottom=100,
             top=150,
-            color=arcade.color.DARK_BLUE,
-            border_width=2
+            fill_color=arcade.color.PALE_BLUE,
+            border_color=arcade.color.DARK_BLUE,
+            border_width=2,
+            text="ЗАПУСТИТЬ УРОВЕНЬ",
+            text_y=125,
+            font_size=22
         )
-        
-        # Текст кнопки
-        arcade.draw_text("ЗАПУСТИТЬ УРОВЕНЬ",
-                        SCREEN_WIDTH // 2,
-                        125,
-                        arcade.color.WHITE,
-                        font_size=22,
-                        anchor_x="center",
-                        anchor_y="center",
-                        bold=True)
     
-    def draw_back_button(self):
-        # Отрисовка кнопки возврата
-        # Рисуем фон кнопки
-        arcade.draw_lrbt_rectangle_filled(
-            left=SCREEN_WIDTH // 2 - 100,
-            right=SCREEN_WIDTH // 2 + 100,
-            bottom=50,
-            top=90,
-            color=arcade.color.PALE_RED_VIOLET
-        )
-        
-        # Рисуем рамку
-        arcade.draw_lrbt_rectangle_outline(
+    def build_back_button(self, ui):
+        # Кнопка возврата
+        ui.add_button(
             left=SCREEN_WIDTH // 2 - 100,
             right=SCREEN_WIDTH // 2 + 100,
             bottom=50,
             top=90,
-            color=arcade.color.DARK_RED,
-            border_width=2
+            fill_color=arcade.color.PALE_RED_VIOLET,
+            border_color=arcade.color.DARK_RED,
+            border_width=2,
+            text="НАЗАД",
+            text_y=75,
+            font_size=22
         )
-        
-        # Текст кнопки
-        arcade.draw_text("НАЗАД",
-                        SCREEN_WIDTH // 2,
-                        75,
-                        arcade.color.WHITE,
-                        font_size=22,
-                        anchor_x="center",
-                        anchor_y="center",
-                        bold=True)
     
     def on_mouse_press(self, x, y, button, modifiers):
         # Проверка кнопок уровней
@@ -1,5 +1,7 @@
 import arcade
+from profiler_overlay import ProfilerOverlay
 from start_view import StartView
+from textures import load_textures
 
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
@@ -9,6 +11,9 @@ SCREEN_TITLE = "Puzzle Slider"
 def main():
     # Основная функция запуска игры
     window = arcade.Window(SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE)
+    load_textures(window)
+    # Таблица замеров поверх любого экрана (F3 или PUZZLE_PROFILE=1)
+    ProfilerOverlay(window).install()
     start_view = StartView()
     start_view.window = window
     window.show_view(start_view)
@@ -0,0 +1,212 @@
+# Движок поиска совпадений без спрайтов и без arcade.
+# Поле хранится как набор целочисленных битовых масок — по одной на цвет,
+# поэтому поиск ряда из N плиток сводится к N сдвигам и побитовым И.
+import random
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+Position = Tuple[int, int]
+# (длина, горизонтально ли, строка, столбец первой плитки)
+Match = Tuple[int, bool, int, int]
+
+
+def iter_bits(mask: int) -> Iterator[int]:
+    # Перебор номеров установленных битов от младшего к старшему
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+def window_mask(mask: int, length: int) -> int:
+    # Бит i установлен, если с бита i начинается ряд из length единиц
+    result = mask
+    for k in range(1, length):
+        result &= mask >> k
+    return result
+
+
+def generate_layout(rows: int, cols: int, num_types: int,
+                    min_length: int = 3, rng=random) -> List[List[int]]:
+    # Раскладка цветов без готовых рядов за один проход.
+    # Для каждой клетки исключаются цвета, которые завершили бы ряд
+    # с соседями слева или сверху, — таких цветов не больше двух.
+    if min_length < 2:
+        raise ValueError("Длина ряда должна быть не меньше 2")
+    if num_types < 3:
+        raise ValueError("Для поля без совпадений нужно хотя бы 3 цвета")
+
+    run = min_length - 1
+    layout = [[0] * cols for _ in range(rows)]
+    for row in range(rows):
+        for col in range(cols):
+            banned = set()
+            if col >= run:
+                left = layout[row][col - 1]
+                if all(layout[row][col - k] == left for k in range(2, run + 1)):
+                    banned.add(left)
+            if row >= run:
+                top = layout[row - 1][col]
+                if all(layout[row - k][col] == top for k in range(2, run + 1)):
+                    banned.add(top)
+
+            choices = [t for t in range(num_types) if t not in banned]
+            layout[row][col] = rng.choice(choices)
+    return layout
+
+
+class BitBoard:
+    # Каждый цвет хранится дважды: по строкам (клетка (row, col) —
+    # бит row * row_stride + col) и по столбцам (бит col * col_stride + row).
+    # В обоих случаях ряд плиток — это подряд идущие биты, а лишний
+    # нулевой бит в конце каждой линии не даёт рядам переходить на соседнюю.
+
+    def __init__(self, rows: int, cols: int, num_types: int):
+        self.rows = rows
+        self.cols = cols
+        self.num_types = num_types
+        self.row_stride = cols + 1
+        self.col_stride = rows + 1
+        self.row_masks = [0] * num_types
+        self.col_masks = [0] * num_types
+        self.cells: List[Optional[int]] = [None] * (rows * cols)
+
+        # Строки и столбцы, изменившиеся после последнего поиска совпадений
+        self.dirty_rows: Set[int] = set(range(rows))
+        self.dirty_cols: Set[int] = set(range(cols))
+
+    @classmethod
+    def from_grid(cls, grid: Sequence[Sequence], num_types: int) -> "BitBoard":
+        # Построение поля по сетке плиток (объектов с tile_type) или None
+        rows = len(grid)
+        cols = len(grid[0]) if rows else 0
+        board = cls(rows, cols, num_types)
+        for row in range(rows):
+            for col in range(cols):
+                tile = grid[row][col]
+                if tile is not None:
+                    board.set(row, col, tile.tile_type)
+        return board
+
+    def copy(self) -> "BitBoard":
+        board = BitBoard(self.rows, self.cols, self.num_types)
+        board.row_masks = self.row_masks[:]
+        board.col_masks = self.col_masks[:]
+        board.cells = self.cells[:]
+        board.dirty_rows = set(self.dirty_rows)
+        board.dirty_cols = set(self.dirty_cols)
+        return board
+
+    def get(self, row: int, col: int) -> Optional[int]:
+        return self.cells[row * self.cols + col]
+
+    def set(self, row: int, col: int, tile_type: Optional[int]) -> None:
+        index = row * self.cols + col
+        old_type = self.cells[index]
+        if old_type == tile_type:
+            return
+
+        row_bit = 1 << (row * self.row_stride + col)
+        col_bit = 1 << (col * self.col_stride + row)
+        if old_type is not None:
+            self.row_masks[old_type] &= ~row_bit
+            self.col_masks[old_type] &= ~col_bit
+        if tile_type is not None:
+            self.row_masks[tile_type] |= row_bit
+            self.col_masks[tile_type] |= col_bit
+
+        self.cells[index] = tile_type
+        self.dirty_rows.add(row)
+        self.dirty_cols.add(col)
+
+    def clear(self, row: int, col: int) -> None:
+        self.set(row, col, None)
+
+    def swap(self, row1: int, col1: int, row2: int, col2: int) -> None:
+        first = self.get(row1, col1)
+        second = self.get(row2, col2)
+        self.set(row1, col1, second)
+        self.set(row2, col2, first)
+
+    def _line_runs(self, masks: List[int], stride: int, min_length: int,
+                   lines: Optional[Iterable[int]]) -> List[Tuple[int, int, int]]:
+        # Максимальные ряды одного цвета длиной от min_length
+        # в виде (линия, смещение, длина). Каждая линия проходится один раз:
+        # начала рядов — установленные биты без соседа слева.
+        # lines=None — вся доска, иначе только перечисленные линии.
+        runs = []
+        if lines is None:
+            chunks = [(0, mask) for mask in masks]
+        else:
+            line_bits = (1 << (stride - 1)) - 1
+            chunks = [(line * stride, (mask >> (line * stride)) & line_bits)
+                      for line in lines for mask in masks]
+
+        for shift, mask in chunks:
+            starts = window_mask(mask, min_length) & ~(mask << 1)
+            for index in iter_bits(starts):
+                rest = mask >> index
+                length = (~rest & (rest + 1)).bit_length() - 1
+                line, offset = divmod(shift + index, stride)
+                runs.append((line, offset, length))
+        return runs
+
+    def find_runs(self, min_length: int,
+                  rows: Optional[Iterable[int]] = None,
+                  cols: Optional[Iterable[int]] = None) -> List[Match]:
+        # Все максимальные ряды длиной от min_length: сначала длинные,
+        # при равной длине горизонтальные (по строкам) раньше вертикальных
+        # (по столбцам) — в том же порядке, что и старые проверки по шаблонам.
+        runs: List[Match] = []
+        for row, col, length in self._line_runs(self.row_masks, self.row_stride, min_length, rows):
+            runs.append((length, True, row, col))
+        for col, row, length in self._line_runs(self.col_masks, self.col_stride, min_length, cols):
+            runs.append((length, False, row, col))
+
+        runs.sort(key=lambda run: (-run[0], not run[1],
+                                   (run[2], run[3]) if run[1] else (run[3], run[2])))
+        return runs
+
+    def find_matches(self, min_length: int, points: Dict[int, int],
+                     incremental: bool = False) -> Tuple[Set[Position], int, List[Match]]:
+        # Поиск совпадений: каждый ряд получает очки по своей длине из таблицы
+        # points, ряды длиннее таблицы — очки самой длинной записи.
+        # Ряд пропускается, если хотя бы одна его плитка уже вошла в совпадение.
+        #
+        # incremental=True проверяет только строки и столбцы, изменившиеся
+        # после прошлого поиска. Результат тот же, что и при полном обходе:
+        # после каждого поиска "грязными" остаются линии, где ряды ещё лежат
+        # на поле, поэтому любой ряд всегда находится в одной из них.
+        matches: Set[Position] = set()
+        total_points = 0
+        found: List[Match] = []
+        longest_points = points[max(points)]
+
+        if incremental:
+            runs = self.find_runs(min_length, sorted(self.dirty_rows), sorted(self.dirty_cols))
+        else:
+            runs = self.find_runs(min_length)
+
+        self.dirty_rows = set()
+        self.dirty_cols = set()
+        for length, horizontal, row, col in runs:
+            if horizontal:
+                self.dirty_rows.add(row)
+                run = [(row, col + i) for i in range(length)]
+            else:
+                self.dirty_cols.add(col)
+                run = [(row + i, col) for i in range(length)]
+
+            if any(pos in matches for pos in run):
+                continue
+            matches.update(run)
+            total_points += points.get(length, longest_points)
+            found.append((length, horizontal, row, col))
+
+        return matches, total_points, found
+
+    def has_matches(self, min_length: int = 3) -> bool:
+        # Есть ли на поле хотя бы один ряд длиной не меньше min_length
+        for row_mask, col_mask in zip(self.row_masks, self.col_masks):
+            if window_mask(row_mask, min_length) or window_mask(col_mask, min_length):
+                return True
+        return False
@@ -0,0 +1,115 @@
+# Замеры времени горячих участков: on_update и on_draw уровней, поиск
+# совпадений, падение плиток и запросы к базе результатов.
+#
+# По умолчанию выключены и стоят одну проверку флага на вызов. Включаются
+# переменной окружения PUZZLE_PROFILE=1 или клавишей F3 в игре (см.
+# profiler_overlay.py). Для каждого участка хранятся последние WINDOW_SIZE
+# замеров, по ним считаются p50/p95/p99. При выходе накопленные замеры
+# сохраняются в PUZZLE_PROFILE_OUTPUT (.json или .csv), чтобы сравнивать сборки.
+#
+# Запуск: PUZZLE_PROFILE=1 PUZZLE_PROFILE_OUTPUT=before.csv python main.py
+import atexit
+import csv
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from typing import Callable, Deque, Dict, List
+
+import numpy as np
+
+PROFILE_ENV = "PUZZLE_PROFILE"
+PROFILE_OUTPUT_ENV = "PUZZLE_PROFILE_OUTPUT"
+DEFAULT_OUTPUT = "profile_results.json"
+# Сколько последних замеров участка учитывается в процентилях
+WINDOW_SIZE = 600
+PERCENTILES = (50, 95, 99)
+SUMMARY_FIELDS = ["name", "count", "mean_ms"] + [f"p{p}_ms" for p in PERCENTILES] + ["max_ms"]
+
+
+class Profiler:
+    def __init__(self, enabled: bool = False, window_size: int = WINDOW_SIZE):
+        self.enabled = enabled
+        self.window_size = window_size
+        self.samples: Dict[str, Deque[float]] = {}
+        self.counts: Dict[str, int] = {}
+        # Запросы к базе приходят и из потока записи
+        self._lock = threading.Lock()
+
+    def toggle(self) -> None:
+        self.enabled = not self.enabled
+
+    def record(self, name: str, seconds: float) -> None:
+        with self._lock:
+            samples = self.samples.get(name)
+            if samples is None:
+                samples = self.samples[name] = deque(maxlen=self.window_size)
+            samples.append(seconds)
+            self.counts[name] = self.counts.get(name, 0) + 1
+
+    def summary(self) -> List[Dict]:
+        # Строка на участок: число вызовов за всё время и процентили по окну, в мс
+        with self._lock:
+            snapshot = {name: (np.array(samples), self.counts[name])
+                        for name, samples in self.samples.items()}
+
+        rows = []
+        for name in sorted(snapshot):
+            samples, count = snapshot[name]
+            samples = samples * 1000
+            row = {"name": name, "count": count, "mean_ms": round(float(samples.mean()), 3)}
+            for p, value in zip(PERCENTILES, np.percentile(samples, PERCENTILES)):
+                row[f"p{p}_ms"] = round(float(value), 3)
+            row["max_ms"] = round(float(samples.max()), 3)
+            rows.append(row)
+        return rows
+
+    def dump(self, path: str) -> None:
+        # Формат выбирается по расширению: .csv — таблица, иначе JSON
+        rows = self.summary()
+        if path.endswith(".csv"):
+            with open(path, "w", newline="", encoding="utf-8") as f:
+                writer = csv.DictWriter(f, fieldnames=SUMMARY_FIELDS)
+                writer.writeheader()
+                writer.writerows(rows)
+        else:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump({"created": datetime.now().isoformat(), "sections": rows},
+                          f, ensure_ascii=False, indent=2)
+
+    def dump_on_exit(self) -> None:
+        # Если замеров не было, файл не создаётся
+        if not self.samples:
+            return
+        path = os.environ.get(PROFILE_OUTPUT_ENV, DEFAULT_OUTPUT)
+        try:
+            self.dump(path)
+            print(f"Замеры сохранены в {path}")
+        except OSError as e:
+            print(f"Ошибка при сохранении замеров: {e}")
+
+
+def profiled(name: str) -> Callable:
+    # Замер времени каждого вызова метода под именем name
+    def decorator(method: Callable) -> Callable:
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            if not profiler.enabled:
+                return method(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                profiler.record(name, time.perf_counter() - start)
+
+        return wrapper
+
+    return decorator
+
+
+# Глобальный профилировщик
+profiler = Profiler(enabled=os.environ.get(PROFILE_ENV) == "1")
+atexit.register(profiler.dump_on_exit)
@@ -0,0 +1,72 @@
+# Таблица замеров поверх любого экрана.
+#
+# Обработчики оверлея кладутся в окно до первого show_view. Каждый View
+# кладёт свои обработчики сверху, поэтому оверлей рисуется после экрана
+# и ловит F3, какой бы экран ни был открыт.
+import time
+
+import arcade
+
+from profiler import PERCENTILES, profiler
+from ui_batch import UIBatch
+
+TOGGLE_KEY = arcade.key.F3
+# Как часто пересобирается таблица; сами замеры идут каждый кадр
+REFRESH_INTERVAL = 0.5
+LEFT = 10
+BOTTOM = 10
+WIDTH = 480
+ROW_HEIGHT = 16
+FONT_SIZE = 11
+FONT_NAME = ("Consolas", "Courier New", "monospace")
+
+
+class ProfilerOverlay:
+    def __init__(self, window: arcade.Window):
+        self.window = window
+        self.ui = None
+        self.built_at = 0.0
+        self.last_frame = None
+
+    def install(self) -> None:
+        self.window.push_handlers(on_draw=self.on_draw, on_key_press=self.on_key_press)
+
+    def on_key_press(self, key, modifiers):
+        if key == TOGGLE_KEY:
+            profiler.toggle()
+            self.last_frame = None
+
+    def on_draw(self):
+        if not profiler.enabled:
+            return
+
+        # Полное время кадра — между двумя отрисовками, на любом экране
+        now = time.perf_counter()
+        if self.last_frame is not None:
+            profiler.record("frame", now - self.last_frame)
+        self.last_frame = now
+
+        if self.ui is None or now - self.built_at >= REFRESH_INTERVAL:
+            self.build_ui()
+            self.built_at = now
+        self.ui.draw()
+
+    def build_ui(self):
+        if self.ui is not None:
+            self.ui.delete()
+        ui = UIBatch()
+
+        header = f"{'участок':<24}{'n':>7}" + "".join(f"{'p' + str(p):>8}" for p in PERCENTILES)
+        lines = [header]
+        for row in profiler.summary():
+            lines.append(f"{row['name'][:24]:<24}{row['count']:>7}"
+                         + "".join(f"{row[f'p{p}_ms']:>8.2f}" for p in PERCENTILES))
+        lines.append(f"мс, последние {profiler.window_size} замеров; F3 — скрыть")
+
+        top = BOTTOM + len(lines) * ROW_HEIGHT + 6
+        ui.add_rect(LEFT - 4, LEFT + WIDTH, BOTTOM - 4, top, (0, 0, 0, 200))
+        for i, line in enumerate(lines):
+            ui.add_text(line, LEFT, top - (i + 1) * ROW_HEIGHT - 2,
+                        arcade.color.LIME_GREEN if i == 0 else arcade.color.WHITE,
+                        FONT_SIZE, font_name=FONT_NAME)
+        self.ui = ui
@@ -1,6 +1,8 @@
 import arcade
 from statistics_view import StatisticsView
 from level_select import LevelSelectView
+from leaderboard_view import LeaderboardView
+from ui_batch import UIBatch
 
 
 SCREEN_WIDTH = 800
@@ -11,69 +13,65 @@ class StartView(arcade.View):
     def __init__(self):
         super().__init__()
         self.window = None
+        self.ui = None
         
     def on_show_view(self):
         arcade.set_background_color(arcade.color.GRAY)
+        # Экран не меняется, поэтому собирается один раз при первом показе
+        if self.ui is None:
+            self.ui = self.build_ui()
         
     def on_draw(self):
         self.clear()
+        self.ui.draw()
+        
+    def build_ui(self):
+        ui = UIBatch()
         
         # Заголовок игры
-        arcade.draw_text("PUZZLE SLIDER", 
-                         SCREEN_WIDTH // 2, 
-                         SCREEN_HEIGHT - 150,
-                         arcade.color.PALE_PINK, 
-                         font_size=50, 
-                         anchor_x="center",
-                         bold=True)
+        ui.add_text("PUZZLE SLIDER", 
+                    SCREEN_WIDTH // 2, 
+                    SCREEN_HEIGHT - 150,
+                    arcade.color.PALE_PINK, 
+                    font_size=50, 
+                    anchor_x="center",
+                    bold=True)
         
         # Подзаголовок
-        arcade.draw_text("Перемещайте элементы, чтобы собрать картинку",
-                         SCREEN_WIDTH // 2,
-                         SCREEN_HEIGHT - 200,
-                         arcade.color.LIGHT_GRAY,
-                         font_size=18,
-                         anchor_x="center")
+        ui.add_text("Перемещайте элементы, чтобы собрать картинку",
+                    SCREEN_WIDTH // 2,
+                    SCREEN_HEIGHT - 200,
+                    arcade.color.LIGHT_GRAY,
+                    font_size=18,
+                    anchor_x="center")
         
         # Кнопки
-        self.draw_buttons()
+        self.build_buttons(ui)
+        return ui
         
-    def draw_buttons(self):
-        button_y_pos = [300, 225, 150, 75]
-        button_texts = ["НАЧАТЬ ИГРУ", "ВЫБОР УРОВНЯ", "СТАТИСТИКА", "ВЫЙТИ"]
+    def build_buttons(self, ui):
+        button_y_pos = [320, 255, 190, 125, 60]
+        button_texts = ["НАЧАТЬ ИГРУ", "ВЫБОР УРОВНЯ", "СТАТИСТИКА", "РЕКОРДЫ", "ВЫЙТИ"]
         
         for i, (y_pos, text) in enumerate(zip(button_y_pos, button_texts)):
             button_color = arcade.color.PALE_BLUE if i == 0 else arcade.color.LIGHT_BLUE
             
-            arcade.draw_lrbt_rectangle_filled(
-                left=SCREEN_WIDTH // 2 - 150,
-                right=SCREEN_WIDTH // 2 + 150,
-                bottom=y_pos - 25,
-                top=y_pos + 25,
-                color=button_color
-            )
-            
-            arcade.draw_lrbt_rectangle_outline(
+            ui.add_button(
                 left=SCREEN_WIDTH // 2 - 150,
                 right=SCREEN_WIDTH // 2 + 150,
                 bottom=y_pos - 25,
                 top=y_pos + 25,
-                color=arcade.color.DARK_BLUE,
-                border_width=2
+                fill_color=button_color,
+                border_color=arcade.color.DARK_BLUE,
+                border_width=2,
+                text=text,
+                text_y=y_pos,
+                font_size=22
             )
-            
-            arcade.draw_text(text,
-                            SCREEN_WIDTH // 2,
-                            y_pos,
-                            arcade.color.WHITE,
-                            font_size=22,
-                            anchor_x="center",
-                            anchor_y="center",
-                            bold=True)
     
     def on_mouse_press(self, x, y, button, modifiers):
-        button_y_pos = [300, 225, 150, 75]
-        button_texts = ["НАЧАТЬ ИГРУ", "ВЫБОР УРОВНЯ", "СТАТИСТИКА", "ВЫЙТИ"]
+        button_y_pos = [320, 255, 190, 125, 60]
+        button_texts = ["НАЧАТЬ ИГРУ", "ВЫБОР УРОВНЯ", "СТАТИСТИКА", "РЕКОРДЫ", "ВЫЙТИ"]
         
         for y_pos, text in zip(button_y_pos, button_texts):
             left = SCREEN_WIDTH // 2 - 150
@@ -105,6 +103,12 @@ class StartView(arcade.View):
             stats_view.player_name = "Player"
             self.window.show_view(stats_view)
             
+        elif button_text == "РЕКОРДЫ":
+            # Прокручиваемая таблица рекордов и история игр
+            leaderboard_view = LeaderboardView()
+            leaderboard_view.window = self.window
+            self.window.show_view(leaderboard_view)
+            
         elif button_text == "ВЫЙТИ":
             arcade.close_window()
     
@@ -112,7 +116,7 @@ class StartView(arcade.View):
         if key == arcade.key.ESCAPE:
             arcade.close_window()
         elif key == arcade.key.ENTER or key == arcade.key.SPACE:
-            from level1 import GameView as Level1View
+            from level_first import GameView as Level1View
             level_view = Level1View()
             level_view.window = self.window
             level_view.player_name = "Player"
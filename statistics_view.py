@@ -1,5 +1,6 @@
 import arcade
 from database import db
+from ui_batch import UIBatch
 
 
 SCREEN_WIDTH = 800
@@ -10,21 +11,30 @@ class StatisticsView(arcade.View):
     def __init__(self):
         super().__init__()
         self.window = None
+        self.ui = None
         
     def on_show_view(self):
         arcade.set_background_color(arcade.color.GRAY)
+        # Статистика читается из базы и раскладывается один раз при показе экрана
+        if self.ui is not None:
+            self.ui.delete()
+        self.ui = self.build_ui()
         
     def on_draw(self):
         self.clear()
+        self.ui.draw()
+        
+    def build_ui(self):
+        ui = UIBatch()
         
         # Заголовок
-        arcade.draw_text("СТАТИСТИКА ИГРЫ",
-                         SCREEN_WIDTH // 2,
-                         SCREEN_HEIGHT - 80,
-                         arcade.color.PALE_PINK,
-                         font_size=40,
-                         anchor_x="center",
-                         bold=True)
+        ui.add_text("СТАТИСТИКА ИГРЫ",
+                    SCREEN_WIDTH // 2,
+                    SCREEN_HEIGHT - 80,
+                    arcade.color.PALE_PINK,
+                    font_size=40,
+                    anchor_x="center",
+                    bold=True)
         
         try:
             # Получаем статистику из базы данных
@@ -47,24 +57,22 @@ class StatisticsView(arcade.View):
                 ]
                 
                 for text, color in stats_items:
-                    stat_text = arcade.Text(
+                    ui.add_text(
                         text,
                         SCREEN_WIDTH // 2, y,
                         color, 24,
                         anchor_x="center", font_name="Arial"
                     )
-                    stat_text.draw()
                     y -= 40
                 
                 # Статистика по уровням
                 y -= 20
-                level_title = arcade.Text(
+                ui.add_text(
                     "СТАТИСТИКА ПО УРОВНЯМ:",
                     SCREEN_WIDTH // 2, y,
                     arcade.color.PALE_BLUE, 24,
                     anchor_x="center", font_name="Arial"
                 )
-                level_title.draw()
                 y -= 40
                 
                 # Получаем статистику для каждого уровня
@@ -74,59 +82,47 @@ class StatisticsView(arcade.View):
                         level_games, level_wins, level_avg, level_max, level_min, level_efficiency = level_stats
                         level_win_rate = (level_wins / level_games * 100) if level_games > 0 else 0
                         
-                        level_text = arcade.Text(
+                        ui.add_text(
                             f"Уровень {level}: {level_games} игр, {level_win_rate:.1f}% побед, "
                             f"средний счет: {level_avg:.1f}",
                             SCREEN_WIDTH // 2, y,
                             arcade.color.LIGHT_GRAY, 20,
                             anchor_x="center", font_name="Arial"
                         )
-                        level_text.draw()
                         y -= 35
             else:
                 # Нет данных в базе
-                no_data = arcade.Text(
+                ui.add_text(
                     "Нет данных для статистики",
                     SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2,
                     arcade.color.LIGHT_GRAY, 28,
                     anchor_x="center", font_name="Arial"
                 )
-                no_data.draw()
                 
         except Exception as e:
             # Ошибка загрузки статистики
-            error_text = arcade.Text(
+            ui.add_text(
                 f"Ошибка загрузки статистики: {str(e)[:50]}...",
                 SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2,
                 arcade.color.RED, 20,
                 anchor_x="center", font_name="Arial"
             )
-            error_text.draw()
         
         # Кнопка возврата
-        arcade.draw_lrbt_rectangle_filled(
+        ui.add_button(
             left=SCREEN_WIDTH // 2 - 100,
             right=SCREEN_WIDTH // 2 + 100,
             bottom=50,
             top=100,
-            color=arcade.color.DARK_RED
-        )
-        arcade.draw_lrbt_rectangle_outline(
-            left=SCREEN_WIDTH // 2 - 100,
-            right=SCREEN_WIDTH // 2 + 100,
-            bottom=50,
-            top=100,
-            color=arcade.color.RED,
-            border_width=2
-        )
-        back_text = arcade.Text(
-            "НАЗАД",
-            SCREEN_WIDTH // 2, 75,
-            arcade.color.WHITE, 22,
-            anchor_x="center", anchor_y="center",
-            bold=True, font_name="Arial"
+            fill_color=arcade.color.DARK_RED,
+            border_color=arcade.color.RED,
+            border_width=2,
+            text="НАЗАД",
+            text_y=75,
+            font_size=22,
+            font_name="Arial"
         )
-        back_text.draw()
+        return ui
     
     def on_mouse_press(self, x, y, button, modifiers):
         # Проверка кнопки возврата
@@ -0,0 +1,37 @@
+# Проверки игры без окна: python -m pytest test_game_session.py
+import random
+
+import pytest
+
+from game_session import LEVELS, GameSession, greedy_policy, random_policy
+
+
+def empty_cells(session):
+    return [(row, col)
+            for row in range(session.rows)
+            for col in range(session.cols)
+            if session.board.get(row, col) is None]
+
+
+@pytest.mark.parametrize("level", sorted(LEVELS))
+@pytest.mark.parametrize("policy", [greedy_policy, random_policy])
+def test_board_is_full_after_every_move_but_the_last(level, policy):
+    # После любого хода, кроме последнего, каскад доходит до конца и пустых клеток нет
+    for seed in range(50):
+        session = GameSession(level, seed)
+        rng = random.Random(seed)
+        assert empty_cells(session) == []
+        while not session.game_over:
+            session.shift_tile(*policy(session, rng))
+            if not session.game_over:
+                assert empty_cells(session) == [], (level, seed, session.moves_used)
+
+
+def test_cascade_leaves_no_matches():
+    # Ход, давший очки, заканчивается полем без готовых рядов
+    for seed in range(50):
+        session = GameSession(2, seed)
+        rng = random.Random(seed)
+        while not session.game_over:
+            if session.shift_tile(*greedy_policy(session, rng)) and not session.game_over:
+                assert not session.board.has_matches(session.config["min_match_length"])
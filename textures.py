@@ -0,0 +1,30 @@
+# Общие текстуры плиток и стрелок.
+# Файлы читаются один раз при старте, а спрайты получают готовые объекты Texture
+# и не обращаются ни к диску, ни к кэшу arcade.load_texture.
+from typing import Dict, List, Optional
+
+import arcade
+
+from level_config import TILE_TYPES
+
+ARROW_DIRECTIONS = ["up", "down", "left", "right"]
+
+# Текстуры плиток по номеру цвета и стрелок по направлению
+tile_textures: List[arcade.Texture] = []
+arrow_textures: Dict[str, arcade.Texture] = {}
+
+
+def load_textures(window: Optional[arcade.Window] = None) -> None:
+    # Загрузка всех текстур; повторный вызов файлы уже не читает.
+    # Если передано окно, текстуры сразу кладутся в его общий атлас,
+    # чтобы первая отрисовка уровня не загружала их на видеокарту.
+    if not tile_textures:
+        for name in TILE_TYPES:
+            tile_textures.append(arcade.load_texture(f"resources/sprites/tiles/{name}.png"))
+        for direction in ARROW_DIRECTIONS:
+            arrow_textures[direction] = arcade.load_texture(f"resources/sprites/arrows/{direction}.png")
+
+    if window is not None:
+        atlas = window.ctx.default_atlas
+        for texture in tile_textures + list(arrow_textures.values()):
+            atlas.add(texture)
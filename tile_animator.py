@@ -0,0 +1,146 @@
+# Анимация плиток: позиции, цели и прозрачность всех анимируемых плиток
+# лежат в массивах NumPy и обновляются одним векторным шагом. Шагов за кадр
+# может быть несколько, а в спрайты значения переписываются один раз — sync().
+from typing import Dict, List
+
+import numpy as np
+
+
+class TileAnimator:
+    # Каждая анимируемая плитка занимает слот — строку в массивах.
+    # Слот освобождается, когда плитка и доехала, и (если нужно) растворилась.
+
+    def __init__(self, move_speed: float = 400, fade_speed: float = 300, capacity: int = 64):
+        self.move_speed = move_speed
+        self.fade_speed = fade_speed
+
+        self.sprites: List = []
+        self.slots: Dict = {}
+        self.positions = np.zeros((capacity, 2))
+        self.targets = np.zeros((capacity, 2))
+        self.alphas = np.zeros(capacity)
+        self.moving = np.zeros(capacity, dtype=bool)
+        self.fading = np.zeros(capacity, dtype=bool)
+
+    def __len__(self) -> int:
+        return len(self.sprites)
+
+    def _grow(self) -> None:
+        capacity = len(self.alphas) * 2
+        self.positions = np.resize(self.positions, (capacity, 2))
+        self.targets = np.resize(self.targets, (capacity, 2))
+        self.alphas = np.resize(self.alphas, capacity)
+        self.moving = np.resize(self.moving, capacity)
+        self.fading = np.resize(self.fading, capacity)
+
+    def _slot(self, tile) -> int:
+        slot = self.slots.get(tile)
+        if slot is None:
+            slot = len(self.sprites)
+            if slot == len(self.alphas):
+                self._grow()
+            self.sprites.append(tile)
+            self.slots[tile] = slot
+            self.alphas[slot] = tile.alpha
+            self.moving[slot] = False
+            self.fading[slot] = False
+        return slot
+
+    def move(self, tile, target_x: float, target_y: float) -> None:
+        # Запуск движения плитки к цели. Если плитка уже едет, её позиция
+        # в массиве новее, чем у спрайта, который обновляется только в sync().
+        slot = self._slot(tile)
+        tile.target_x = target_x
+        tile.target_y = target_y
+        tile.animating_move = True
+        if not self.moving[slot]:
+            self.positions[slot] = (tile.center_x, tile.center_y)
+        self.targets[slot] = (target_x, target_y)
+        self.moving[slot] = True
+
+    def fade(self, tile) -> None:
+        # Запуск растворения плитки
+        slot = self._slot(tile)
+        tile.animating_fade = True
+        if not self.fading[slot]:
+            self.alphas[slot] = tile.alpha
+        self.fading[slot] = True
+
+    def remove(self, tile) -> None:
+        # Удаление плитки из анимации: последний слот переезжает на место удалённого
+        slot = self.slots.pop(tile, None)
+        if slot is None:
+            return
+        last = len(self.sprites) - 1
+        if slot != last:
+            moved = self.sprites[last]
+            self.sprites[slot] = moved
+            self.slots[moved] = slot
+            self.positions[slot] = self.positions[last]
+            self.targets[slot] = self.targets[last]
+            self.alphas[slot] = self.alphas[last]
+            self.moving[slot] = self.moving[last]
+            self.fading[slot] = self.fading[last]
+        self.sprites.pop()
+
+    def clear(self) -> None:
+        self.sprites.clear()
+        self.slots.clear()
+
+    def update(self, delta_time: float) -> List:
+        # Один шаг всех анимаций, только в массивах. Возвращает плитки, которые
+        # растворились до конца; доехавшие и растворившиеся плитки получают
+        # итоговые значения сразу, потому что их слот освобождается в этом же шаге.
+        count = len(self.sprites)
+        if not count:
+            return []
+
+        moving = np.flatnonzero(self.moving[:count])
+        if moving.size:
+            delta = self.targets[moving] - self.positions[moving]
+            dist = np.hypot(delta[:, 0], delta[:, 1])
+            arrived = dist < 1.0
+            step = np.minimum(self.move_speed * delta_time, dist)
+            scale = np.where(arrived, 0.0, step / np.where(arrived, 1.0, dist))
+            self.positions[moving] += delta * scale[:, None]
+
+            done = moving[arrived]
+            self.positions[done] = self.targets[done]
+            self.moving[done] = False
+
+            for slot in done.tolist():
+                tile = self.sprites[slot]
+                tile.position = tuple(self.positions[slot].tolist())
+                tile.animating_move = False
+
+        faded = []
+        fading = np.flatnonzero(self.fading[:count])
+        if fading.size:
+            # Прозрачность копится дробной: при мелком шаге int() округлял бы её убыль до нуля
+            alphas = np.maximum(self.alphas[fading] - self.fade_speed * delta_time, 0)
+            self.alphas[fading] = alphas
+            done = fading[alphas <= 0]
+            self.fading[done] = False
+
+            for slot in done.tolist():
+                tile = self.sprites[slot]
+                tile.alpha = 0
+                tile.animating_fade = False
+                faded.append(tile)
+
+        # Освобождаем слоты плиток, у которых больше нет анимаций
+        idle = np.flatnonzero(~(self.moving[:count] | self.fading[:count]))
+        for slot in sorted(idle.tolist(), reverse=True):
+            self.remove(self.sprites[slot])
+
+        return faded
+
+    def sync(self) -> None:
+        # Перенос текущих позиций и прозрачности в спрайты — один раз за кадр
+        count = len(self.sprites)
+        moving = np.flatnonzero(self.moving[:count])
+        for slot, (x, y) in zip(moving.tolist(), self.positions[moving].tolist()):
+            self.sprites[slot].position = (x, y)
+        fading = np.flatnonzero(self.fading[:count])
+        for slot, alpha in zip(fading.tolist(), self.alphas[fading].astype(int).tolist()):
+            self.sprites[slot].alpha = alpha
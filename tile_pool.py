@@ -0,0 +1,36 @@
+# Пул плиток: растворившиеся плитки и плитки прошлой партии
+# возвращаются сюда и переиспользуются вместо создания новых спрайтов.
+# Свободные плитки не удаляются из SpriteList уровня, а только скрываются:
+# SpriteList.remove ищет спрайт линейно, а скрыть и показать плитку — O(1).
+from typing import List
+
+
+class TilePool:
+    def __init__(self, tile_class, sprite_list):
+        # tile_class — класс плитки уровня с конструктором (tile_type, row, col)
+        # и методом reset(tile_type, row, col), который снова делает плитку видимой;
+        # sprite_list — SpriteList, в котором рисуются все плитки уровня
+        self.tile_class = tile_class
+        self.sprite_list = sprite_list
+        self.free: List = []
+
+    def acquire(self, tile_type: int, row: int, col: int):
+        # Свободная плитка с новым цветом и клеткой или новая, если пул пуст
+        if self.free:
+            tile = self.free.pop()
+            tile.reset(tile_type, row, col)
+            return tile
+        tile = self.tile_class(tile_type, row, col)
+        self.sprite_list.append(tile)
+        return tile
+
+    def release(self, tile) -> None:
+        # Плитка остаётся в списке спрайтов, но не видна
+        tile.visible = False
+        self.free.append(tile)
+
+    def release_all(self) -> None:
+        # Все плитки уровня свободны (начало новой партии)
+        self.free = list(self.sprite_list)
+        for tile in self.free:
+            tile.visible = False
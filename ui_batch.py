@@ -0,0 +1,63 @@
+# Неизменяемая часть экрана, собранная заранее: прямоугольники лежат в одном
+# ShapeElementList (один буфер вершин), подписи — в одном пакете pyglet.
+# Экран строит UIBatch, когда меняется его содержимое, а в on_draw только
+# рисует его — без новой раскладки глифов и загрузки вершин каждый кадр.
+import arcade
+import pyglet
+
+# Шрифт по умолчанию тот же, что у arcade.draw_text
+DEFAULT_FONT = ("calibri", "arial")
+
+
+class UIBatch:
+    def __init__(self):
+        self.shapes = arcade.ShapeElementList()
+        self.text_batch = pyglet.graphics.Batch()
+        self.labels = []
+
+    def add_rect(self, left, right, bottom, top, color):
+        self.shapes.append(arcade.create_rectangle_filled(
+            (left + right) / 2, (bottom + top) / 2, right - left, top - bottom, color))
+
+    def add_rect_outline(self, left, right, bottom, top, color, border_width=1):
+        self.shapes.append(arcade.create_rectangle_outline(
+            (left + right) / 2, (bottom + top) / 2, right - left, top - bottom,
+            color, border_width))
+
+    def add_text(self, text, x, y, color, font_size,
+                 anchor_x="left", anchor_y="baseline", bold=False, font_name=DEFAULT_FONT):
+        # Подпись в общем пакете. Возвращает pyglet.text.Label: у неё можно
+        # поменять text или color, и переразметится только она.
+        label = pyglet.text.Label(
+            text,
+            font_name=font_name,
+            font_size=font_size,
+            bold=bold,
+            color=arcade.get_four_byte_color(color),
+            x=x, y=y,
+            anchor_x=anchor_x,
+            anchor_y=anchor_y,
+            batch=self.text_batch,
+        )
+        self.labels.append(label)
+        return label
+
+    def add_button(self, left, right, bottom, top, fill_color, border_color, border_width,
+                   text, text_y, font_size, text_color=arcade.color.WHITE,
+                   bold=True, font_name=DEFAULT_FONT):
+        # Кнопка: фон, рамка и подпись по центру
+        self.add_rect(left, right, bottom, top, fill_color)
+        self.add_rect_outline(left, right, bottom, top, border_color, border_width)
+        return self.add_text(text, (left + right) / 2, text_y, text_color, font_size,
+                             anchor_x="center", anchor_y="center", bold=bold, font_name=font_name)
+
+    def delete(self):
+        # Освобождение вершин подписей, когда экран пересобирается
+        for label in self.labels:
+            label.delete()
+        self.labels = []
+
+    def draw(self):
+        self.shapes.draw()
+        with arcade.get_window().ctx.pyglet_rendering():
+            self.text_batch.draw()